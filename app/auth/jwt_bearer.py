@@ -1,16 +1,15 @@
 from fastapi import Request, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from auth.jwt_handler import verify_token
-from service.user import UserService
-from models import get_db
-from sqlalchemy.orm import Session
+from service.user import AsyncUserService
+from auth.user_validity import user_validity
 from typing import Dict, Any, Optional
 
 class JWTBearer(HTTPBearer):
     def __init__(self, auto_error: bool = True):
         super(JWTBearer, self).__init__(auto_error=auto_error)
     
-    async def __call__(self, request: Request, db: Session = Depends(get_db)):
+    async def __call__(self, request: Request):
         credentials: HTTPAuthorizationCredentials = await super(JWTBearer, self).__call__(request)
         
         if credentials:
@@ -21,11 +20,16 @@ class JWTBearer(HTTPBearer):
             if not payload:
                 raise HTTPException(status_code=403, detail="Invalid token or expired token")
             
-            # 사용자 확인
-            user_service = UserService(db)
-            user = user_service.get_user_by_id(payload["id"])
-            if not user:
+            # 사용자 확인 (최근 확인된 사용자는 DB 조회 생략)
+            user_id = payload["id"]
+            if user_validity.is_deleted(user_id):
                 raise HTTPException(status_code=404, detail="User not found")
+            if not user_validity.is_valid(user_id):
+                user_service = AsyncUserService()
+                user = await user_service.get_user_by_id(user_id)
+                if not user:
+                    raise HTTPException(status_code=404, detail="User not found")
+                user_validity.mark_valid(user_id)
             
             return payload
         else:
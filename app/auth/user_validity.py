@@ -0,0 +1,43 @@
+from config import settings
+from utils.cache import TTLCache, register_cache
+
+
+class UserValidityCache:
+    """
+    인증된 요청의 사용자 존재 여부 캐시
+
+    최근에 존재가 확인된 사용자는 짧은 TTL 동안 DB 조회 없이 통과시키고,
+    삭제된 사용자는 별도 캐시로 관리하여 존재 확인 TTL과 관계없이 즉시 거부합니다.
+    삭제 표시는 토큰 유효 시간이 지나면 필요 없으므로 그만큼만 보관하며,
+    크기 제한으로 밀려나더라도 존재 확인이 DB 조회로 돌아가므로 거부는 유지됩니다.
+    삭제 표시는 프로세스별이므로 다른 워커에서는 최대 TTL만큼 늦게 반영됩니다.
+    """
+
+    def __init__(self, ttl: float, maxsize: int, deleted_ttl: float):
+        self._valid = TTLCache("user_validity", maxsize=maxsize, ttl=ttl)
+        self._deleted = TTLCache("user_deleted", maxsize=maxsize, ttl=deleted_ttl)
+        register_cache(self._valid)
+        register_cache(self._deleted)
+
+    def is_deleted(self, user_id: int) -> bool:
+        return self._deleted.get(user_id) is not None
+
+    def is_valid(self, user_id: int) -> bool:
+        """최근에 존재가 확인된 사용자인지 확인"""
+        return self._valid.get(user_id) is not None
+
+    def mark_valid(self, user_id: int) -> None:
+        self._valid.set(user_id, True)
+
+    def mark_deleted(self, user_id: int) -> None:
+        """삭제된 사용자로 표시 (UserService.delete_user에서 커밋 뒤 호출)"""
+        self._deleted.set(user_id, True)
+        self._valid.invalidate(user_id)
+
+
+# 전역 사용자 유효성 캐시
+user_validity = UserValidityCache(
+    ttl=settings.AUTH_USER_CACHE_TTL,
+    maxsize=settings.USER_CACHE_SIZE,
+    deleted_ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
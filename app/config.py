@@ -17,6 +17,14 @@ class Settings(BaseSettings):
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", "8000"))
     
+    # 프로덕션 서버(gunicorn) 설정
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "0"))  # 워커 프로세스 수 (0이면 CPU 코어 수)
+    WORKER_MAX_REQUESTS: int = int(os.getenv("WORKER_MAX_REQUESTS", "10000"))  # 이만큼 처리한 워커는 정상 종료 후 재시작 (0이면 사용 안 함)
+    WORKER_MAX_REQUESTS_JITTER: int = int(os.getenv("WORKER_MAX_REQUESTS_JITTER", "1000"))  # 워커들이 동시에 재시작하지 않도록 더하는 임의 값
+    WORKER_TIMEOUT: int = int(os.getenv("WORKER_TIMEOUT", "60"))  # 응답 없는 워커를 강제 재시작하기까지의 시간 (초)
+    WORKER_GRACEFUL_TIMEOUT: int = int(os.getenv("WORKER_GRACEFUL_TIMEOUT", "30"))  # 재시작 시 처리 중인 요청을 기다리는 시간 (초)
+    WORKER_KEEPALIVE: int = int(os.getenv("WORKER_KEEPALIVE", "5"))  # keep-alive 연결 유지 시간 (초)
+    
     # CORS 설정
     CORS_ORIGINS: List[Union[str, AnyHttpUrl]] = []
     
@@ -35,18 +43,75 @@ class Settings(BaseSettings):
     DB_PORT: str = os.getenv("DB_PORT", "1521")
     DB_SERVICE: str = os.getenv("DB_SERVICE", "")
     
+    # 연결 풀 설정 (ORM과 직접 쿼리 경로가 공유)
+    DB_POOL_MIN: int = int(os.getenv("DB_POOL_MIN", "2"))
+    DB_POOL_MAX: int = int(os.getenv("DB_POOL_MAX", "10"))
+    DB_POOL_INCREMENT: int = int(os.getenv("DB_POOL_INCREMENT", "1"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # 연결 대기 제한 시간 (초)
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 세션 최대 수명 (초)
+    DB_ASYNC_POOL_MIN: int = int(os.getenv("DB_ASYNC_POOL_MIN", "2"))
+    DB_ASYNC_POOL_MAX: int = int(os.getenv("DB_ASYNC_POOL_MAX", "10"))
+    DB_MAX_SESSIONS: int = int(os.getenv("DB_MAX_SESSIONS", "0"))  # 모든 워커의 풀 최대 크기 합 상한 (0이면 나누지 않음)
+    
+    # 쿼리 실행 설정
+    DB_STMT_CACHE_SIZE: int = int(os.getenv("DB_STMT_CACHE_SIZE", "50"))  # 연결별 문장 캐시 크기
+    DB_FETCH_ARRAYSIZE: int = int(os.getenv("DB_FETCH_ARRAYSIZE", "500"))  # 목록 조회 기본 fetch 크기
+    
+    # 쿼리 계측 설정
+    DB_QUERY_STATS_ENABLED: bool = os.getenv("DB_QUERY_STATS_ENABLED", "True").lower() == "true"  # 문장별 실행 시간 집계
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))  # 이 시간을 넘는 문장은 경고 로그
+    SLOW_QUERY_TOP_N: int = int(os.getenv("SLOW_QUERY_TOP_N", "20"))  # 보관할 가장 느린 문장 수
+    
+    # 트랜잭션 설정
+    UNIT_OF_WORK_ENABLED: bool = os.getenv("UNIT_OF_WORK_ENABLED", "True").lower() == "true"  # 변경 요청의 저장소 호출을 요청 끝에 한 번 커밋
+    
     # 보안 설정
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "")
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    AUTH_USER_CACHE_TTL: float = float(os.getenv("AUTH_USER_CACHE_TTL", "30"))  # 인증 시 사용자 존재 확인 캐시 (초)
+    
+    # 비밀번호 해싱 설정
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))  # python -m utils.password 로 계산
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))  # 해싱 전용 프로세스 수
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))  # 최대 대기 작업 수
     
     # 로깅 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")  # json 또는 text
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))  # 출력 대기 최대 건수 (넘으면 버림)
+    LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "")  # INFO 이하 로그 샘플링 비율 (예: utils.logging_utils=0.1)
+    
+    # 지표 설정
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"  # 요청 지표 수집 및 /metrics 노출
     
     # 파일 업로드 설정
     UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "./uploads")
     MAX_UPLOAD_SIZE: int = int(os.getenv("MAX_UPLOAD_SIZE", "5242880"))  # 5MB 기본값
     
+    # 캐시 설정
+    CACHE_TTL: float = float(os.getenv("CACHE_TTL", "60"))  # 캐시 유효 시간 (초)
+    POST_CACHE_SIZE: int = int(os.getenv("POST_CACHE_SIZE", "10000"))
+    USER_CACHE_SIZE: int = int(os.getenv("USER_CACHE_SIZE", "10000"))
+    CACHE_PRELOAD_POSTS: int = int(os.getenv("CACHE_PRELOAD_POSTS", "0"))  # 시작 시 캐시에 미리 적재할 최신 게시물 수 (0이면 사용 안 함)
+    
+    # 조회수 write-behind 설정
+    VIEW_COUNT_FLUSH_INTERVAL: float = float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "5"))  # 반영 주기 (초)
+    VIEW_COUNT_FLUSH_THRESHOLD: int = int(os.getenv("VIEW_COUNT_FLUSH_THRESHOLD", "1000"))  # 즉시 반영할 대기 건수
+    
+    # 전체 건수 설정
+    COUNT_RECONCILE_INTERVAL: float = float(os.getenv("COUNT_RECONCILE_INTERVAL", "300"))  # DB와 건수를 다시 맞추는 주기 (초)
+    COUNT_TRACKED_POSTS: int = int(os.getenv("COUNT_TRACKED_POSTS", "10000"))  # 댓글/파일 수를 보관할 최근 조회 게시물 수
+    
+    # 검색 설정
+    SEARCH_INDEX_ENABLED: bool = os.getenv("SEARCH_INDEX_ENABLED", "True").lower() == "true"  # 프로세스 내 전문 검색 색인 사용
+    
+    # 일괄 생성 설정
+    BULK_MAX_ITEMS: int = int(os.getenv("BULK_MAX_ITEMS", "1000"))  # 한 요청에서 생성할 수 있는 최대 건수
+    
+    # 응답 직렬화 설정
+    FAST_JSON: bool = os.getenv("FAST_JSON", "False").lower() == "true"  # orjson 응답 + 목록 응답 재검증 생략
+    
     # 기타 설정
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     
@@ -18,7 +18,7 @@ def main():
         
         logger.info("Database tables created successfully!")
     except Exception as e:
-        logger.error(f"Error creating tables: {str(e)}")
+        logger.error("Error creating tables: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+"""
+Gunicorn 설정 (프로덕션 실행)
+
+    gunicorn -c gunicorn_conf.py main:app
+
+Settings 값으로 uvicorn 워커 수, 재시작 주기, 타임아웃을 정하고,
+DB_MAX_SESSIONS가 있으면 모든 워커의 연결 풀 합이 그 안에 들어가도록 워커별 풀 크기를 나눕니다.
+앱은 마스터에서 미리 불러온 뒤(preload) fork하므로 모듈/라우트/스키마 같은 읽기 전용 상태를 워커들이 공유하고,
+연결 풀과 백그라운드 작업은 각 워커의 lifespan에서 따로 만들어집니다.
+"""
+import gc
+import logging
+import multiprocessing
+from config import settings
+from utils.pool import pool_manager
+
+logger = logging.getLogger("gunicorn.error")
+
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = settings.WEB_CONCURRENCY or multiprocessing.cpu_count()
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# 일정 요청 수를 처리한 워커는 처리 중인 요청을 마친 뒤 재시작 (메모리 증가 누적 방지)
+max_requests = settings.WORKER_MAX_REQUESTS
+max_requests_jitter = settings.WORKER_MAX_REQUESTS_JITTER
+timeout = settings.WORKER_TIMEOUT
+graceful_timeout = settings.WORKER_GRACEFUL_TIMEOUT
+keepalive = settings.WORKER_KEEPALIVE
+
+preload_app = True
+loglevel = settings.LOG_LEVEL.lower()
+
+# 풀은 워커의 lifespan에서 만들어지므로 fork 전에 설정값만 조정해 두면 모든 워커에 적용됨
+pool_manager.split_for_workers(workers)
+
+
+def when_ready(server):
+    """앱을 불러온 마스터에서 fork 직전에 실행"""
+    app = server.app.wsgi()
+    app.openapi()  # 스키마를 한 번만 생성하여 워커들이 공유
+    # 지금까지 만든 객체를 GC 추적에서 빼서 워커의 GC가 공유 페이지를 건드려 복사되지 않도록 함
+    gc.freeze()
+    logger.info(
+        "Starting %s workers (pool per worker: sync max=%s, async max=%s, max_requests=%s)",
+        workers, settings.DB_POOL_MAX, settings.DB_ASYNC_POOL_MAX, max_requests
+    )
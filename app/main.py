@@ -1,32 +1,73 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from utils.database import init_db
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.concurrency import run_in_threadpool
+from utils.database import init_db, init_async_db, close_db, close_async_db
+from utils.pool import pool_manager
+from utils.view_counter import view_count_buffer
+from utils.counts import count_provider
+from utils.search import search_index
+from utils.cache import get_cache_stats
+from utils.password import password_hasher
+from utils.warmup import startup_warm_up
+from models import warm_up_engine
+from repository.post import AsyncPostRepository
 from router import user_router, post_router, comment_router, file_router
 import os
 import logging
 from contextlib import asynccontextmanager
 from config import settings
 from utils.error_handlers import setup_error_handlers
+from utils.logging_utils import log_pipeline, parse_sample_rates
+from utils.upload_limit import UploadSizeLimitMiddleware
+from utils.json_response import default_response_class
+from utils.metrics import MetricsMiddleware, metrics_registry, PROMETHEUS_CONTENT_TYPE
+from utils.query_stats import query_stats
+from utils.transaction import UnitOfWorkMiddleware
 
-# 로깅 설정
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# 로깅 설정 (큐 + 백그라운드 리스너, 요청 처리 중에는 출력으로 막히지 않음)
+log_pipeline.configure(
+    level=settings.LOG_LEVEL,
+    fmt=settings.LOG_FORMAT,
+    queue_size=settings.LOG_QUEUE_SIZE,
+    sample_rates=parse_sample_rates(settings.LOG_SAMPLE_RATES),
 )
 logger = logging.getLogger(__name__)
 
+# 시작 시 워밍업 단계 (백그라운드에서 동시에 실행, 모두 끝나야 /health/ready가 200)
+startup_warm_up.add_step("db_pool", lambda: run_in_threadpool(pool_manager.warm_up))  # 최소 연결 수만큼 미리 연결
+startup_warm_up.add_step("db_async_pool", pool_manager.warm_up_async)
+startup_warm_up.add_step("orm_engine", lambda: run_in_threadpool(warm_up_engine))  # 방언 초기화
+startup_warm_up.add_step("password_hasher", password_hasher.warm_up)  # 해싱 프로세스 생성
+if settings.CACHE_PRELOAD_POSTS > 0:
+    startup_warm_up.add_step("post_cache", lambda: AsyncPostRepository.warm_cache(settings.CACHE_PRELOAD_POSTS))
+
 # 시작 및 종료 이벤트 핸들러
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 애플리케이션 시작 시 실행
     logger.info("Application startup")
     init_db()  # 데이터베이스 풀 초기화
+    init_async_db()  # 비동기 데이터베이스 풀 초기화
+    password_hasher.start()  # 비밀번호 해싱 프로세스 풀 시작
+    await startup_warm_up.start()  # 연결/프로세스/캐시 워밍업 (백그라운드)
+    await view_count_buffer.start()  # 조회수 일괄 반영 작업 시작
+    await count_provider.start()  # 전체 건수 주기적 재집계 시작
+    await search_index.start()  # 검색 색인 생성 (백그라운드)
     
     yield  # 애플리케이션 실행 중
     
     # 애플리케이션 종료 시 실행
     logger.info("Application shutdown")
+    await startup_warm_up.stop()
+    await view_count_buffer.stop()  # 남은 조회수 반영
+    await count_provider.stop()
+    await search_index.stop()
+    password_hasher.shutdown()
+    await close_async_db()
+    close_db()
+    log_pipeline.stop()  # 남은 로그 출력
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -34,11 +75,20 @@ app = FastAPI(
     description="FastAPI application with Oracle DB using Repository-Service-Router pattern",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=default_response_class(),
 )
 
 # 에러 핸들러 설정
 setup_error_handlers(app)
 
+# 요청 단위 트랜잭션 (변경 요청 안의 저장소 호출을 응답 직전에 한 번 커밋, 오류 응답이면 롤백)
+if settings.UNIT_OF_WORK_ENABLED:
+    app.add_middleware(UnitOfWorkMiddleware)
+
+# 업로드 크기 제한 (multipart 본문을 끝까지 읽기 전에 거절)
+# CORS보다 먼저 등록해 안쪽에 두어야 413 응답에도 CORS 헤더가 붙어 브라우저가 읽을 수 있음
+app.add_middleware(UploadSizeLimitMiddleware, max_upload_size=settings.MAX_UPLOAD_SIZE)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -48,6 +98,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 지표 수집 (가장 바깥에서 전체 처리 시간 측정)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # 라우터 추가
 app.include_router(user_router.router)
 app.include_router(post_router.router)
@@ -75,6 +129,54 @@ async def health_check():
         "version": "1.0.0"
     }
 
+@app.get("/health/ready", tags=["Health"])
+async def readiness_check():
+    """준비 상태 확인 (시작 워밍업이 끝나기 전에는 503, readiness probe용)"""
+    stats = startup_warm_up.stats()
+    if not stats["ready"]:
+        return JSONResponse(status_code=503, content={"status": "warming_up", **stats})
+    return {"status": "ready", **stats}
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 형식의 요청 지표 (라우트별 응답 시간/상태 코드/응답 크기, 처리 중 요청 수)"""
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+@app.get("/health/db-pool", tags=["Health"])
+async def db_pool_stats():
+    """연결 풀 상태 (busy/idle/대기 시간/타임아웃) 조회"""
+    return pool_manager.get_stats()
+
+@app.get("/health/queries", tags=["Health"])
+async def query_stats_snapshot():
+    """총 실행 시간 상위 SQL과 가장 느린 문장 목록 조회"""
+    return query_stats.snapshot()
+
+@app.get("/health/cache", tags=["Health"])
+async def cache_stats():
+    """엔티티 캐시 적중/미스/제거 통계 조회"""
+    return get_cache_stats()
+
+@app.get("/health/counts", tags=["Health"])
+async def count_stats():
+    """전체 건수 캐시 상태 조회 (마지막 재집계 이후 경과 시간 등)"""
+    return count_provider.stats()
+
+@app.get("/health/search", tags=["Health"])
+async def search_stats():
+    """검색 색인 상태 (색인 완료 여부, 게시물/댓글/단어 수) 조회"""
+    return search_index.stats()
+
+@app.get("/health/logging", tags=["Health"])
+async def logging_stats():
+    """로그 큐 대기 건수, 버린 건수, 샘플링으로 제외된 건수 조회"""
+    return log_pipeline.stats()
+
+@app.get("/health/password-hasher", tags=["Health"])
+async def password_hasher_stats():
+    """비밀번호 해싱 풀 큐 깊이 및 지연 시간 조회"""
+    return password_hasher.stats()
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -82,5 +184,5 @@ if __name__ == "__main__":
     port = settings.PORT if hasattr(settings, "PORT") else 8000
     reload = settings.DEBUG
     
-    logger.info(f"Starting server on {host}:{port} (reload={reload})")
+    logger.info("Starting server on %s:%s (reload=%s)", host, port, reload)
     uvicorn.run("main:app", host=host, port=port, reload=reload)
\ No newline at end of file
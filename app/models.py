@@ -1,23 +1,50 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, create_engine
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Index, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.pool import NullPool
 from datetime import datetime
+import threading
 from config import settings
+from utils.pool import pool_manager
 from typing import Generator
 
-# Oracle 데이터베이스 연결 URL
-DATABASE_URL = f"oracle+oracledb://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_SERVICE}"
+# 세션 팩토리 (엔진은 첫 사용 시 연결됨)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+_engine = None
+_engine_lock = threading.Lock()
 
-# 데이터베이스 엔진 생성
-engine = create_engine(
-    DATABASE_URL, 
-    pool_size=5, 
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,  # 30분마다 연결 갱신
-    echo=settings.DEBUG  # SQL 로깅
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_engine():
+    """
+    데이터베이스 엔진 (첫 사용 시 생성)
+
+    Oracle 방언 로딩 비용이 import 시점에 들지 않도록 지연 생성합니다.
+    연결은 utils.pool의 공유 oracledb 풀에서 가져오며, SQLAlchemy 자체 풀은 사용하지 않음
+    (NullPool: 세션 종료 시 연결이 oracledb 풀로 반환됨)
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(
+                    "oracle+oracledb://",
+                    creator=pool_manager.acquire,
+                    poolclass=NullPool,
+                    echo=settings.DEBUG  # SQL 로깅
+                )
+                SessionLocal.configure(bind=engine)
+                _engine = engine
+    return _engine
+
+def warm_up_engine() -> None:
+    """엔진 생성 및 첫 연결 시 방언 초기화(서버 버전 조회 등)를 미리 실행 (lifespan 워밍업용)"""
+    with get_engine().connect():
+        pass
+
+def __getattr__(name):
+    # 기존 `from models import engine` 사용처 호환
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # 모델의 기본 클래스 생성
 Base = declarative_base()
@@ -55,6 +82,11 @@ class Post(Base):
     # 관계 정의
     author = relationship("User", back_populates="posts")
     comments = relationship("Comment", back_populates="post")
+    
+    # 커서 페이지네이션 (created_at, id) 조회용 인덱스
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+    )
 
 # 댓글 테이블 모델
 class Comment(Base):
@@ -71,6 +103,11 @@ class Comment(Base):
     # 관계 정의
     author = relationship("User", back_populates="comments")
     post = relationship("Post", back_populates="comments")
+    
+    # 게시물별 커서 페이지네이션 (post_id, created_at, id) 조회용 인덱스
+    __table_args__ = (
+        Index("ix_comments_post_created_at_id", "post_id", "created_at", "id"),
+    )
 
 # 파일 테이블 모델
 class File(Base):
@@ -81,15 +118,27 @@ class File(Base):
     file_name = Column(String(260), nullable=False)
     file_path = Column(String(260), nullable=False)
     file_size = Column(Integer, nullable=False)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 (file_blobs 참조)
     created_at = Column(DateTime, default=datetime.now)
     deleted_at = Column(DateTime, nullable=True)
 
+# 내용 해시별 실제 저장 파일 (같은 내용은 한 번만 저장하고 참조 수로 관리)
+class FileBlob(Base):
+    __tablename__ = "file_blobs"
+    
+    content_hash = Column(String(64), primary_key=True)
+    file_path = Column(String(260), nullable=False)
+    file_size = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=1)
+    created_at = Column(DateTime, default=datetime.now)
+
 # 데이터베이스 테이블 생성 함수
 def create_tables():
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 # 데이터베이스 세션 의존성 함수
 def get_db():
+    get_engine()
     db = SessionLocal()
     try:
         yield db
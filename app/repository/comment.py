@@ -1,14 +1,49 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import text
-from utils.database import execute_query, get_connection
-from models import Comment
+from sqlalchemy import text, and_, or_
+from utils.database import (
+    execute_query, execute_query_one, get_connection, row_to_dict, build_update_query,
+    execute_many_returning, execute_query_async, execute_query_one_async, get_async_connection,
+    execute_many_returning_async
+)
+from utils.pagination import CursorParams, keyset_clause
+from utils.counts import count_provider
+from utils.search import search_index
+from utils.transaction import commit, rollback, commit_async, rollback_async, after_commit
+from models import Comment, Post
+
+BULK_INSERT_COMMENT_QUERY = """
+INSERT INTO comments (post_id, user_id, content, created_at, modified_at)
+VALUES (:post_id, :user_id, :content, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+RETURNING id INTO :new_id
+"""
+
+@after_commit
+def _on_comments_created(comments: list) -> None:
+    """생성된 댓글(딕셔너리 또는 ORM 객체)을 건수와 검색 색인에 반영"""
+    for comment in comments:
+        post_id = comment["post_id"] if isinstance(comment, dict) else comment.post_id
+        count_provider.record("comments", 1, post_id)
+        search_index.index_comment(comment)
+
+@after_commit
+def _on_comment_updated(comment) -> None:
+    """수정된 댓글을 검색 색인에 다시 반영 (삭제된 댓글은 제외)"""
+    if comment is not None and getattr(comment, "deleted_at", None) is None:
+        search_index.index_comment(comment)
+
+@after_commit
+def _on_comment_deleted(comment_id: int, post_id: int = None) -> None:
+    count_provider.record("comments", -1, post_id)
+    search_index.remove_comment(comment_id)
 
 class CommentRepository:
     @staticmethod
     def get_comments_by_post_id(post_id: int, db: Session = None):
         """게시물에 달린 댓글 조회"""
         if db:  # ORM 사용
-            return db.query(Comment).filter(
+            return db.query(Comment).join(
+                Post, and_(Post.id == Comment.post_id, Post.deleted_at.is_(None))
+            ).filter(
                 Comment.post_id == post_id,
                 Comment.deleted_at.is_(None)
             ).order_by(Comment.created_at.asc()).all()
@@ -18,12 +53,56 @@ class CommentRepository:
                    u.username as author_name
             FROM comments c
             JOIN users u ON c.user_id = u.id
+            JOIN posts p ON c.post_id = p.id AND p.deleted_at IS NULL
             WHERE c.post_id = :post_id 
             AND c.deleted_at IS NULL
             ORDER BY c.created_at ASC
             """
             return execute_query(query, {"post_id": post_id})
     
+    @staticmethod
+    def get_comments_by_cursor(post_id: int, cursor_params: CursorParams, db: Session = None):
+        """커서(created_at, id) 기반 댓글 조회 (작성순)"""
+        condition, order, params = keyset_clause("c", cursor_params, descending=False)
+        if db:  # ORM 사용
+            query = db.query(Comment).join(
+                Post, and_(Post.id == Comment.post_id, Post.deleted_at.is_(None))
+            ).filter(
+                Comment.post_id == post_id,
+                Comment.deleted_at.is_(None)
+            )
+            if cursor_params.after:
+                created_at, comment_id = cursor_params.after
+                if order == "ASC":
+                    query = query.filter(or_(
+                        Comment.created_at > created_at,
+                        and_(Comment.created_at == created_at, Comment.id > comment_id)
+                    ))
+                else:
+                    query = query.filter(or_(
+                        Comment.created_at < created_at,
+                        and_(Comment.created_at == created_at, Comment.id < comment_id)
+                    ))
+            if order == "ASC":
+                query = query.order_by(Comment.created_at.asc(), Comment.id.asc())
+            else:
+                query = query.order_by(Comment.created_at.desc(), Comment.id.desc())
+            return query.limit(cursor_params.fetch_size).all()
+        else:  # 직접 쿼리 사용
+            query = f"""
+            SELECT c.id, c.post_id, c.user_id, c.content, c.created_at, c.modified_at,
+                   u.username as author_name
+            FROM comments c
+            JOIN users u ON c.user_id = u.id
+            JOIN posts p ON c.post_id = p.id AND p.deleted_at IS NULL
+            WHERE c.post_id = :post_id 
+            AND c.deleted_at IS NULL
+            {condition}
+            ORDER BY c.created_at {order}, c.id {order}
+            FETCH FIRST :limit ROWS ONLY
+            """
+            return execute_query(query, {**params, "post_id": post_id}, arraysize=cursor_params.fetch_size)
+    
     @staticmethod
     def get_comment_by_id(comment_id: int, db: Session = None):
         """ID로 댓글 조회"""
@@ -41,8 +120,7 @@ class CommentRepository:
             WHERE c.id = :comment_id 
             AND c.deleted_at IS NULL
             """
-            result = execute_query(query, {"comment_id": comment_id})
-            return result[0] if result else None
+            return execute_query_one(query, {"comment_id": comment_id})
     
     @staticmethod
     def create_comment(comment_data: dict, db: Session = None):
@@ -50,8 +128,9 @@ class CommentRepository:
         if db:  # ORM 사용
             comment = Comment(**comment_data)
             db.add(comment)
-            db.commit()
+            commit(db)
             db.refresh(comment)
+            _on_comments_created([comment])
             return comment
         else:  # 직접 쿼리 사용
             query = """
@@ -64,18 +143,35 @@ class CommentRepository:
                 try:
                     cursor.execute(query, comment_data)
                     result = cursor.fetchone()
-                    conn.commit()
-                    
-                    # 결과를 딕셔너리로 변환
-                    columns = [col[0] for col in cursor.description]
-                    comment = dict(zip(columns, result))
+                    commit(conn)
+                    comment = row_to_dict(cursor, result)
+                    _on_comments_created([comment])
                     return comment
                 except Exception as e:
-                    conn.rollback()
+                    rollback(conn)
                     raise e
                 finally:
                     cursor.close()
     
+    @staticmethod
+    def create_comments_bulk(comments_data: list, db: Session = None):
+        """댓글 일괄 생성 (한 트랜잭션, 생성된 id 목록 반환)"""
+        if db:  # ORM 사용
+            comments = [Comment(**comment_data) for comment_data in comments_data]
+            try:
+                db.add_all(comments)
+                # 커밋하면 객체가 만료되어 id를 읽을 때 행마다 SELECT가 생기므로 flush 직후 id를 모음
+                db.flush()
+                ids = [comment.id for comment in comments]
+                commit(db)
+            except Exception:
+                rollback(db)
+                raise
+        else:  # 직접 쿼리 사용 (배열 바인딩 한 번으로 실행)
+            ids = execute_many_returning(BULK_INSERT_COMMENT_QUERY, comments_data)
+        _on_comments_created([{**comment_data, "id": comment_id} for comment_id, comment_data in zip(ids, comments_data)])
+        return ids
+    
     @staticmethod
     def update_comment(comment_id: int, comment_data: dict, db: Session = None):
         """댓글 수정"""
@@ -84,8 +180,10 @@ class CommentRepository:
                 **comment_data,
                 "modified_at": text("CURRENT_TIMESTAMP")
             })
-            db.commit()
-            return db.query(Comment).filter(Comment.id == comment_id).first()
+            commit(db)
+            comment = db.query(Comment).filter(Comment.id == comment_id).first()
+            _on_comment_updated(comment)
+            return comment
         else:  # 직접 쿼리 사용
             query = """
             UPDATE comments
@@ -96,17 +194,18 @@ class CommentRepository:
             execute_query(query, params, fetch=False)
             
             # 업데이트된 댓글 정보 조회
-            return CommentRepository.get_comment_by_id(comment_id)
+            comment = CommentRepository.get_comment_by_id(comment_id)
+            _on_comment_updated(comment)
+            return comment
     
     @staticmethod
-    def delete_comment(comment_id: int, db: Session = None):
-        """댓글 삭제 (soft delete)"""
+    def delete_comment(comment_id: int, db: Session = None, post_id: int = None):
+        """댓글 삭제 (soft delete, post_id를 주면 게시물별 댓글 수도 갱신)"""
         if db:  # ORM 사용
-            db.query(Comment).filter(Comment.id == comment_id).update({
+            result = db.query(Comment).filter(Comment.id == comment_id, Comment.deleted_at.is_(None)).update({
                 "deleted_at": text("CURRENT_TIMESTAMP")
-            })
-            db.commit()
-            return True
+            }, synchronize_session=False)
+            commit(db)
         else:  # 직접 쿼리 사용
             query = """
             UPDATE comments
@@ -114,4 +213,114 @@ class CommentRepository:
             WHERE id = :comment_id AND deleted_at IS NULL
             """
             result = execute_query(query, {"comment_id": comment_id}, fetch=False)
-            return result > 0
\ No newline at end of file
+        if result:
+            _on_comment_deleted(comment_id, post_id)
+        return result > 0
+
+class AsyncCommentRepository:
+    """CommentRepository의 비동기 버전 (직접 쿼리 전용)"""
+
+    @staticmethod
+    async def get_comments_by_post_id(post_id: int):
+        """게시물에 달린 댓글 조회"""
+        query = """
+        SELECT c.id, c.post_id, c.user_id, c.content, c.created_at, c.modified_at,
+               u.username as author_name
+        FROM comments c
+        JOIN users u ON c.user_id = u.id
+        JOIN posts p ON c.post_id = p.id AND p.deleted_at IS NULL
+        WHERE c.post_id = :post_id 
+        AND c.deleted_at IS NULL
+        ORDER BY c.created_at ASC
+        """
+        return await execute_query_async(query, {"post_id": post_id})
+
+    @staticmethod
+    async def get_comments_by_cursor(post_id: int, cursor_params: CursorParams):
+        """커서(created_at, id) 기반 댓글 조회 (작성순)"""
+        condition, order, params = keyset_clause("c", cursor_params, descending=False)
+        query = f"""
+        SELECT c.id, c.post_id, c.user_id, c.content, c.created_at, c.modified_at,
+               u.username as author_name
+        FROM comments c
+        JOIN users u ON c.user_id = u.id
+        JOIN posts p ON c.post_id = p.id AND p.deleted_at IS NULL
+        WHERE c.post_id = :post_id 
+        AND c.deleted_at IS NULL
+        {condition}
+        ORDER BY c.created_at {order}, c.id {order}
+        FETCH FIRST :limit ROWS ONLY
+        """
+        return await execute_query_async(query, {**params, "post_id": post_id}, arraysize=cursor_params.fetch_size)
+
+    @staticmethod
+    async def get_comment_by_id(comment_id: int):
+        """ID로 댓글 조회"""
+        query = """
+        SELECT c.id, c.post_id, c.user_id, c.content, c.created_at, c.modified_at,
+               u.username as author_name
+        FROM comments c
+        JOIN users u ON c.user_id = u.id
+        WHERE c.id = :comment_id 
+        AND c.deleted_at IS NULL
+        """
+        return await execute_query_one_async(query, {"comment_id": comment_id})
+
+    @staticmethod
+    async def create_comment(comment_data: dict):
+        """댓글 생성"""
+        query = """
+        INSERT INTO comments (post_id, user_id, content, created_at, modified_at)
+        VALUES (:post_id, :user_id, :content, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        RETURNING id, post_id, user_id, content, created_at, modified_at
+        """
+        async with get_async_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                await cursor.execute(query, comment_data)
+                result = await cursor.fetchone()
+                await commit_async(conn)
+                comment = row_to_dict(cursor, result)
+                _on_comments_created([comment])
+                return comment
+            except Exception as e:
+                await rollback_async(conn)
+                raise e
+            finally:
+                cursor.close()
+
+    @staticmethod
+    async def create_comments_bulk(comments_data: list):
+        """댓글 일괄 생성 (한 트랜잭션, 생성된 id 목록 반환)"""
+        ids = await execute_many_returning_async(BULK_INSERT_COMMENT_QUERY, comments_data)
+        _on_comments_created([{**comment_data, "id": comment_id} for comment_id, comment_data in zip(ids, comments_data)])
+        return ids
+
+    @staticmethod
+    async def update_comment(comment_id: int, comment_data: dict):
+        """댓글 수정"""
+        query = """
+        UPDATE comments
+        SET content = :content, modified_at = CURRENT_TIMESTAMP
+        WHERE id = :comment_id AND deleted_at IS NULL
+        """
+        params = {"content": comment_data["content"], "comment_id": comment_id}
+        await execute_query_async(query, params, fetch=False)
+
+        # 업데이트된 댓글 정보 조회
+        comment = await AsyncCommentRepository.get_comment_by_id(comment_id)
+        _on_comment_updated(comment)
+        return comment
+
+    @staticmethod
+    async def delete_comment(comment_id: int, post_id: int = None):
+        """댓글 삭제 (soft delete, post_id를 주면 게시물별 댓글 수도 갱신)"""
+        query = """
+        UPDATE comments
+        SET deleted_at = CURRENT_TIMESTAMP
+        WHERE id = :comment_id AND deleted_at IS NULL
+        """
+        result = await execute_query_async(query, {"comment_id": comment_id}, fetch=False)
+        if result:
+            _on_comment_deleted(comment_id, post_id)
+        return result > 0
@@ -1,7 +1,83 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import text
-from utils.database import execute_query, get_connection
-from models import Post
+from sqlalchemy import text, and_, or_, func
+from utils.database import (
+    execute_query, execute_query_one, get_connection, row_to_dict, build_update_query,
+    execute_many_returning, execute_query_async, execute_query_one_async, get_async_connection,
+    execute_many_returning_async, in_clause
+)
+from utils.pagination import CursorParams, keyset_clause
+from utils.cache import post_cache
+from utils.counts import count_provider
+from utils.search import search_index
+from utils.transaction import commit, rollback, commit_async, rollback_async, after_commit, on_commit, in_transaction
+from models import Post, Comment, File
+
+BULK_INSERT_POST_QUERY = """
+INSERT INTO posts (user_id, title, content, view_count, created_at, modified_at)
+VALUES (:user_id, :title, :content, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+RETURNING id INTO :new_id
+"""
+
+def _post_ids_query(post_ids: list):
+    """게시물 id 목록 조회용 IN 절 쿼리와 바인드 변수 생성"""
+    placeholders, binds = in_clause(post_ids)
+    query = f"""
+    SELECT id FROM posts
+    WHERE id IN ({placeholders}) AND deleted_at IS NULL
+    """
+    return query, binds
+
+def _post_counts_query(post_ids: list):
+    """게시물별 댓글/첨부 파일 수를 한 번에 집계하는 쿼리와 바인드 변수 생성"""
+    placeholders, binds = in_clause(post_ids)
+    query = f"""
+    SELECT post_id, SUM(comment_count) AS comment_count, SUM(file_count) AS file_count
+    FROM (
+        SELECT post_id, COUNT(*) AS comment_count, 0 AS file_count
+        FROM comments
+        WHERE post_id IN ({placeholders}) AND deleted_at IS NULL
+        GROUP BY post_id
+        UNION ALL
+        SELECT post_id, 0 AS comment_count, COUNT(*) AS file_count
+        FROM files
+        WHERE post_id IN ({placeholders}) AND deleted_at IS NULL
+        GROUP BY post_id
+    )
+    GROUP BY post_id
+    """
+    return query, binds
+
+def _counts_by_post(rows) -> dict:
+    return {
+        row["post_id"]: {"comment_count": int(row["comment_count"]), "file_count": int(row["file_count"])}
+        for row in rows
+    }
+
+@after_commit
+def _on_posts_created(posts: list) -> None:
+    """생성된 게시물(딕셔너리 또는 ORM 객체)을 건수와 검색 색인에 반영"""
+    count_provider.record("posts", len(posts))
+    for post in posts:
+        search_index.index_post(post)
+
+@after_commit
+def _on_post_deleted(post_id: int) -> None:
+    post_cache.invalidate(post_id)
+    count_provider.record("posts", -1)
+    count_provider.forget_post(post_id)
+    search_index.remove_post(post_id)
+
+@after_commit
+def _on_post_updated(post) -> None:
+    """수정된 게시물을 검색 색인에 다시 반영 (삭제된 게시물은 제외)"""
+    if post is not None and getattr(post, "deleted_at", None) is None:
+        search_index.index_post(post)
+
+def _invalidate_post(post_id: int) -> None:
+    """게시물 캐시 무효화 (작업 단위 안이면 그 사이 다시 캐시된 이전 값을 커밋 뒤에 한 번 더 무효화)"""
+    post_cache.invalidate(post_id)
+    if in_transaction():
+        on_commit(lambda: post_cache.invalidate(post_id))
 
 class PostRepository:
     @staticmethod
@@ -21,14 +97,53 @@ class PostRepository:
             ORDER BY p.created_at DESC
             OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY
             """
-            return execute_query(query, {"limit": limit, "offset": offset})
+            return execute_query(query, {"limit": limit, "offset": offset}, arraysize=limit)
+    
+    @staticmethod
+    def get_posts_by_cursor(cursor_params: CursorParams, db: Session = None):
+        """커서(created_at, id) 기반 게시물 조회 (최신순)"""
+        condition, order, params = keyset_clause("p", cursor_params, descending=True)
+        if db:  # ORM 사용
+            query = db.query(Post).filter(Post.deleted_at.is_(None))
+            if cursor_params.after:
+                created_at, post_id = cursor_params.after
+                if order == "ASC":
+                    query = query.filter(or_(
+                        Post.created_at > created_at,
+                        and_(Post.created_at == created_at, Post.id > post_id)
+                    ))
+                else:
+                    query = query.filter(or_(
+                        Post.created_at < created_at,
+                        and_(Post.created_at == created_at, Post.id < post_id)
+                    ))
+            if order == "ASC":
+                query = query.order_by(Post.created_at.asc(), Post.id.asc())
+            else:
+                query = query.order_by(Post.created_at.desc(), Post.id.desc())
+            return query.limit(cursor_params.fetch_size).all()
+        else:  # 직접 쿼리 사용
+            query = f"""
+            SELECT p.id, p.user_id, p.title, p.content, p.view_count, 
+                   p.created_at, p.modified_at, u.username as author_name
+            FROM posts p
+            JOIN users u ON p.user_id = u.id
+            WHERE p.deleted_at IS NULL
+            {condition}
+            ORDER BY p.created_at {order}, p.id {order}
+            FETCH FIRST :limit ROWS ONLY
+            """
+            return execute_query(query, params, arraysize=cursor_params.fetch_size)
     
     @staticmethod
     def get_post_by_id(post_id: int, db: Session = None):
         """ID로 게시물 조회"""
         if db:  # ORM 사용
             return db.query(Post).filter(Post.id == post_id, Post.deleted_at.is_(None)).first()
-        else:  # 직접 쿼리 사용
+        else:  # 직접 쿼리 사용 (캐시 우선 조회)
+            cached = post_cache.get(post_id)
+            if cached is not None:
+                return cached
             query = """
             SELECT p.id, p.user_id, p.title, p.content, p.view_count, 
                    p.created_at, p.modified_at, u.username as author_name
@@ -36,8 +151,10 @@ class PostRepository:
             JOIN users u ON p.user_id = u.id
             WHERE p.id = :post_id AND p.deleted_at IS NULL
             """
-            result = execute_query(query, {"post_id": post_id})
-            return result[0] if result else None
+            post = execute_query_one(query, {"post_id": post_id})
+            if post and not in_transaction():  # 커밋 전 데이터는 캐시하지 않음
+                post_cache.set(post_id, post)
+            return post
     
     @staticmethod
     def create_post(post_data: dict, db: Session = None):
@@ -45,8 +162,9 @@ class PostRepository:
         if db:  # ORM 사용
             post = Post(**post_data)
             db.add(post)
-            db.commit()
+            commit(db)
             db.refresh(post)
+            _on_posts_created([post])
             return post
         else:  # 직접 쿼리 사용
             query = """
@@ -59,18 +177,71 @@ class PostRepository:
                 try:
                     cursor.execute(query, post_data)
                     result = cursor.fetchone()
-                    conn.commit()
-                    
-                    # 결과를 딕셔너리로 변환
-                    columns = [col[0] for col in cursor.description]
-                    post = dict(zip(columns, result))
+                    commit(conn)
+                    post = row_to_dict(cursor, result)
+                    _on_posts_created([post])
                     return post
                 except Exception as e:
-                    conn.rollback()
+                    rollback(conn)
                     raise e
                 finally:
                     cursor.close()
     
+    @staticmethod
+    def create_posts_bulk(posts_data: list, db: Session = None):
+        """게시물 일괄 생성 (한 트랜잭션, 생성된 id 목록 반환)"""
+        if db:  # ORM 사용
+            posts = [Post(**post_data) for post_data in posts_data]
+            try:
+                db.add_all(posts)
+                # 커밋하면 객체가 만료되어 id를 읽을 때 행마다 SELECT가 생기므로 flush 직후 id를 모음
+                db.flush()
+                ids = [post.id for post in posts]
+                commit(db)
+            except Exception:
+                rollback(db)
+                raise
+        else:  # 직접 쿼리 사용 (배열 바인딩 한 번으로 실행)
+            ids = execute_many_returning(BULK_INSERT_POST_QUERY, posts_data)
+        _on_posts_created([{**post_data, "id": post_id} for post_id, post_data in zip(ids, posts_data)])
+        return ids
+    
+    @staticmethod
+    def get_existing_post_ids(post_ids: list, db: Session = None):
+        """주어진 id 중 삭제되지 않은 게시물 id 집합"""
+        if not post_ids:
+            return set()
+        if db:  # ORM 사용
+            rows = db.query(Post.id).filter(Post.id.in_(post_ids), Post.deleted_at.is_(None)).all()
+            return {row.id for row in rows}
+        else:  # 직접 쿼리 사용
+            query, params = _post_ids_query(post_ids)
+            return {row["id"] for row in execute_query(query, params, arraysize=len(post_ids))}
+    
+    @staticmethod
+    def get_post_counts(post_ids: list, db: Session = None):
+        """게시물별 댓글/첨부 파일 수 ({post_id: {"comment_count", "file_count"}}, 페이지당 고정 쿼리 수)"""
+        if not post_ids:
+            return {}
+        if db:  # ORM 사용 (댓글/파일 각각 GROUP BY 한 번씩)
+            counts = {post_id: {"comment_count": 0, "file_count": 0} for post_id in post_ids}
+            comment_rows = db.query(Comment.post_id, func.count(Comment.id)).filter(
+                Comment.post_id.in_(post_ids),
+                Comment.deleted_at.is_(None)
+            ).group_by(Comment.post_id).all()
+            file_rows = db.query(File.post_id, func.count(File.id)).filter(
+                File.post_id.in_(post_ids),
+                File.deleted_at.is_(None)
+            ).group_by(File.post_id).all()
+            for post_id, count in comment_rows:
+                counts[post_id]["comment_count"] = count
+            for post_id, count in file_rows:
+                counts[post_id]["file_count"] = count
+            return counts
+        else:  # 직접 쿼리 사용
+            query, params = _post_counts_query(post_ids)
+            return _counts_by_post(execute_query(query, params, arraysize=len(post_ids)))
+    
     @staticmethod
     def update_post(post_id: int, post_data: dict, db: Session = None):
         """게시물 수정"""
@@ -79,30 +250,31 @@ class PostRepository:
                 **post_data,
                 "modified_at": text("CURRENT_TIMESTAMP")
             })
-            db.commit()
-            return db.query(Post).filter(Post.id == post_id).first()
+            commit(db)
+            _invalidate_post(post_id)
+            post = db.query(Post).filter(Post.id == post_id).first()
+            _on_post_updated(post)
+            return post
         else:  # 직접 쿼리 사용
-            set_clause = ", ".join([f"{key} = :{key}" for key in post_data.keys()])
-            query = f"""
-            UPDATE posts
-            SET {set_clause}, modified_at = CURRENT_TIMESTAMP
-            WHERE id = :post_id AND deleted_at IS NULL
-            """
+            # 컬럼 집합별로 캐시된 SQL 텍스트 사용 (문장 캐시 재사용)
+            query = build_update_query("posts", post_data, "post_id")
             params = {**post_data, "post_id": post_id}
             execute_query(query, params, fetch=False)
+            _invalidate_post(post_id)
             
             # 업데이트된 게시물 정보 조회
-            return PostRepository.get_post_by_id(post_id)
+            post = PostRepository.get_post_by_id(post_id)
+            _on_post_updated(post)
+            return post
     
     @staticmethod
     def delete_post(post_id: int, db: Session = None):
         """게시물 삭제 (soft delete)"""
         if db:  # ORM 사용
-            db.query(Post).filter(Post.id == post_id).update({
+            result = db.query(Post).filter(Post.id == post_id, Post.deleted_at.is_(None)).update({
                 "deleted_at": text("CURRENT_TIMESTAMP")
-            })
-            db.commit()
-            return True
+            }, synchronize_session=False)
+            commit(db)
         else:  # 직접 쿼리 사용
             query = """
             UPDATE posts
@@ -110,21 +282,187 @@ class PostRepository:
             WHERE id = :post_id AND deleted_at IS NULL
             """
             result = execute_query(query, {"post_id": post_id}, fetch=False)
-            return result > 0
+        _invalidate_post(post_id)
+        if result:
+            _on_post_deleted(post_id)
+        return result > 0
     
     @staticmethod
     def increment_view_count(post_id: int, db: Session = None):
         """조회수 증가"""
-        if db:  # ORM 사용
-            post = db.query(Post).filter(Post.id == post_id).first()
-            if post:
-                post.view_count += 1
-                db.commit()
-            return post
+        if db:  # ORM 사용 (SELECT 없이 UPDATE 한 번으로 처리)
+            result = db.query(Post).filter(Post.id == post_id, Post.deleted_at.is_(None)).update(
+                {Post.view_count: Post.view_count + 1}, synchronize_session=False
+            )
+            commit(db)
+            _invalidate_post(post_id)
+            return result
         else:  # 직접 쿼리 사용
             query = """
             UPDATE posts
             SET view_count = view_count + 1
             WHERE id = :post_id AND deleted_at IS NULL
             """
-            return execute_query(query, {"post_id": post_id}, fetch=False)
\ No newline at end of file
+            result = execute_query(query, {"post_id": post_id}, fetch=False)
+            _invalidate_post(post_id)
+            return result
+
+class AsyncPostRepository:
+    """PostRepository의 비동기 버전 (직접 쿼리 전용)"""
+
+    @staticmethod
+    async def get_all_posts(limit: int = 100, offset: int = 0):
+        """모든 게시물 조회"""
+        query = """
+        SELECT p.id, p.user_id, p.title, p.content, p.view_count, 
+               p.created_at, p.modified_at, u.username as author_name
+        FROM posts p
+        JOIN users u ON p.user_id = u.id
+        WHERE p.deleted_at IS NULL
+        ORDER BY p.created_at DESC
+        OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY
+        """
+        return await execute_query_async(query, {"limit": limit, "offset": offset}, arraysize=limit)
+
+    @staticmethod
+    async def warm_cache(limit: int) -> int:
+        """최신 게시물 limit개를 캐시에 미리 적재 (lifespan 워밍업용)"""
+        posts = await AsyncPostRepository.get_all_posts(limit=limit)
+        for post in posts:
+            post_cache.set(post["id"], post)
+        return len(posts)
+
+    @staticmethod
+    async def get_posts_by_cursor(cursor_params: CursorParams):
+        """커서(created_at, id) 기반 게시물 조회 (최신순)"""
+        condition, order, params = keyset_clause("p", cursor_params, descending=True)
+        query = f"""
+        SELECT p.id, p.user_id, p.title, p.content, p.view_count, 
+               p.created_at, p.modified_at, u.username as author_name
+        FROM posts p
+        JOIN users u ON p.user_id = u.id
+        WHERE p.deleted_at IS NULL
+        {condition}
+        ORDER BY p.created_at {order}, p.id {order}
+        FETCH FIRST :limit ROWS ONLY
+        """
+        return await execute_query_async(query, params, arraysize=cursor_params.fetch_size)
+
+    @staticmethod
+    async def get_post_by_id(post_id: int):
+        """ID로 게시물 조회 (캐시 우선 조회)"""
+        cached = post_cache.get(post_id)
+        if cached is not None:
+            return cached
+        query = """
+        SELECT p.id, p.user_id, p.title, p.content, p.view_count, 
+               p.created_at, p.modified_at, u.username as author_name
+        FROM posts p
+        JOIN users u ON p.user_id = u.id
+        WHERE p.id = :post_id AND p.deleted_at IS NULL
+        """
+        post = await execute_query_one_async(query, {"post_id": post_id})
+        if post and not in_transaction():  # 커밋 전 데이터는 캐시하지 않음
+            post_cache.set(post_id, post)
+        return post
+
+    @staticmethod
+    async def create_post(post_data: dict):
+        """게시물 생성"""
+        query = """
+        INSERT INTO posts (user_id, title, content, view_count, created_at, modified_at)
+        VALUES (:user_id, :title, :content, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        RETURNING id, user_id, title, content, view_count, created_at, modified_at
+        """
+        async with get_async_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                await cursor.execute(query, post_data)
+                result = await cursor.fetchone()
+                await commit_async(conn)
+                post = row_to_dict(cursor, result)
+                _on_posts_created([post])
+                return post
+            except Exception as e:
+                await rollback_async(conn)
+                raise e
+            finally:
+                cursor.close()
+
+    @staticmethod
+    async def create_posts_bulk(posts_data: list):
+        """게시물 일괄 생성 (한 트랜잭션, 생성된 id 목록 반환)"""
+        ids = await execute_many_returning_async(BULK_INSERT_POST_QUERY, posts_data)
+        _on_posts_created([{**post_data, "id": post_id} for post_id, post_data in zip(ids, posts_data)])
+        return ids
+
+    @staticmethod
+    async def get_existing_post_ids(post_ids: list):
+        """주어진 id 중 삭제되지 않은 게시물 id 집합"""
+        if not post_ids:
+            return set()
+        query, params = _post_ids_query(post_ids)
+        return {row["id"] for row in await execute_query_async(query, params, arraysize=len(post_ids))}
+
+    @staticmethod
+    async def get_posts_by_ids(post_ids: list):
+        """id 목록으로 삭제되지 않은 게시물 조회 (순서는 보장하지 않음)"""
+        if not post_ids:
+            return []
+        placeholders, params = in_clause(post_ids)
+        query = f"""
+        SELECT p.id, p.user_id, p.title, p.content, p.view_count,
+               p.created_at, p.modified_at, u.username as author_name
+        FROM posts p
+        JOIN users u ON p.user_id = u.id
+        WHERE p.id IN ({placeholders}) AND p.deleted_at IS NULL
+        """
+        return await execute_query_async(query, params, arraysize=len(post_ids))
+
+    @staticmethod
+    async def get_post_counts(post_ids: list):
+        """게시물별 댓글/첨부 파일 수 ({post_id: {"comment_count", "file_count"}})"""
+        if not post_ids:
+            return {}
+        query, params = _post_counts_query(post_ids)
+        return _counts_by_post(await execute_query_async(query, params, arraysize=len(post_ids)))
+
+    @staticmethod
+    async def update_post(post_id: int, post_data: dict):
+        """게시물 수정"""
+        # 컬럼 집합별로 캐시된 SQL 텍스트 사용 (문장 캐시 재사용)
+        query = build_update_query("posts", post_data, "post_id")
+        params = {**post_data, "post_id": post_id}
+        await execute_query_async(query, params, fetch=False)
+        _invalidate_post(post_id)
+
+        # 업데이트된 게시물 정보 조회
+        post = await AsyncPostRepository.get_post_by_id(post_id)
+        _on_post_updated(post)
+        return post
+
+    @staticmethod
+    async def delete_post(post_id: int):
+        """게시물 삭제 (soft delete)"""
+        query = """
+        UPDATE posts
+        SET deleted_at = CURRENT_TIMESTAMP
+        WHERE id = :post_id AND deleted_at IS NULL
+        """
+        result = await execute_query_async(query, {"post_id": post_id}, fetch=False)
+        _invalidate_post(post_id)
+        if result:
+            _on_post_deleted(post_id)
+        return result > 0
+
+    @staticmethod
+    async def increment_view_count(post_id: int):
+        """조회수 증가"""
+        query = """
+        UPDATE posts
+        SET view_count = view_count + 1
+        WHERE id = :post_id AND deleted_at IS NULL
+        """
+        result = await execute_query_async(query, {"post_id": post_id}, fetch=False)
+        _invalidate_post(post_id)
+        return result
@@ -1,9 +1,31 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from utils.database import execute_query, get_connection
+from utils.database import (
+    execute_query, execute_query_one, get_connection, row_to_dict, build_update_query,
+    execute_query_async, execute_query_one_async, get_async_connection
+)
+from utils.cache import user_cache, post_cache
+from utils.transaction import commit, rollback, commit_async, rollback_async, on_commit, in_transaction
 from models import User
 
+def _invalidate_user(user_id: int, username_changed: bool) -> None:
+    user_cache.invalidate(user_id)
+    if username_changed:
+        post_cache.clear()
+
 class UserRepository:
+    @staticmethod
+    def invalidate_cache(user_id: int, user_data: dict = None):
+        """
+        사용자 캐시 무효화 (사용자명이 바뀌면 작성자명을 포함한 게시물 캐시와 목록 버전도 무효화)
+
+        작업 단위 안이면 커밋 뒤에 한 번 더 무효화합니다 (그 사이 다른 요청이 이전 값을 다시 캐시할 수 있음).
+        """
+        username_changed = bool(user_data and "username" in user_data)
+        _invalidate_user(user_id, username_changed)
+        if in_transaction():
+            on_commit(lambda: _invalidate_user(user_id, username_changed))
+    
     @staticmethod
     def get_all_users(db: Session = None):
         """모든 사용자 조회"""
@@ -22,14 +44,19 @@ class UserRepository:
         """ID로 사용자 조회"""
         if db:  # ORM 사용
             return db.query(User).filter(User.id == user_id, User.deleted_at.is_(None)).first()
-        else:  # 직접 쿼리 사용
+        else:  # 직접 쿼리 사용 (캐시 우선 조회)
+            cached = user_cache.get(user_id)
+            if cached is not None:
+                return cached
             query = """
             SELECT id, username, email, role, created_at, modified_at
             FROM users
             WHERE id = :user_id AND deleted_at IS NULL
             """
-            result = execute_query(query, {"user_id": user_id})
-            return result[0] if result else None
+            user = execute_query_one(query, {"user_id": user_id})
+            if user and not in_transaction():  # 커밋 전 데이터는 캐시하지 않음
+                user_cache.set(user_id, user)
+            return user
     
     @staticmethod
     def get_user_by_username(username: str, db: Session = None):
@@ -42,8 +69,7 @@ class UserRepository:
             FROM users
             WHERE username = :username AND deleted_at IS NULL
             """
-            result = execute_query(query, {"username": username})
-            return result[0] if result else None
+            return execute_query_one(query, {"username": username})
     
     @staticmethod
     def create_user(user_data: dict, db: Session = None):
@@ -51,7 +77,7 @@ class UserRepository:
         if db:  # ORM 사용
             user = User(**user_data)
             db.add(user)
-            db.commit()
+            commit(db)
             db.refresh(user)
             return user
         else:  # 직접 쿼리 사용
@@ -65,14 +91,12 @@ class UserRepository:
                 try:
                     cursor.execute(query, user_data)
                     result = cursor.fetchone()
-                    conn.commit()
+                    commit(conn)
                     
                     # 결과를 딕셔너리로 변환
-                    columns = [col[0] for col in cursor.description]
-                    user = dict(zip(columns, result))
-                    return user
+                    return row_to_dict(cursor, result)
                 except Exception as e:
-                    conn.rollback()
+                    rollback(conn)
                     raise e
                 finally:
                     cursor.close()
@@ -85,17 +109,15 @@ class UserRepository:
                 **user_data,
                 "modified_at": text("CURRENT_TIMESTAMP")
             })
-            db.commit()
+            commit(db)
+            UserRepository.invalidate_cache(user_id, user_data)
             return db.query(User).filter(User.id == user_id).first()
         else:  # 직접 쿼리 사용
-            set_clause = ", ".join([f"{key} = :{key}" for key in user_data.keys()])
-            query = f"""
-            UPDATE users
-            SET {set_clause}, modified_at = CURRENT_TIMESTAMP
-            WHERE id = :user_id AND deleted_at IS NULL
-            """
+            # 컬럼 집합별로 캐시된 SQL 텍스트 사용 (문장 캐시 재사용)
+            query = build_update_query("users", user_data, "user_id")
             params = {**user_data, "user_id": user_id}
             execute_query(query, params, fetch=False)
+            UserRepository.invalidate_cache(user_id, user_data)
             
             # 업데이트된 사용자 정보 조회
             return UserRepository.get_user_by_id(user_id)
@@ -107,7 +129,8 @@ class UserRepository:
             db.query(User).filter(User.id == user_id).update({
                 "deleted_at": text("CURRENT_TIMESTAMP")
             })
-            db.commit()
+            commit(db)
+            UserRepository.invalidate_cache(user_id)
             return True
         else:  # 직접 쿼리 사용
             query = """
@@ -116,4 +139,91 @@ class UserRepository:
             WHERE id = :user_id AND deleted_at IS NULL
             """
             result = execute_query(query, {"user_id": user_id}, fetch=False)
-            return result > 0
\ No newline at end of file
+            UserRepository.invalidate_cache(user_id)
+            return result > 0
+
+class AsyncUserRepository:
+    """UserRepository의 비동기 버전 (직접 쿼리 전용)"""
+
+    @staticmethod
+    async def get_all_users():
+        """모든 사용자 조회"""
+        query = """
+        SELECT id, username, email, role, created_at, modified_at
+        FROM users
+        WHERE deleted_at IS NULL
+        """
+        return await execute_query_async(query)
+
+    @staticmethod
+    async def get_user_by_id(user_id: int):
+        """ID로 사용자 조회 (캐시 우선 조회)"""
+        cached = user_cache.get(user_id)
+        if cached is not None:
+            return cached
+        query = """
+        SELECT id, username, email, role, created_at, modified_at
+        FROM users
+        WHERE id = :user_id AND deleted_at IS NULL
+        """
+        user = await execute_query_one_async(query, {"user_id": user_id})
+        if user and not in_transaction():  # 커밋 전 데이터는 캐시하지 않음
+            user_cache.set(user_id, user)
+        return user
+
+    @staticmethod
+    async def get_user_by_username(username: str):
+        """사용자명으로 사용자 조회"""
+        query = """
+        SELECT id, username, email, role, created_at, modified_at, password
+        FROM users
+        WHERE username = :username AND deleted_at IS NULL
+        """
+        return await execute_query_one_async(query, {"username": username})
+
+    @staticmethod
+    async def create_user(user_data: dict):
+        """사용자 생성"""
+        query = """
+        INSERT INTO users (username, password, email, role, created_at, modified_at)
+        VALUES (:username, :password, :email, :role, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        RETURNING id, username, email, role, created_at, modified_at
+        """
+        async with get_async_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                await cursor.execute(query, user_data)
+                result = await cursor.fetchone()
+                await commit_async(conn)
+
+                # 결과를 딕셔너리로 변환
+                return row_to_dict(cursor, result)
+            except Exception as e:
+                await rollback_async(conn)
+                raise e
+            finally:
+                cursor.close()
+
+    @staticmethod
+    async def update_user(user_id: int, user_data: dict):
+        """사용자 정보 수정"""
+        # 컬럼 집합별로 캐시된 SQL 텍스트 사용 (문장 캐시 재사용)
+        query = build_update_query("users", user_data, "user_id")
+        params = {**user_data, "user_id": user_id}
+        await execute_query_async(query, params, fetch=False)
+        UserRepository.invalidate_cache(user_id, user_data)
+
+        # 업데이트된 사용자 정보 조회
+        return await AsyncUserRepository.get_user_by_id(user_id)
+
+    @staticmethod
+    async def delete_user(user_id: int):
+        """사용자 삭제 (soft delete)"""
+        query = """
+        UPDATE users
+        SET deleted_at = CURRENT_TIMESTAMP
+        WHERE id = :user_id AND deleted_at IS NULL
+        """
+        result = await execute_query_async(query, {"user_id": user_id}, fetch=False)
+        UserRepository.invalidate_cache(user_id)
+        return result > 0
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from models import get_db
-from service.comment import CommentService
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from service.comment import AsyncCommentService
 from auth.jwt_bearer import get_current_user_id
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
+from datetime import datetime
+from utils.pagination import CursorPage, CursorParams
+from utils.json_response import trusted_response
+from utils.versions import resource_versions
+from config import settings
 
 router = APIRouter(prefix="/api/comments", tags=["Comments"])
 
@@ -13,6 +16,13 @@ class CommentCreate(BaseModel):
     post_id: int
     content: str = Field(..., min_length=1)
 
+class CommentBulkCreate(BaseModel):
+    comments: List[CommentCreate] = Field(..., min_items=1, max_items=settings.BULK_MAX_ITEMS)
+
+class BulkCreateResponse(BaseModel):
+    ids: List[int]
+    count: int
+
 class CommentUpdate(BaseModel):
     content: str = Field(..., min_length=1)
 
@@ -21,51 +31,69 @@ class CommentResponse(BaseModel):
     post_id: int
     user_id: int
     content: str
-    created_at: str
-    modified_at: str
+    created_at: datetime
+    modified_at: Optional[datetime] = None
     author_name: str = None
 
 # 라우트 정의
-@router.get("/post/{post_id}", response_model=List[CommentResponse])
-def get_comments_by_post(post_id: int, db: Session = Depends(get_db)):
-    """게시물에 달린 댓글 조회"""
-    comment_service = CommentService(db)
-    return comment_service.get_comments_by_post_id(post_id)
+@router.get("/post/{post_id}", response_model=CursorPage[CommentResponse])
+async def get_comments_by_post(
+    post_id: int,
+    request: Request,
+    response: Response,
+    cursor_params: CursorParams = Depends()
+):
+    """게시물에 달린 댓글 조회 (작성순, 커서 기반 페이지네이션 / 변경이 없으면 304)"""
+    validators = await resource_versions.validators((f"comments:{post_id}", "users"), request.url.query)
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+    response.headers.update(validators.headers)
+    comment_service = AsyncCommentService()
+    return trusted_response(
+        await comment_service.get_comments_page(post_id, cursor_params), headers=validators.headers
+    )
 
 @router.get("/{comment_id}", response_model=CommentResponse)
-def get_comment(comment_id: int, db: Session = Depends(get_db)):
+async def get_comment(comment_id: int):
     """특정 댓글 조회"""
-    comment_service = CommentService(db)
-    return comment_service.get_comment_by_id(comment_id)
+    comment_service = AsyncCommentService()
+    return await comment_service.get_comment_by_id(comment_id)
 
 @router.post("/", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
-def create_comment(
+async def create_comment(
     comment: CommentCreate, 
-    db: Session = Depends(get_db), 
     current_user_id: int = Depends(get_current_user_id)
 ):
     """새 댓글 작성 (인증 필요)"""
-    comment_service = CommentService(db)
-    return comment_service.create_comment(comment.dict(), current_user_id)
+    comment_service = AsyncCommentService()
+    return await comment_service.create_comment(comment.dict(), current_user_id)
+
+@router.post("/bulk", response_model=BulkCreateResponse, status_code=status.HTTP_201_CREATED)
+async def create_comments_bulk(
+    payload: CommentBulkCreate,
+    current_user_id: int = Depends(get_current_user_id)
+):
+    """댓글 일괄 작성 (인증 필요, 한 트랜잭션으로 처리)"""
+    comment_service = AsyncCommentService()
+    ids = await comment_service.create_comments_bulk([comment.dict() for comment in payload.comments], current_user_id)
+    return {"ids": ids, "count": len(ids)}
 
 @router.put("/{comment_id}", response_model=CommentResponse)
-def update_comment(
+async def update_comment(
     comment_id: int,
     comment_data: CommentUpdate,
-    db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id)
 ):
     """댓글 수정 (작성자만 가능)"""
-    comment_service = CommentService(db)
-    return comment_service.update_comment(comment_id, comment_data.dict(), current_user_id)
+    comment_service = AsyncCommentService()
+    return await comment_service.update_comment(comment_id, comment_data.dict(), current_user_id)
 
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_comment(
+async def delete_comment(
     comment_id: int,
-    db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id)
 ):
     """댓글 삭제 (작성자만 가능)"""
-    comment_service = CommentService(db)
-    comment_service.delete_comment(comment_id, current_user_id)
+    comment_service = AsyncCommentService()
+    await comment_service.delete_comment(comment_id, current_user_id)
     return {}
\ No newline at end of file
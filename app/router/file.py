@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
-from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from models import get_db
 from service.file import FileService
-from service.post import PostService
+from service.post import AsyncPostService
+from utils.file_response import RangedFileResponse
 from auth.jwt_bearer import get_current_user_id
 from typing import List
 import os
 from pydantic import BaseModel
+from datetime import datetime
 
 router = APIRouter(prefix="/api/files", tags=["Files"])
 
@@ -17,7 +18,7 @@ class FileResponse(BaseModel):
     post_id: int
     file_name: str
     file_size: int
-    created_at: str
+    created_at: datetime
 
 @router.post("/upload/{post_id}", response_model=FileResponse)
 async def upload_file(
@@ -28,8 +29,8 @@ async def upload_file(
 ):
     """게시물에 파일 업로드 (작성자만 가능)"""
     # 게시물 소유권 확인
-    post_service = PostService(db)
-    post = post_service.get_post_by_id(post_id)
+    post_service = AsyncPostService()
+    post = await post_service.get_post_by_id(post_id)
     
     if post["user_id"] != current_user_id:
         raise HTTPException(status_code=403, detail="Not authorized to upload files to this post")
@@ -54,7 +55,7 @@ def download_file(
     file_id: int,
     db: Session = Depends(get_db)
 ):
-    """파일 다운로드"""
+    """파일 다운로드 (Range / 조건부 요청 지원)"""
     file_service = FileService(db)
     file_info = file_service.get_file_by_id(file_id)
     
@@ -63,8 +64,9 @@ def download_file(
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="File not found on server")
     
-    return FileResponse(
+    return RangedFileResponse(
         path=file_path,
+        content_hash=file_info.get("content_hash"),
         filename=file_info["file_name"],
         media_type="application/octet-stream"
     )
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from models import get_db
-from service.post import PostService
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from service.post import AsyncPostService
 from auth.jwt_bearer import JWTBearer, get_current_user_id
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from pydantic import BaseModel, Field
+from datetime import datetime
+from utils.pagination import CursorPage, CursorParams
+from utils.timing import ServerTiming
+from utils.json_response import trusted_response
+from utils.search import SearchParams
+from utils.versions import resource_versions
+from router.comment import CommentResponse
+from router.file import FileResponse as FileMetadataResponse
+from config import settings
 
 router = APIRouter(prefix="/api/posts", tags=["Posts"])
 
@@ -13,6 +20,13 @@ class PostCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
     content: str = Field(..., min_length=1)
 
+class PostBulkCreate(BaseModel):
+    posts: List[PostCreate] = Field(..., min_items=1, max_items=settings.BULK_MAX_ITEMS)
+
+class BulkCreateResponse(BaseModel):
+    ids: List[int]
+    count: int
+
 class PostUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=100)
     content: Optional[str] = Field(None, min_length=1)
@@ -23,55 +37,109 @@ class PostResponse(BaseModel):
     title: str
     content: str
     view_count: int
-    created_at: str
-    modified_at: str
+    created_at: datetime
+    modified_at: Optional[datetime] = None
     author_name: Optional[str] = None
+    comment_count: int = 0
+    file_count: int = 0
+
+class PostSearchResult(PostResponse):
+    score: float
+
+class PostAuthor(BaseModel):
+    id: int
+    username: Optional[str] = None
+
+class PostDetailResponse(PostResponse):
+    author: PostAuthor
+    comments: CursorPage[CommentResponse]
+    files: List[FileMetadataResponse]
 
 # 라우트 정의
-@router.get("/", response_model=List[PostResponse])
-def get_posts(
-    limit: int = Query(100, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+@router.get("/", response_model=Union[CursorPage[PostResponse], List[PostResponse]])
+async def get_posts(
+    request: Request,
+    response: Response,
+    cursor_params: CursorParams = Depends(),
+    limit: Optional[int] = Query(None, ge=1, le=100, deprecated=True, description="offset 방식 (cursor 사용 권장)"),
+    offset: Optional[int] = Query(None, ge=0, deprecated=True, description="offset 방식 (cursor 사용 권장)")
 ):
-    """모든 게시물 조회"""
-    post_service = PostService(db)
-    return post_service.get_all_posts(limit, offset)
+    """
+    게시물 목록 조회 (최신순, 커서 기반 페이지네이션 / 변경이 없으면 304)
+
+    limit/offset을 주면 이전 방식대로 게시물 리스트를 반환합니다 (deprecated).
+    """
+    validators = await resource_versions.validators(("posts", "comments", "files", "users"), request.url.query)
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+    response.headers.update(validators.headers)
+    post_service = AsyncPostService()
+    if cursor_params.cursor is None and (limit is not None or offset is not None):
+        response.headers["Deprecation"] = "true"
+        return await post_service.get_all_posts(limit or 100, offset or 0)
+    return trusted_response(await post_service.get_posts_page(cursor_params), headers=validators.headers)
+
+@router.get("/search", response_model=CursorPage[PostSearchResult])
+async def search_posts(search_params: SearchParams = Depends()):
+    """게시물 검색 (제목/본문/댓글, 관련도순, 커서 기반 페이지네이션)"""
+    post_service = AsyncPostService()
+    return trusted_response(await post_service.search_posts(search_params))
 
 @router.get("/{post_id}", response_model=PostResponse)
-def get_post(post_id: int, db: Session = Depends(get_db)):
+async def get_post(post_id: int):
     """특정 게시물 조회 (조회수 증가)"""
-    post_service = PostService(db)
-    return post_service.get_post_by_id(post_id, increment_views=True)
+    post_service = AsyncPostService()
+    return await post_service.get_post_by_id(post_id, increment_views=True)
+
+@router.get("/{post_id}/full", response_model=PostDetailResponse)
+async def get_post_full(
+    post_id: int,
+    response: Response,
+    comment_params: CursorParams = Depends()
+):
+    """게시물 상세 조회 (작성자, 댓글 첫 페이지, 첨부 파일 포함 / 조회수 증가)"""
+    post_service = AsyncPostService()
+    timing = ServerTiming()
+    detail = await post_service.get_post_detail(post_id, comment_params, timing)
+    # 구간별 DB 조회 시간 (브라우저 개발자 도구의 Timing 탭에서 확인 가능)
+    response.headers["Server-Timing"] = timing.header()
+    return detail
 
 @router.post("/", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
-def create_post(
+async def create_post(
     post: PostCreate, 
-    db: Session = Depends(get_db), 
     current_user_id: int = Depends(get_current_user_id)
 ):
     """새 게시물 작성 (인증 필요)"""
-    post_service = PostService(db)
-    return post_service.create_post(post.dict(), current_user_id)
+    post_service = AsyncPostService()
+    return await post_service.create_post(post.dict(), current_user_id)
+
+@router.post("/bulk", response_model=BulkCreateResponse, status_code=status.HTTP_201_CREATED)
+async def create_posts_bulk(
+    payload: PostBulkCreate,
+    current_user_id: int = Depends(get_current_user_id)
+):
+    """게시물 일괄 작성 (인증 필요, 한 트랜잭션으로 처리)"""
+    post_service = AsyncPostService()
+    ids = await post_service.create_posts_bulk([post.dict() for post in payload.posts], current_user_id)
+    return {"ids": ids, "count": len(ids)}
 
 @router.put("/{post_id}", response_model=PostResponse)
-def update_post(
+async def update_post(
     post_id: int, 
     post_data: PostUpdate, 
-    db: Session = Depends(get_db), 
     current_user_id: int = Depends(get_current_user_id)
 ):
     """게시물 수정 (작성자만 가능)"""
-    post_service = PostService(db)
-    return post_service.update_post(post_id, post_data.dict(exclude_unset=True), current_user_id)
+    post_service = AsyncPostService()
+    return await post_service.update_post(post_id, post_data.dict(exclude_unset=True), current_user_id)
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_post(
+async def delete_post(
     post_id: int, 
-    db: Session = Depends(get_db), 
     current_user_id: int = Depends(get_current_user_id)
 ):
     """게시물 삭제 (작성자만 가능)"""
-    post_service = PostService(db)
-    post_service.delete_post(post_id, current_user_id)
+    post_service = AsyncPostService()
+    await post_service.delete_post(post_id, current_user_id)
     return {}
\ No newline at end of file
@@ -1,9 +1,13 @@
-from repository.comment import CommentRepository
-from repository.post import PostRepository
+from repository.comment import CommentRepository, AsyncCommentRepository
+from repository.post import PostRepository, AsyncPostRepository
+from service.post import bulk_error
+from utils.database import BatchError
+from utils.counts import count_provider
 from fastapi import HTTPException, Depends
 from sqlalchemy.orm import Session
 from models import get_db
 from typing import List, Dict, Any, Optional
+from utils.pagination import CursorParams, keyset_paginate
 
 class CommentService:
     def __init__(self, db: Session = None):
@@ -11,14 +15,33 @@ class CommentService:
         self.comment_repository = CommentRepository
         self.post_repository = PostRepository
     
+    def _ensure_post_exists(self, post_id: int) -> None:
+        if not self.post_repository.get_post_by_id(post_id, self.db):
+            raise HTTPException(status_code=404, detail="Post not found")
+    
     def get_comments_by_post_id(self, post_id: int) -> List[Dict[str, Any]]:
         """게시물에 달린 댓글 조회"""
-        # 게시물 존재 확인
-        post = self.post_repository.get_post_by_id(post_id, self.db)
-        if not post:
-            raise HTTPException(status_code=404, detail="Post not found")
-        
-        return self.comment_repository.get_comments_by_post_id(post_id, self.db)
+        comments = self.comment_repository.get_comments_by_post_id(post_id, self.db)
+        # 삭제되지 않은 게시물의 댓글만 조회되므로, 결과가 비어 있을 때만 게시물 존재 확인
+        if not comments:
+            self._ensure_post_exists(post_id)
+        return comments
+    
+    def get_comments_page(self, post_id: int, cursor_params: CursorParams) -> Dict[str, Any]:
+        """커서 기반 댓글 목록 조회"""
+        comments = self.comment_repository.get_comments_by_cursor(post_id, cursor_params, self.db)
+        # 삭제되지 않은 게시물의 댓글만 조회되므로, 결과가 비어 있을 때만 게시물 존재 확인
+        if not comments:
+            self._ensure_post_exists(post_id)
+        return keyset_paginate(comments, cursor_params, self._comment_total(post_id))
+    
+    def _comment_total(self, post_id: int):
+        """게시물의 댓글 수 (보관 중이 아니면 해당 게시물만 집계해 보관)"""
+        total = count_provider.post_count("comments", post_id)
+        if total is None:
+            count_provider.remember_posts([post_id], self.post_repository.get_post_counts([post_id], self.db))
+            total = count_provider.post_count("comments", post_id)
+        return total
     
     def get_comment_by_id(self, comment_id: int) -> Dict[str, Any]:
         """ID로 댓글 조회"""
@@ -40,6 +63,22 @@ class CommentService:
         
         return self.comment_repository.create_comment(comment_data, self.db)
     
+    def create_comments_bulk(self, comments_data: List[Dict[str, Any]], user_id: int) -> List[int]:
+        """댓글 일괄 생성 (전체 성공 또는 전체 롤백)"""
+        # 대상 게시물 존재 확인 (한 번의 쿼리)
+        post_ids = sorted({comment_data["post_id"] for comment_data in comments_data})
+        existing = self.post_repository.get_existing_post_ids(post_ids, self.db)
+        missing = [post_id for post_id in post_ids if post_id not in existing]
+        if missing:
+            raise HTTPException(status_code=404, detail={"message": "Post not found", "post_ids": missing})
+        
+        for comment_data in comments_data:
+            comment_data["user_id"] = user_id
+        try:
+            return self.comment_repository.create_comments_bulk(comments_data, self.db)
+        except BatchError as e:
+            raise bulk_error(e)
+    
     def update_comment(self, comment_id: int, comment_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
         """댓글 수정"""
         # 댓글 존재 확인
@@ -60,4 +99,97 @@ class CommentService:
         if comment["user_id"] != user_id:
             raise HTTPException(status_code=403, detail="Not authorized to delete this comment")
         
-        return self.comment_repository.delete_comment(comment_id, self.db)
\ No newline at end of file
+        return self.comment_repository.delete_comment(comment_id, self.db, post_id=comment["post_id"])
+
+class AsyncCommentService:
+    """CommentService의 비동기 버전"""
+
+    def __init__(self):
+        self.comment_repository = AsyncCommentRepository
+        self.post_repository = AsyncPostRepository
+
+    async def _ensure_post_exists(self, post_id: int) -> None:
+        if not await self.post_repository.get_post_by_id(post_id):
+            raise HTTPException(status_code=404, detail="Post not found")
+
+    async def get_comments_by_post_id(self, post_id: int) -> List[Dict[str, Any]]:
+        """게시물에 달린 댓글 조회"""
+        comments = await self.comment_repository.get_comments_by_post_id(post_id)
+        # 삭제되지 않은 게시물의 댓글만 조회되므로, 결과가 비어 있을 때만 게시물 존재 확인
+        if not comments:
+            await self._ensure_post_exists(post_id)
+        return comments
+
+    async def get_comments_page(self, post_id: int, cursor_params: CursorParams) -> Dict[str, Any]:
+        """커서 기반 댓글 목록 조회"""
+        comments = await self.comment_repository.get_comments_by_cursor(post_id, cursor_params)
+        # 삭제되지 않은 게시물의 댓글만 조회되므로, 결과가 비어 있을 때만 게시물 존재 확인
+        if not comments:
+            await self._ensure_post_exists(post_id)
+        return keyset_paginate(comments, cursor_params, await self._comment_total(post_id))
+
+    async def _comment_total(self, post_id: int):
+        """게시물의 댓글 수 (보관 중이 아니면 해당 게시물만 집계해 보관)"""
+        total = count_provider.post_count("comments", post_id)
+        if total is None:
+            count_provider.remember_posts([post_id], await self.post_repository.get_post_counts([post_id]))
+            total = count_provider.post_count("comments", post_id)
+        return total
+
+    async def get_comment_by_id(self, comment_id: int) -> Dict[str, Any]:
+        """ID로 댓글 조회"""
+        comment = await self.comment_repository.get_comment_by_id(comment_id)
+        if not comment:
+            raise HTTPException(status_code=404, detail="Comment not found")
+        return comment
+
+    async def create_comment(self, comment_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """댓글 생성"""
+        # 게시물 존재 확인
+        post_id = comment_data["post_id"]
+        post = await self.post_repository.get_post_by_id(post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+
+        # 사용자 ID 설정
+        comment_data["user_id"] = user_id
+
+        return await self.comment_repository.create_comment(comment_data)
+
+    async def create_comments_bulk(self, comments_data: List[Dict[str, Any]], user_id: int) -> List[int]:
+        """댓글 일괄 생성 (전체 성공 또는 전체 롤백)"""
+        # 대상 게시물 존재 확인 (한 번의 쿼리)
+        post_ids = sorted({comment_data["post_id"] for comment_data in comments_data})
+        existing = await self.post_repository.get_existing_post_ids(post_ids)
+        missing = [post_id for post_id in post_ids if post_id not in existing]
+        if missing:
+            raise HTTPException(status_code=404, detail={"message": "Post not found", "post_ids": missing})
+
+        for comment_data in comments_data:
+            comment_data["user_id"] = user_id
+        try:
+            return await self.comment_repository.create_comments_bulk(comments_data)
+        except BatchError as e:
+            raise bulk_error(e)
+
+    async def update_comment(self, comment_id: int, comment_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """댓글 수정"""
+        # 댓글 존재 확인
+        comment = await self.get_comment_by_id(comment_id)
+
+        # 수정 권한 확인 (작성자인지)
+        if comment["user_id"] != user_id:
+            raise HTTPException(status_code=403, detail="Not authorized to update this comment")
+
+        return await self.comment_repository.update_comment(comment_id, comment_data)
+
+    async def delete_comment(self, comment_id: int, user_id: int) -> bool:
+        """댓글 삭제"""
+        # 댓글 존재 확인
+        comment = await self.get_comment_by_id(comment_id)
+
+        # 삭제 권한 확인 (작성자인지)
+        if comment["user_id"] != user_id:
+            raise HTTPException(status_code=403, detail="Not authorized to delete this comment")
+
+        return await self.comment_repository.delete_comment(comment_id, post_id=comment["post_id"])
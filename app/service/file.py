@@ -1,12 +1,22 @@
 import os
 import uuid
+import hashlib
+import tempfile
 from fastapi import UploadFile, HTTPException
-from typing import Dict, Any, List
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, Any, List, Tuple
 import aiofiles
+import oracledb
 from sqlalchemy.orm import Session
-from models import File
+from sqlalchemy.exc import IntegrityError
+from models import File, FileBlob
 from sqlalchemy import text
 from config import settings
+from utils.counts import count_provider
+from utils.transaction import transaction_context, on_commit, on_rollback
+
+# 업로드 파일을 읽고 쓰는 단위 (업로드 크기와 관계없이 메모리 사용량을 일정하게 유지)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 class FileService:
     def __init__(self, db: Session = None):
@@ -17,33 +27,120 @@ class FileService:
         if not os.path.exists(self.upload_dir):
             os.makedirs(self.upload_dir)
     
-    async def save_file(self, file: UploadFile, post_id: int) -> Dict[str, Any]:
-        """파일 저장 및 DB에 기록"""
-        # 파일명 생성 (중복 방지를 위한 UUID)
-        file_ext = os.path.splitext(file.filename)[1]
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
-        file_path = os.path.join(self.upload_dir, unique_filename)
+    @staticmethod
+    def _raise_too_large():
+        raise HTTPException(
+            status_code=413,
+            detail=f"File exceeds the maximum upload size of {settings.MAX_UPLOAD_SIZE} bytes"
+        )
+    
+    def _blob_path(self, content_hash: str) -> str:
+        """내용 해시에 대응하는 저장 경로 (디렉토리 하나에 파일이 몰리지 않도록 해시 앞자리로 분산)"""
+        return os.path.join(self.upload_dir, content_hash[:2], content_hash[2:4], content_hash)
+    
+    async def _stream_to_temp(self, file: UploadFile) -> Tuple[str, int, str]:
+        """
+        업로드 파일을 청크 단위로 임시 파일에 기록하면서 SHA-256 해시 계산
         
-        # 파일 크기 계산
-        file.file.seek(0, os.SEEK_END)
-        file_size = file.file.tell()
-        file.file.seek(0)  # 파일 포인터 리셋
+        기록한 바이트 수가 MAX_UPLOAD_SIZE를 넘으면 즉시 중단하고 임시 파일을 삭제합니다.
+        (임시 파일 경로, 크기, 해시)를 반환합니다.
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.upload_dir, prefix=".upload-", suffix=".part")
+        os.close(fd)
+        file_size = 0
+        digest = hashlib.sha256()
+        try:
+            async with aiofiles.open(temp_path, 'wb') as out_file:
+                while True:
+                    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    file_size += len(chunk)
+                    if file_size > settings.MAX_UPLOAD_SIZE:
+                        self._raise_too_large()
+                    digest.update(chunk)
+                    await out_file.write(chunk)
+        except BaseException:
+            self._discard(temp_path)
+            raise
+        return temp_path, file_size, digest.hexdigest()
+    
+    @staticmethod
+    def _on_files_changed(post_id: int, delta: int) -> None:
+        """첨부 파일 수 변경을 건수에 반영 (커밋 뒤 호출)"""
+        count_provider.record("files", delta, post_id)
+    
+    @staticmethod
+    def _discard(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    
+    def _place_blob(self, temp_path: str, blob_path: str) -> None:
+        """
+        임시 파일을 blob 경로로 원자적으로 이동 (같은 내용이 이미 있으면 쓰기 생략)
         
-        # 파일 저장
-        async with aiofiles.open(file_path, 'wb') as out_file:
-            content = await file.read()
-            await out_file.write(content)
+        file_blobs 행 잠금을 잡은 상태에서 호출되므로 삭제와 경합하지 않으며,
+        참조는 남아 있는데 파일이 없어진 경우에도 여기서 다시 채워집니다.
+        트랜잭션이 롤백되면 (잠금을 풀기 전에) 임시 경로로 되돌려 참조 없는 파일이 남지 않게 합니다.
+        """
+        if os.path.exists(blob_path):
+            self._discard(temp_path)
+            return
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        os.replace(temp_path, blob_path)
+        on_rollback(lambda: os.replace(blob_path, temp_path))
+    
+    def _retire_blob(self, blob_path: str) -> None:
+        """
+        마지막 참조가 사라진 blob 파일 회수
+
+        행 잠금을 잡은 채로 옆 경로로 옮겨 두고 커밋된 뒤 삭제하며,
+        롤백되면 (잠금을 풀기 전에) 원래 경로로 되돌립니다.
+        """
+        retired_path = f"{blob_path}.{uuid.uuid4().hex}.deleted"
+        try:
+            os.replace(blob_path, retired_path)
+        except FileNotFoundError:
+            return
+        on_commit(lambda: self._discard(retired_path))
+        on_rollback(lambda: os.replace(retired_path, blob_path))
+    
+    def _record_upload(self, temp_path: str, post_id: int, file_name: str,
+                       file_size: int, content_hash: str) -> Dict[str, Any]:
+        """
+        blob 참조 수 증가 + 파일 메타데이터 저장을 한 트랜잭션으로 처리
+
+        요청의 작업 단위 안이면 세이브포인트로 실행되어, 중복 키로 실패해도 이 부분만 되돌리고 재시도할 수 있습니다.
+        """
+        blob_path = self._blob_path(content_hash)
         
-        # DB에 파일 정보 저장
         if self.db:  # ORM 사용
-            db_file = File(
-                post_id=post_id,
-                file_name=file.filename,
-                file_path=file_path,
-                file_size=file_size
-            )
-            self.db.add(db_file)
-            self.db.commit()
+            with transaction_context(self.db):
+                blob = self.db.query(FileBlob).filter(
+                    FileBlob.content_hash == content_hash
+                ).with_for_update().first()
+                if blob:
+                    blob.ref_count += 1
+                else:
+                    blob = FileBlob(
+                        content_hash=content_hash,
+                        file_path=blob_path,
+                        file_size=file_size,
+                        ref_count=1
+                    )
+                    self.db.add(blob)
+                db_file = File(
+                    post_id=post_id,
+                    file_name=file_name,
+                    file_path=blob.file_path,
+                    file_size=file_size,
+                    content_hash=content_hash
+                )
+                self.db.add(db_file)
+                self.db.flush()
+                self._place_blob(temp_path, blob.file_path)
             self.db.refresh(db_file)
             return {
                 "id": db_file.id,
@@ -51,23 +148,77 @@ class FileService:
                 "file_name": db_file.file_name,
                 "file_path": db_file.file_path,
                 "file_size": db_file.file_size,
+                "content_hash": db_file.content_hash,
                 "created_at": db_file.created_at
             }
         else:  # 직접 쿼리 사용
-            from utils.database import execute_query
-            query = """
-            INSERT INTO files (post_id, file_name, file_path, file_size, created_at)
-            VALUES (:post_id, :file_name, :file_path, :file_size, CURRENT_TIMESTAMP)
-            RETURNING id, post_id, file_name, file_path, file_size, created_at
+            from utils.database import row_to_dict
+            # MERGE가 기존 행을 잠그므로 커밋 전까지 같은 blob의 삭제가 끼어들지 않음
+            blob_query = """
+            MERGE INTO file_blobs b
+            USING (SELECT :content_hash AS content_hash FROM dual) s
+            ON (b.content_hash = s.content_hash)
+            WHEN MATCHED THEN UPDATE SET b.ref_count = b.ref_count + 1
+            WHEN NOT MATCHED THEN
+                INSERT (content_hash, file_path, file_size, ref_count, created_at)
+                VALUES (:content_hash, :file_path, :file_size, 1, CURRENT_TIMESTAMP)
             """
-            params = {
-                "post_id": post_id,
-                "file_name": file.filename,
-                "file_path": file_path,
-                "file_size": file_size
-            }
-            result = execute_query(query, params)
-            return result[0] if result else None
+            file_query = """
+            INSERT INTO files (post_id, file_name, file_path, file_size, content_hash, created_at)
+            VALUES (:post_id, :file_name, :file_path, :file_size, :content_hash, CURRENT_TIMESTAMP)
+            RETURNING id, post_id, file_name, file_path, file_size, content_hash, created_at
+            """
+            with transaction_context() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(blob_query, {
+                        "content_hash": content_hash,
+                        "file_path": blob_path,
+                        "file_size": file_size
+                    })
+                    cursor.execute(
+                        "SELECT file_path FROM file_blobs WHERE content_hash = :content_hash",
+                        {"content_hash": content_hash}
+                    )
+                    blob_path = cursor.fetchone()[0]
+                    self._place_blob(temp_path, blob_path)
+                    cursor.execute(file_query, {
+                        "post_id": post_id,
+                        "file_name": file_name,
+                        "file_path": blob_path,
+                        "file_size": file_size,
+                        "content_hash": content_hash
+                    })
+                    result = cursor.fetchone()
+                    return row_to_dict(cursor, result)
+                finally:
+                    cursor.close()
+    
+    async def save_file(self, file: UploadFile, post_id: int) -> Dict[str, Any]:
+        """파일 저장 및 DB에 기록 (내용 해시 기준으로 중복 저장하지 않음)"""
+        # 크기를 알 수 있으면 저장 전에 거절
+        if file.size is not None and file.size > settings.MAX_UPLOAD_SIZE:
+            self._raise_too_large()
+        
+        # 파일 저장 (청크 단위 스트리밍 + 해시 계산)
+        temp_path, file_size, content_hash = await self._stream_to_temp(file)
+        # 요청의 작업 단위가 나중에 롤백되면 임시 경로로 되돌아온 blob까지 정리
+        on_rollback(lambda: self._discard(temp_path))
+        
+        try:
+            # 같은 내용이 동시에 처음 올라오면 한쪽의 blob INSERT가 중복 키로 실패하므로 한 번 재시도
+            for attempt in range(2):
+                try:
+                    file_info = await run_in_threadpool(
+                        self._record_upload, temp_path, post_id, file.filename, file_size, content_hash
+                    )
+                    on_commit(lambda: self._on_files_changed(post_id, 1))
+                    return file_info
+                except (IntegrityError, oracledb.IntegrityError):
+                    if attempt:
+                        raise
+        finally:
+            self._discard(temp_path)
     
     def get_files_by_post_id(self, post_id: int) -> List[Dict[str, Any]]:
         """게시물에 첨부된 파일 목록 조회"""
@@ -83,13 +234,14 @@ class FileService:
                     "file_name": file.file_name,
                     "file_path": file.file_path,
                     "file_size": file.file_size,
+                    "content_hash": file.content_hash,
                     "created_at": file.created_at
                 } for file in files
             ]
         else:  # 직접 쿼리 사용
             from utils.database import execute_query
             query = """
-            SELECT id, post_id, file_name, file_path, file_size, created_at
+            SELECT id, post_id, file_name, file_path, file_size, content_hash, created_at
             FROM files
             WHERE post_id = :post_id AND deleted_at IS NULL
             """
@@ -110,12 +262,13 @@ class FileService:
                 "file_name": file.file_name,
                 "file_path": file.file_path,
                 "file_size": file.file_size,
+                "content_hash": file.content_hash,
                 "created_at": file.created_at
             }
         else:  # 직접 쿼리 사용
             from utils.database import execute_query
             query = """
-            SELECT id, post_id, file_name, file_path, file_size, created_at
+            SELECT id, post_id, file_name, file_path, file_size, content_hash, created_at
             FROM files
             WHERE id = :file_id AND deleted_at IS NULL
             """
@@ -137,19 +290,72 @@ class FileService:
         if post["user_id"] != user_id:
             raise HTTPException(status_code=403, detail="Not authorized to delete this file")
         
-        # 파일 삭제 처리 (소프트 딜리트)
+        # 파일 삭제 처리 (소프트 딜리트 + blob 참조 해제)
+        content_hash = file_info.get("content_hash")
         if self.db:  # ORM 사용
-            self.db.query(File).filter(File.id == file_id).update({
-                "deleted_at": text("CURRENT_TIMESTAMP")
-            })
-            self.db.commit()
-            return True
+            with transaction_context(self.db):
+                deleted = self.db.query(File).filter(
+                    File.id == file_id,
+                    File.deleted_at.is_(None)
+                ).update({
+                    "deleted_at": text("CURRENT_TIMESTAMP")
+                }, synchronize_session=False)
+                if deleted and content_hash:
+                    blob = self.db.query(FileBlob).filter(
+                        FileBlob.content_hash == content_hash
+                    ).with_for_update().first()
+                    if blob and blob.ref_count <= 1:
+                        # 마지막 참조: 실제 파일은 커밋된 뒤 삭제
+                        self.db.delete(blob)
+                        self.db.flush()
+                        self._retire_blob(blob.file_path)
+                    elif blob:
+                        blob.ref_count -= 1
+            if deleted:
+                on_commit(lambda: self._on_files_changed(file_info["post_id"], -1))
+            return deleted > 0
         else:  # 직접 쿼리 사용
-            from utils.database import execute_query
-            query = """
-            UPDATE files
-            SET deleted_at = CURRENT_TIMESTAMP
-            WHERE id = :file_id AND deleted_at IS NULL
-            """
-            result = execute_query(query, {"file_id": file_id}, fetch=False)
-            return result > 0
\ No newline at end of file
+            with transaction_context() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute("""
+                    UPDATE files
+                    SET deleted_at = CURRENT_TIMESTAMP
+                    WHERE id = :file_id AND deleted_at IS NULL
+                    """, {"file_id": file_id})
+                    deleted = cursor.rowcount
+                    if deleted and content_hash:
+                        params = {"content_hash": content_hash}
+                        cursor.execute("""
+                        SELECT ref_count, file_path FROM file_blobs
+                        WHERE content_hash = :content_hash
+                        FOR UPDATE
+                        """, params)
+                        blob = cursor.fetchone()
+                        if blob and blob[0] <= 1:
+                            # 마지막 참조: 실제 파일은 커밋된 뒤 삭제
+                            cursor.execute("DELETE FROM file_blobs WHERE content_hash = :content_hash", params)
+                            self._retire_blob(blob[1])
+                        elif blob:
+                            cursor.execute("""
+                            UPDATE file_blobs SET ref_count = ref_count - 1
+                            WHERE content_hash = :content_hash
+                            """, params)
+                finally:
+                    cursor.close()
+            if deleted:
+                on_commit(lambda: self._on_files_changed(file_info["post_id"], -1))
+            return deleted > 0
+
+class AsyncFileService:
+    """FileService의 조회 기능 비동기 버전 (직접 쿼리 전용)"""
+
+    async def get_files_by_post_id(self, post_id: int) -> List[Dict[str, Any]]:
+        """게시물에 첨부된 파일 목록 조회"""
+        from utils.database import execute_query_async
+        query = """
+        SELECT id, post_id, file_name, file_path, file_size, content_hash, created_at
+        FROM files
+        WHERE post_id = :post_id AND deleted_at IS NULL
+        """
+        return await execute_query_async(query, {"post_id": post_id})
@@ -1,8 +1,38 @@
-from repository.post import PostRepository
+import asyncio
+from repository.post import PostRepository, AsyncPostRepository
+from repository.comment import AsyncCommentRepository
 from fastapi import HTTPException, Depends
 from sqlalchemy.orm import Session
 from models import get_db
 from typing import List, Dict, Any, Optional
+from utils.pagination import CursorParams, keyset_paginate
+from utils.view_counter import view_count_buffer
+from utils.database import BatchError, shared_async_connection
+from utils.timing import ServerTiming
+from utils.counts import count_provider
+from utils.search import search_index, SearchParams, encode_search_cursor
+
+def bulk_error(error: BatchError) -> HTTPException:
+    """배열 DML 실패를 행 위치별 오류 목록이 담긴 400 응답으로 변환"""
+    return HTTPException(
+        status_code=400,
+        detail={"message": "Bulk insert failed, no rows were created", "errors": error.errors}
+    )
+
+def attach_counts(posts: list, counts: Dict[int, Dict[str, int]]) -> list:
+    """게시물 목록(딕셔너리 또는 ORM 객체)에 comment_count/file_count 설정"""
+    for post in posts:
+        is_dict = isinstance(post, dict)
+        post_counts = counts.get(post["id"] if is_dict else post.id, {})
+        for key in ("comment_count", "file_count"):
+            if is_dict:
+                post[key] = post_counts.get(key, 0)
+            else:
+                setattr(post, key, post_counts.get(key, 0))
+    return posts
+
+def _post_ids(posts: list) -> List[int]:
+    return [post["id"] if isinstance(post, dict) else post.id for post in posts]
 
 class PostService:
     def __init__(self, db: Session = None):
@@ -10,8 +40,21 @@ class PostService:
         self.post_repository = PostRepository
     
     def get_all_posts(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
-        """모든 게시물 조회"""
-        return self.post_repository.get_all_posts(limit, offset, self.db)
+        """모든 게시물 조회 (댓글/첨부 파일 수 포함)"""
+        posts = self.post_repository.get_all_posts(limit, offset, self.db)
+        return self._with_counts(view_count_buffer.apply(posts))
+    
+    def get_posts_page(self, cursor_params: CursorParams) -> Dict[str, Any]:
+        """커서 기반 게시물 목록 조회 (댓글/첨부 파일 수 포함)"""
+        posts = self.post_repository.get_posts_by_cursor(cursor_params, self.db)
+        return keyset_paginate(self._with_counts(view_count_buffer.apply(posts)), cursor_params, count_provider.table_count("posts"))
+    
+    def _with_counts(self, posts: list) -> list:
+        """페이지 전체의 댓글/첨부 파일 수를 집계 쿼리로 한 번에 조회해 설정 (게시물별 지연 로딩 없음)"""
+        post_ids = _post_ids(posts)
+        counts = self.post_repository.get_post_counts(post_ids, self.db)
+        count_provider.remember_posts(post_ids, counts)
+        return attach_counts(posts, counts)
     
     def get_post_by_id(self, post_id: int, increment_views: bool = False) -> Dict[str, Any]:
         """ID로 게시물 조회"""
@@ -19,10 +62,10 @@ class PostService:
         if not post:
             raise HTTPException(status_code=404, detail="Post not found")
         
-        # 조회수 증가
+        # 조회수 증가 (버퍼에 기록 후 주기적으로 일괄 반영)
         if increment_views:
-            self.post_repository.increment_view_count(post_id, self.db)
-            post["view_count"] = post.get("view_count", 0) + 1
+            view_count_buffer.increment(post_id)
+        view_count_buffer.apply([post])
         
         return post
     
@@ -31,6 +74,15 @@ class PostService:
         post_data["user_id"] = user_id
         return self.post_repository.create_post(post_data, self.db)
     
+    def create_posts_bulk(self, posts_data: List[Dict[str, Any]], user_id: int) -> List[int]:
+        """게시물 일괄 생성 (전체 성공 또는 전체 롤백)"""
+        for post_data in posts_data:
+            post_data["user_id"] = user_id
+        try:
+            return self.post_repository.create_posts_bulk(posts_data, self.db)
+        except BatchError as e:
+            raise bulk_error(e)
+    
     def update_post(self, post_id: int, post_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
         """게시물 수정"""
         # 게시물 존재 확인
@@ -51,4 +103,133 @@ class PostService:
         if post["user_id"] != user_id:
             raise HTTPException(status_code=403, detail="Not authorized to delete this post")
         
-        return self.post_repository.delete_post(post_id, self.db)
\ No newline at end of file
+        return self.post_repository.delete_post(post_id, self.db)
+
+class AsyncPostService:
+    """PostService의 비동기 버전"""
+
+    def __init__(self):
+        self.post_repository = AsyncPostRepository
+
+    async def get_all_posts(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """모든 게시물 조회 (댓글/첨부 파일 수 포함)"""
+        posts = await self.post_repository.get_all_posts(limit, offset)
+        return await self._with_counts(view_count_buffer.apply(posts))
+
+    async def get_posts_page(self, cursor_params: CursorParams) -> Dict[str, Any]:
+        """커서 기반 게시물 목록 조회 (댓글/첨부 파일 수 포함)"""
+        posts = await self.post_repository.get_posts_by_cursor(cursor_params)
+        posts = await self._with_counts(view_count_buffer.apply(posts))
+        return keyset_paginate(posts, cursor_params, count_provider.table_count("posts"))
+
+    async def _with_counts(self, posts: list) -> list:
+        """페이지 전체의 댓글/첨부 파일 수를 집계 쿼리로 한 번에 조회해 설정"""
+        post_ids = _post_ids(posts)
+        counts = await self.post_repository.get_post_counts(post_ids)
+        count_provider.remember_posts(post_ids, counts)
+        return attach_counts(posts, counts)
+
+    async def search_posts(self, search_params: SearchParams) -> Dict[str, Any]:
+        """게시물 전문 검색 (BM25 점수순, 점수 기반 커서 페이지네이션)"""
+        hits = search_index.search(search_params.q, search_params.fetch_size, search_params.after)
+        has_next = len(hits) > search_params.page_size
+        hits = hits[:search_params.page_size]
+
+        # 색인 순위대로 본문 조회 (색인 반영 직후 삭제된 게시물은 건너뜀)
+        posts = await self.post_repository.get_posts_by_ids([post_id for _, post_id in hits])
+        posts_by_id = {post["id"]: post for post in posts}
+        items = []
+        for score, post_id in hits:
+            post = posts_by_id.get(post_id)
+            if post is not None:
+                post["score"] = score
+                items.append(post)
+        items = await self._with_counts(view_count_buffer.apply(items))
+
+        last_score, last_id = hits[-1] if hits else (None, None)
+        return {
+            "items": items,
+            "metadata": {
+                "page_size": search_params.page_size,
+                "next_cursor": encode_search_cursor(last_score, last_id) if has_next else None,
+                "prev_cursor": None,
+                "has_next": has_next,
+                "has_prev": search_params.after is not None,
+            }
+        }
+
+    async def get_post_by_id(self, post_id: int, increment_views: bool = False) -> Dict[str, Any]:
+        """ID로 게시물 조회"""
+        post = await self.post_repository.get_post_by_id(post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+
+        # 조회수 증가 (버퍼에 기록 후 주기적으로 일괄 반영)
+        if increment_views:
+            view_count_buffer.increment(post_id)
+        view_count_buffer.apply([post])
+
+        return post
+
+    async def get_post_detail(self, post_id: int, comment_params: CursorParams,
+                              timing: Optional[ServerTiming] = None) -> Dict[str, Any]:
+        """
+        게시물 상세 화면용 집계 조회 (게시물 + 작성자 + 댓글 첫 페이지 + 첨부 파일)
+
+        게시물을 먼저 조회하여(없으면 404) 나머지 쿼리를 실행하지 않고,
+        댓글(작성자 JOIN)/파일/건수 쿼리 3개는 연결 하나를 공유하여 함께 실행합니다
+        (요청당 비동기 풀 연결은 최대 하나).
+        """
+        from service.file import AsyncFileService
+        timing = timing or ServerTiming()
+        post = await timing.measure("post", self.get_post_by_id(post_id, increment_views=True))
+        async with shared_async_connection():
+            comments, files, counts = await asyncio.gather(
+                timing.measure("comments", AsyncCommentRepository.get_comments_by_cursor(post_id, comment_params)),
+                timing.measure("files", AsyncFileService().get_files_by_post_id(post_id)),
+                timing.measure("counts", self.post_repository.get_post_counts([post_id])),
+            )
+        count_provider.remember_posts([post_id], counts)
+        attach_counts([post], counts)
+        return {
+            **post,
+            "author": {"id": post["user_id"], "username": post.get("author_name")},
+            "comments": keyset_paginate(comments, comment_params, (post["comment_count"], False)),
+            "files": files,
+        }
+
+    async def create_post(self, post_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """게시물 생성"""
+        post_data["user_id"] = user_id
+        return await self.post_repository.create_post(post_data)
+
+    async def create_posts_bulk(self, posts_data: List[Dict[str, Any]], user_id: int) -> List[int]:
+        """게시물 일괄 생성 (전체 성공 또는 전체 롤백)"""
+        for post_data in posts_data:
+            post_data["user_id"] = user_id
+        try:
+            return await self.post_repository.create_posts_bulk(posts_data)
+        except BatchError as e:
+            raise bulk_error(e)
+
+    async def update_post(self, post_id: int, post_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """게시물 수정"""
+        # 게시물 존재 확인
+        post = await self.get_post_by_id(post_id)
+
+        # 수정 권한 확인 (작성자인지)
+        if post["user_id"] != user_id:
+            raise HTTPException(status_code=403, detail="Not authorized to update this post")
+
+        return await self.post_repository.update_post(post_id, post_data)
+
+    async def delete_post(self, post_id: int, user_id: int) -> bool:
+        """게시물 삭제"""
+        # 게시물 존재 확인
+        post = await self.get_post_by_id(post_id)
+
+        # 삭제 권한 확인 (작성자인지)
+        if post["user_id"] != user_id:
+            raise HTTPException(status_code=403, detail="Not authorized to delete this post")
+
+        return await self.post_repository.delete_post(post_id)
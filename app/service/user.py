@@ -1,13 +1,13 @@
-from repository.user import UserRepository
+from repository.user import UserRepository, AsyncUserRepository
 from fastapi import HTTPException, Depends
 from sqlalchemy.orm import Session
 from models import get_db
-from passlib.context import CryptContext
+from auth.user_validity import user_validity
+from utils.transaction import on_commit
+from utils import password as password_utils
+from utils.password import password_hasher
 from typing import Optional, List, Dict, Any
 
-# 비밀번호 해싱을 위한 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 class UserService:
     def __init__(self, db: Session = None):
         self.db = db
@@ -16,12 +16,12 @@ class UserService:
     @staticmethod
     def get_password_hash(password: str) -> str:
         """비밀번호 해싱"""
-        return pwd_context.hash(password)
+        return password_utils.get_password_hash(password)
     
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """비밀번호 검증"""
-        return pwd_context.verify(plain_password, hashed_password)
+        return password_utils.verify_password(plain_password, hashed_password)
     
     def get_all_users(self) -> List[Dict[str, Any]]:
         """모든 사용자 조회"""
@@ -66,7 +66,10 @@ class UserService:
         # 사용자 존재 확인
         self.get_user_by_id(user_id)
         
-        return self.user_repository.delete_user(user_id, self.db)
+        deleted = self.user_repository.delete_user(user_id, self.db)
+        # 인증 캐시에서 제외 (작업 단위 안이면 커밋된 뒤)
+        on_commit(lambda: user_validity.mark_deleted(user_id))
+        return deleted
     
     def authenticate_user(self, username: str, password: str) -> Optional[Dict[str, Any]]:
         """사용자 인증"""
@@ -78,8 +81,90 @@ class UserService:
         if not self.verify_password(password, user["password"]):
             return None
         
+        # bcrypt cost가 바뀌었으면 로그인 시점에 재해싱
+        if password_utils.needs_rehash(user["password"]):
+            self.user_repository.update_user(user["id"], {"password": self.get_password_hash(password)}, self.db)
+        
         # 비밀번호 필드 제거
         if "password" in user:
             del user["password"]
         
-        return user
\ No newline at end of file
+        return user
+
+class AsyncUserService:
+    """UserService의 비동기 버전
+
+    bcrypt 연산은 이벤트 루프를 막지 않도록 전용 프로세스 풀(utils.password.password_hasher)에서 실행합니다.
+    """
+
+    def __init__(self):
+        self.user_repository = AsyncUserRepository
+
+    async def get_all_users(self) -> List[Dict[str, Any]]:
+        """모든 사용자 조회"""
+        return await self.user_repository.get_all_users()
+
+    async def get_user_by_id(self, user_id: int) -> Dict[str, Any]:
+        """ID로 사용자 조회"""
+        user = await self.user_repository.get_user_by_id(user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        return user
+
+    async def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
+        """사용자명으로 사용자 조회"""
+        return await self.user_repository.get_user_by_username(username)
+
+    async def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """사용자 생성"""
+        # 사용자명 중복 확인
+        existing_user = await self.get_user_by_username(user_data["username"])
+        if existing_user:
+            raise HTTPException(status_code=400, detail="Username already registered")
+
+        # 비밀번호 해싱
+        user_data["password"] = await password_hasher.hash(user_data["password"])
+
+        return await self.user_repository.create_user(user_data)
+
+    async def update_user(self, user_id: int, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """사용자 정보 수정"""
+        # 사용자 존재 확인
+        await self.get_user_by_id(user_id)
+
+        # 비밀번호가 포함된 경우 해싱
+        if "password" in user_data:
+            user_data["password"] = await password_hasher.hash(user_data["password"])
+
+        return await self.user_repository.update_user(user_id, user_data)
+
+    async def delete_user(self, user_id: int) -> bool:
+        """사용자 삭제"""
+        # 사용자 존재 확인
+        await self.get_user_by_id(user_id)
+
+        deleted = await self.user_repository.delete_user(user_id)
+        # 인증 캐시에서 제외 (작업 단위 안이면 커밋된 뒤)
+        on_commit(lambda: user_validity.mark_deleted(user_id))
+        return deleted
+
+    async def authenticate_user(self, username: str, password: str) -> Optional[Dict[str, Any]]:
+        """사용자 인증"""
+        user = await self.get_user_by_username(username)
+
+        if not user:
+            return None
+
+        if not await password_hasher.verify(password, user["password"]):
+            return None
+
+        # bcrypt cost가 바뀌었으면 로그인 시점에 재해싱
+        if password_utils.needs_rehash(user["password"]):
+            new_hash = await password_hasher.hash(password)
+            await self.user_repository.update_user(user["id"], {"password": new_hash})
+
+        # 비밀번호 필드 제거
+        if "password" in user:
+            del user["password"]
+
+        return user
@@ -0,0 +1,102 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+from config import settings
+
+
+class TTLCache:
+    """
+    크기 제한이 있는 TTL + LRU 캐시
+
+    항목은 저장 시점부터 ttl초 동안 유효하며, maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거됩니다.
+    호출자가 반환값을 수정해도 캐시 내용이 바뀌지 않도록 저장/조회 시 얕은 복사를 사용합니다.
+    프로세스별 캐시이므로 다른 워커의 변경은 TTL이 지나야 반영됩니다.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+        return copy.copy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 저장"""
+        if self.maxsize <= 0:
+            return
+        entry = (time.monotonic() + self.ttl, copy.copy(value))
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """항목 무효화"""
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """전체 무효화"""
+        with self._lock:
+            self.invalidations += len(self._data)
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+# 엔티티별 캐시
+post_cache = TTLCache("posts", maxsize=settings.POST_CACHE_SIZE, ttl=settings.CACHE_TTL)
+user_cache = TTLCache("users", maxsize=settings.USER_CACHE_SIZE, ttl=settings.CACHE_TTL)
+
+_caches = [post_cache, user_cache]
+
+
+def register_cache(cache: TTLCache) -> None:
+    """통계 조회 대상 캐시 등록"""
+    _caches.append(cache)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """전체 캐시 통계 조회"""
+    return {cache.name: cache.stats() for cache in _caches}
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from config import settings
+from utils.cache import TTLCache, register_cache
+from utils.database import execute_query_async
+
+logger = logging.getLogger(__name__)
+
+POST_COUNT_QUERY = """
+SELECT COUNT(*) AS total FROM posts WHERE deleted_at IS NULL
+"""
+
+# 게시물별 건수 키 (PostRepository.get_post_counts 결과와 같은 형태)
+PER_POST_KEYS = {"comments": "comment_count", "files": "file_count"}
+
+
+class CountProvider:
+    """
+    테이블/게시물별 건수 제공자
+
+    목록 응답의 전체 건수를 요청마다 COUNT(*)로 구하지 않도록 메모리에 건수를 유지합니다.
+    - 게시물 전체 건수: 생성/소프트 삭제 경로가 record()로 증감을 반영하고,
+      reconcile_interval초마다 DB와 다시 맞춤 (재집계 중 들어온 증감은 기록해 두었다가 새 값에 다시 적용)
+    - 게시물별 댓글/파일 수: 목록/상세 조회가 이미 가져온 값을 최근 사용한 게시물만 TTL 캐시에 보관
+      (해당 게시물에 변경이 생기면 무효화하고, 다른 워커의 변경은 TTL이 지나면 반영)
+    - 아직 DB와 맞춘 적이 없거나 캐시에 없으면 None, 맞춘 값이 오래되었거나 맞추는 도중 변경이 있었으면 approximate=True
+    """
+
+    def __init__(self, reconcile_interval: float, tracked_posts: int):
+        self.reconcile_interval = reconcile_interval
+        self._lock = threading.Lock()
+        self._tables: Dict[str, int] = {}
+        self._per_post = TTLCache("post_counts", maxsize=tracked_posts, ttl=reconcile_interval)
+        register_cache(self._per_post)
+        self._reconciled_at: Optional[float] = None
+        self._reconciling = False
+        self._journal: List[Tuple[str, int]] = []  # 재집계 중 들어온 (테이블, 증감)
+        self._changed_during_reconcile = False
+        self.reconcile_count = 0
+        self.reconcile_errors = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, table: str, delta: int, post_id: Optional[int] = None) -> None:
+        """생성(+)/삭제(-)에 따른 건수 증감 반영"""
+        with self._lock:
+            if table in self._tables:
+                self._tables[table] = max(0, self._tables[table] + delta)
+            if self._reconciling:
+                self._journal.append((table, delta))
+                self._changed_during_reconcile = True
+        if post_id is not None and table in PER_POST_KEYS:
+            self._per_post.invalidate(post_id)
+
+    def forget_post(self, post_id: int) -> None:
+        """게시물 삭제 시 해당 게시물의 댓글/파일 건수 제거"""
+        self._per_post.invalidate(post_id)
+
+    def remember_posts(self, post_ids: List[int], counts: Dict[int, Dict[str, int]]) -> None:
+        """조회한 게시물별 댓글/파일 수 보관 (counts에 없는 게시물은 0건)"""
+        for post_id in post_ids:
+            post_counts = counts.get(post_id, {})
+            self._per_post.set(post_id, {key: post_counts.get(key, 0) for key in PER_POST_KEYS.values()})
+
+    def _approximate(self) -> bool:
+        stale = time.monotonic() - self._reconciled_at > self.reconcile_interval * 2
+        return stale or self._changed_during_reconcile
+
+    def table_count(self, table: str) -> Optional[Tuple[int, bool]]:
+        """테이블 전체 건수 (건수, approximate)"""
+        with self._lock:
+            if self._reconciled_at is None or table not in self._tables:
+                return None
+            return self._tables[table], self._approximate()
+
+    def post_count(self, table: str, post_id: int) -> Optional[Tuple[int, bool]]:
+        """게시물별 댓글/파일 건수 (건수, approximate), 보관 중이 아니면 None"""
+        post_counts = self._per_post.get(post_id)
+        if post_counts is None or table not in PER_POST_KEYS:
+            return None
+        return post_counts[PER_POST_KEYS[table]], False
+
+    async def reconcile(self) -> None:
+        """DB 건수로 다시 맞춤 (주기 작업에서 호출)"""
+        with self._lock:
+            self._reconciling = True
+            self._journal = []
+            self._changed_during_reconcile = False
+        try:
+            post_rows = await execute_query_async(POST_COUNT_QUERY)
+            with self._lock:
+                tables = {"posts": int(post_rows[0]["total"]) if post_rows else 0}
+                # 집계 중 들어온 증감을 새 값에 다시 적용
+                for table, delta in self._journal:
+                    if table in tables:
+                        tables[table] = max(0, tables[table] + delta)
+                self._tables = tables
+                self._reconciled_at = time.monotonic()
+                self.reconcile_count += 1
+        except Exception:
+            with self._lock:
+                # 기존 값을 그대로 쓰므로 재집계 중 증감은 이미 반영되어 있음
+                self._changed_during_reconcile = False
+            self.reconcile_errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._reconciling = False
+                self._journal = []
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.error("Count reconcile failed: %s", e)
+            await asyncio.sleep(self.reconcile_interval)
+
+    async def start(self) -> None:
+        """주기적 재집계 작업 시작 (lifespan 시작 시 호출, 첫 집계는 백그라운드에서 바로 실행)"""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """재집계 작업 종료 (lifespan 종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tables": dict(self._tables),
+                "tracked_posts": self._per_post.stats()["size"],
+                "seconds_since_reconcile": (
+                    round(time.monotonic() - self._reconciled_at, 1) if self._reconciled_at is not None else None
+                ),
+                "approximate": self._approximate() if self._reconciled_at is not None else None,
+                "reconcile_count": self.reconcile_count,
+                "reconcile_errors": self.reconcile_errors,
+            }
+
+
+# 전역 건수 제공자
+count_provider = CountProvider(
+    reconcile_interval=settings.COUNT_RECONCILE_INTERVAL,
+    tracked_posts=settings.COUNT_TRACKED_POSTS
+)
@@ -1,23 +1,107 @@
+from contextlib import contextmanager, asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import oracledb
-from contextlib import contextmanager
 from config import settings
+from utils.pool import pool_manager
+from utils.transaction import current_unit_of_work, commit, rollback, commit_async, rollback_async
 
-# 데이터베이스 연결 풀 생성
-pool = None
+# ---------------------------------------------------------------------------
+# 쿼리 실행 보조 함수
+# ---------------------------------------------------------------------------
+
+def _columns(cursor) -> Tuple[str, ...]:
+    return tuple(col[0] for col in cursor.description)
+
+def row_to_dict(cursor, row) -> Optional[Dict[str, Any]]:
+    """커서에서 조회한 한 행을 딕셔너리로 변환"""
+    if row is None:
+        return None
+    return dict(zip(_columns(cursor), row))
+
+def rows_to_dicts(cursor, rows: Iterable[tuple]) -> List[Dict[str, Any]]:
+    """커서에서 조회한 행들을 딕셔너리 리스트로 변환 (컬럼 목록은 커서당 한 번만 계산)"""
+    columns = _columns(cursor)
+    return [dict(zip(columns, row)) for row in rows]
+
+def _apply_fetch_hints(cursor, arraysize: Optional[int], prefetchrows: Optional[int]) -> None:
+    """
+    조회 건수에 맞춘 fetch 크기 설정
+
+    arraysize만 지정하면 prefetchrows는 arraysize + 1로 맞춰,
+    마지막 행 이후 종료 확인을 위한 추가 왕복이 생기지 않도록 합니다.
+    """
+    if arraysize:
+        cursor.arraysize = arraysize
+        cursor.prefetchrows = prefetchrows if prefetchrows is not None else arraysize + 1
+    elif prefetchrows is not None:
+        cursor.prefetchrows = prefetchrows
+
+@lru_cache(maxsize=256)
+def _update_statement(table: str, columns: Tuple[str, ...], key_param: str) -> str:
+    set_clause = ", ".join(f"{column} = :{column}" for column in columns)
+    return f"""
+    UPDATE {table}
+    SET {set_clause}, modified_at = CURRENT_TIMESTAMP
+    WHERE id = :{key_param} AND deleted_at IS NULL
+    """
+
+def build_update_query(table: str, data: Dict[str, Any], key_param: str) -> str:
+    """
+    부분 수정용 UPDATE 문 생성
+
+    컬럼 집합별로 SQL 문자열을 캐시하고 컬럼 순서를 정렬하므로,
+    같은 컬럼을 수정하는 요청은 항상 동일한 SQL 텍스트를 사용해 문장 캐시를 재사용합니다.
+    """
+    return _update_statement(table, tuple(sorted(data)), key_param)
+
+# Oracle IN 목록에 허용되는 최대 항목 수
+MAX_IN_LIST = 1000
+
+def in_clause(values: List[Any], prefix: str = "id") -> Tuple[str, Dict[str, Any]]:
+    """
+    IN 절 바인드 변수 생성 (":id0, :id1, ..." 와 바인드 딕셔너리 반환)
+
+    바인드 개수를 2의 거듭제곱으로 올리고 마지막 값으로 채워서,
+    목록 길이가 달라도 SQL 텍스트가 몇 가지로만 만들어지도록 합니다 (문장 캐시 재사용).
+    """
+    size = 1
+    while size < len(values):
+        size *= 2
+    size = max(min(size, MAX_IN_LIST), len(values))
+    padded = list(values) + [values[-1]] * (size - len(values))
+    binds = {f"{prefix}{index}": value for index, value in enumerate(padded)}
+    return ", ".join(":" + name for name in binds), binds
+
+class BatchError(Exception):
+    """배열 DML 중 일부 행이 실패했을 때 발생 (트랜잭션 전체가 롤백된 상태)"""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self.errors = errors
+        super().__init__(f"{len(errors)} row(s) failed in batch")
+
+def _batch_errors(cursor) -> List[Dict[str, Any]]:
+    """batcherrors 모드에서 실패한 행의 위치와 오류 메시지"""
+    return [{"index": error.offset, "message": error.message} for error in cursor.getbatcherrors()]
+
+def _bind_returning_ids(cursor, returning: str, size: int):
+    """RETURNING ... INTO 로 생성된 id를 받을 배열 변수 바인딩"""
+    id_var = cursor.var(oracledb.DB_TYPE_NUMBER, arraysize=size)
+    cursor.setinputsizes(**{returning: id_var})
+    return id_var
+
+def _returned_ids(id_var, size: int) -> List[int]:
+    return [int(id_var.getvalue(index)[0]) for index in range(size)]
+
+# ---------------------------------------------------------------------------
+# 동기 경로
+# ---------------------------------------------------------------------------
 
 def init_db():
     """애플리케이션 시작 시 연결 풀 초기화"""
-    global pool
     try:
-        pool = oracledb.create_pool(
-            user=settings.DB_USER,
-            password=settings.DB_PASSWORD,
-            dsn=f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_SERVICE}",
-            min=2,  # 최소 연결 수
-            max=10,  # 최대 연결 수
-            increment=1,  # 증가 단계
-            getmode=oracledb.POOL_GETMODE_WAIT
-        )
+        pool_manager.init_pool()
         print("Database pool created successfully")
     except Exception as e:
         print(f"Error creating database pool: {e}")
@@ -25,38 +109,231 @@ def init_db():
 
 @contextmanager
 def get_connection():
-    """데이터베이스 연결을 제공하는 컨텍스트 매니저"""
+    """
+    데이터베이스 연결을 제공하는 컨텍스트 매니저
+
+    작업 단위(utils.transaction) 안이면 그 연결을 그대로 제공하며, 반환은 작업 단위가 끝날 때 합니다.
+    """
+    uow = current_unit_of_work()
+    if uow is not None:
+        yield uow.get_connection()
+        return
     connection = None
     try:
-        if pool is None:
-            init_db()
-        connection = pool.acquire()
+        connection = pool_manager.acquire()
         yield connection
     except Exception as e:
         print(f"Database connection error: {e}")
         raise
     finally:
         if connection:
-            pool.release(connection)
+            pool_manager.release(connection)
+
+def execute_query(query, params=None, fetch=True, arraysize=None, prefetchrows=None):
+    """
+    쿼리 실행 헬퍼 함수
 
-def execute_query(query, params=None, fetch=True):
-    """쿼리 실행 헬퍼 함수"""
+    Args:
+        arraysize: 한 번의 왕복으로 가져올 행 수 (목록 조회 시 페이지 크기 등)
+        prefetchrows: execute 시점에 미리 가져올 행 수 (기본값: arraysize + 1)
+    """
     with get_connection() as connection:
         cursor = connection.cursor()
         try:
+            if fetch:
+                _apply_fetch_hints(cursor, arraysize or settings.DB_FETCH_ARRAYSIZE, prefetchrows)
             cursor.execute(query, params or {})
             if fetch:
-                result = cursor.fetchall()
-                # 컬럼 이름 가져오기
-                columns = [col[0] for col in cursor.description]
                 # 결과를 딕셔너리 리스트로 변환
-                return [dict(zip(columns, row)) for row in result]
+                return rows_to_dicts(cursor, cursor.fetchall())
+            else:
+                commit(connection)
+                return cursor.rowcount
+        except Exception as e:
+            rollback(connection)
+            print(f"Query execution error: {e}")
+            raise
+        finally:
+            cursor.close()
+
+def execute_query_one(query, params=None) -> Optional[Dict[str, Any]]:
+    """단건 조회 헬퍼 함수 - execute 한 번의 왕복으로 결과와 종료 여부를 함께 가져옴"""
+    result = execute_query(query, params, arraysize=1, prefetchrows=2)
+    return result[0] if result else None
+
+def execute_many(query, rows):
+    """배열 바인딩 DML 헬퍼 함수 - 여러 행을 한 번의 왕복으로 실행하고 커밋"""
+    if not rows:
+        return 0
+    with get_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            cursor.executemany(query, rows)
+            commit(connection)
+            return cursor.rowcount
+        except Exception as e:
+            rollback(connection)
+            print(f"Query execution error: {e}")
+            raise
+        finally:
+            cursor.close()
+
+def execute_many_returning(query, rows, returning: str = "new_id") -> List[int]:
+    """
+    배열 바인딩 INSERT 헬퍼 함수
+
+    모든 행을 executemany 한 번으로 실행하고 `RETURNING id INTO :<returning>`으로 생성된 id 목록을 반환합니다.
+    batcherrors 모드로 실행하여 실패한 행을 모두 모은 뒤, 하나라도 있으면 전체를 롤백하고 BatchError를 발생시킵니다.
+    """
+    if not rows:
+        return []
+    with get_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            id_var = _bind_returning_ids(cursor, returning, len(rows))
+            cursor.executemany(query, rows, batcherrors=True)
+            errors = _batch_errors(cursor)
+            if errors:
+                rollback(connection)
+                raise BatchError(errors)
+            commit(connection)
+            return _returned_ids(id_var, len(rows))
+        except BatchError:
+            raise
+        except Exception as e:
+            rollback(connection)
+            print(f"Query execution error: {e}")
+            raise
+        finally:
+            cursor.close()
+
+# ---------------------------------------------------------------------------
+# 비동기 경로
+# ---------------------------------------------------------------------------
+
+def init_async_db():
+    """애플리케이션 시작 시 비동기 연결 풀 초기화 (thin 모드)"""
+    try:
+        pool_manager.init_async_pool()
+        print("Async database pool created successfully")
+    except Exception as e:
+        print(f"Error creating async database pool: {e}")
+        raise
+
+async def close_async_db():
+    """애플리케이션 종료 시 비동기 연결 풀 정리"""
+    await pool_manager.close_async()
+
+def close_db():
+    """애플리케이션 종료 시 연결 풀 정리"""
+    pool_manager.close()
+
+# shared_async_connection 범위에서 함께 쓰는 비동기 연결
+_shared_async_connection: ContextVar = ContextVar("shared_async_connection", default=None)
+
+@asynccontextmanager
+async def get_async_connection():
+    """비동기 데이터베이스 연결을 제공하는 컨텍스트 매니저 (작업 단위/공유 범위 안이면 그 연결을 제공)"""
+    uow = current_unit_of_work()
+    if uow is not None:
+        yield await uow.get_async_connection()
+        return
+    shared = _shared_async_connection.get()
+    if shared is not None:
+        yield shared
+        return
+    connection = None
+    try:
+        connection = await pool_manager.acquire_async()
+        yield connection
+    except Exception as e:
+        print(f"Database connection error: {e}")
+        raise
+    finally:
+        if connection:
+            await pool_manager.release_async(connection)
+
+@asynccontextmanager
+async def shared_async_connection():
+    """
+    범위 안의 비동기 조회가 연결 하나를 함께 사용하도록 고정 (트랜잭션 처리 없음)
+
+    asyncio.gather로 여러 조회를 동시에 실행해도 풀 연결은 하나만 점유합니다.
+    한 연결의 요청은 드라이버가 순서대로 처리하므로 요청당 연결 수가 쿼리 수에 비례해 늘지 않습니다.
+    """
+    if current_unit_of_work() is not None or _shared_async_connection.get() is not None:
+        yield
+        return
+    async with get_async_connection() as connection:
+        token = _shared_async_connection.set(connection)
+        try:
+            yield
+        finally:
+            _shared_async_connection.reset(token)
+
+async def execute_query_async(query, params=None, fetch=True, arraysize=None, prefetchrows=None):
+    """비동기 쿼리 실행 헬퍼 함수 (인자는 execute_query와 동일)"""
+    async with get_async_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            if fetch:
+                _apply_fetch_hints(cursor, arraysize or settings.DB_FETCH_ARRAYSIZE, prefetchrows)
+            await cursor.execute(query, params or {})
+            if fetch:
+                # 결과를 딕셔너리 리스트로 변환
+                return rows_to_dicts(cursor, await cursor.fetchall())
             else:
-                connection.commit()
+                await commit_async(connection)
                 return cursor.rowcount
         except Exception as e:
-            connection.rollback()
+            await rollback_async(connection)
+            print(f"Query execution error: {e}")
+            raise
+        finally:
+            cursor.close()
+
+async def execute_query_one_async(query, params=None) -> Optional[Dict[str, Any]]:
+    """비동기 단건 조회 헬퍼 함수"""
+    result = await execute_query_async(query, params, arraysize=1, prefetchrows=2)
+    return result[0] if result else None
+
+async def execute_many_async(query, rows):
+    """비동기 배열 바인딩 DML 헬퍼 함수"""
+    if not rows:
+        return 0
+    async with get_async_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            await cursor.executemany(query, rows)
+            await commit_async(connection)
+            return cursor.rowcount
+        except Exception as e:
+            await rollback_async(connection)
+            print(f"Query execution error: {e}")
+            raise
+        finally:
+            cursor.close()
+
+async def execute_many_returning_async(query, rows, returning: str = "new_id") -> List[int]:
+    """비동기 배열 바인딩 INSERT 헬퍼 함수 (동작은 execute_many_returning과 동일)"""
+    if not rows:
+        return []
+    async with get_async_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            id_var = _bind_returning_ids(cursor, returning, len(rows))
+            await cursor.executemany(query, rows, batcherrors=True)
+            errors = _batch_errors(cursor)
+            if errors:
+                await rollback_async(connection)
+                raise BatchError(errors)
+            await commit_async(connection)
+            return _returned_ids(id_var, len(rows))
+        except BatchError:
+            raise
+        except Exception as e:
+            await rollback_async(connection)
             print(f"Query execution error: {e}")
             raise
         finally:
-            cursor.close()
\ No newline at end of file
+            cursor.close()
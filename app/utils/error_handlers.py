@@ -9,6 +9,10 @@ from typing import Any, Dict, Optional
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+def _request_fields(request: Request) -> Dict[str, Any]:
+    """구조화 로그에 함께 남길 요청 정보"""
+    return {"method": request.method, "path": request.url.path}
+
 def setup_error_handlers(app: FastAPI) -> None:
     """애플리케이션에 에러 핸들러 설정"""
     
@@ -24,7 +28,7 @@ def setup_error_handlers(app: FastAPI) -> None:
                 "type": error["type"]
             })
         
-        logger.warning(f"Validation error: {errors}")
+        logger.warning("Validation error: %s", errors, extra=_request_fields(request))
         
         return JSONResponse(
             status_code=422,
@@ -37,7 +41,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(JWTError)
     async def jwt_exception_handler(request: Request, exc: JWTError) -> JSONResponse:
         """JWT 관련 오류 핸들러"""
-        logger.warning(f"JWT error: {str(exc)}")
+        logger.warning("JWT error: %s", exc, extra=_request_fields(request))
         
         return JSONResponse(
             status_code=401,
@@ -50,7 +54,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     async def integrity_exception_handler(request: Request, exc: IntegrityError) -> JSONResponse:
         """데이터베이스 무결성 제약 오류 핸들러"""
         error_message = str(exc)
-        logger.error(f"Database integrity error: {error_message}")
+        logger.error("Database integrity error: %s", error_message, extra=_request_fields(request))
         
         # 중복 키 오류 처리
         if "ORA-00001" in error_message:  # 고유 제약 조건 위반
@@ -73,7 +77,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(SQLAlchemyError)
     async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
         """SQLAlchemy 오류 핸들러"""
-        logger.error(f"Database error: {str(exc)}")
+        logger.error("Database error: %s", exc, extra=_request_fields(request))
         
         return JSONResponse(
             status_code=500,
@@ -85,7 +89,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
         """일반 예외 핸들러"""
-        logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
+        logger.error("Unhandled exception: %s", exc, exc_info=True, extra=_request_fields(request))
         
         return JSONResponse(
             status_code=500,
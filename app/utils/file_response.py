@@ -0,0 +1,230 @@
+import os
+import stat
+import uuid
+from email.utils import formatdate, parsedate_to_datetime
+from typing import List, Optional, Tuple
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+
+# 파일을 읽어 보내는 단위 (zerocopysend 확장이 없는 서버, 즉 현재 uvicorn에서는 항상 사용)
+CHUNK_SIZE = 256 * 1024
+# 한 요청에서 처리할 최대 범위 수 (넘으면 Range를 무시하고 전체 전송)
+MAX_RANGES = 16
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+def parse_range_header(range_header: str, file_size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Range 헤더 해석
+
+    겹치거나 이어지는 범위는 합쳐서 (start, end) 목록(end 포함)으로 반환합니다.
+    해석할 수 없는 헤더는 None(무시하고 200 전송), 만족하는 범위가 없으면 빈 목록(416)을 반환합니다.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+
+    ranges = []
+    for part in spec.split(","):
+        start_text, dash, end_text = part.strip().partition("-")
+        start_text, end_text = start_text.strip(), end_text.strip()
+        if not dash or not (start_text.isdigit() or end_text.isdigit()):
+            return None
+        if start_text and end_text and not (start_text.isdigit() and end_text.isdigit()):
+            return None
+        if not start_text:  # 마지막 N바이트
+            suffix = int(end_text)
+            if suffix == 0:
+                continue
+            start, end = max(file_size - suffix, 0), file_size - 1
+        else:
+            start = int(start_text)
+            if end_text and int(end_text) < start:
+                return None
+            end = min(int(end_text), file_size - 1) if end_text else file_size - 1
+        if start < file_size:
+            ranges.append((start, end))
+
+    if len(ranges) > MAX_RANGES:
+        return None
+
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def etag_matches(header: str, etag: str, weak: bool) -> bool:
+    """If-None-Match(약한 비교) / If-Range(강한 비교)용 ETag 비교"""
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if weak and candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified_since(header: str, mtime: float) -> bool:
+    try:
+        return int(mtime) <= parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return False
+
+
+class RangedFileResponse(FileResponse):
+    """
+    조건부 요청과 Range 요청을 지원하는 파일 응답
+
+    - 강한 ETag (내용 해시가 있으면 해시, 없으면 크기/수정 시각 기반)와 Last-Modified
+    - If-None-Match / If-Modified-Since 일치 시 304
+    - 단일 범위는 206, 여러 범위는 multipart/byteranges, 만족할 수 없는 범위는 416
+    - 본문은 CHUNK_SIZE 단위로 읽어 전송 (Starlette FileResponse와 같은 방식)
+
+    서버가 ASGI `http.response.zerocopysend` 확장을 제공할 때만 파일 디스크립터를 넘기는데,
+    requirements.txt에 고정된 uvicorn(0.23)은 이 확장을 제공하지 않으므로 운영 환경에서는 항상
+    청크 단위 읽기/전송 경로를 사용합니다 (zero-copy 전송이 아님).
+    """
+
+    def __init__(self, path: str, content_hash: Optional[str] = None, **kwargs):
+        self.content_hash = content_hash
+        super().__init__(path, **kwargs)
+
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        if self.content_hash:
+            etag = f'"{self.content_hash}"'
+        else:
+            etag = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+        self.headers.setdefault("content-length", str(stat_result.st_size))
+        self.headers.setdefault("last-modified", formatdate(stat_result.st_mtime, usegmt=True))
+        self.headers.setdefault("etag", etag)
+        self.headers.setdefault("accept-ranges", "bytes")
+
+    def _is_not_modified(self, request_headers: Headers, stat_result: os.stat_result) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            return etag_matches(if_none_match, self.headers["etag"], weak=True)
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since is not None:
+            return not_modified_since(if_modified_since, stat_result.st_mtime)
+        return False
+
+    def _range_allowed(self, request_headers: Headers, stat_result: os.stat_result) -> bool:
+        """If-Range가 현재 파일과 맞지 않으면 Range를 무시하고 전체 전송"""
+        if_range = request_headers.get("if-range")
+        if if_range is None:
+            return True
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            return etag_matches(if_range, self.headers["etag"], weak=False)
+        return not_modified_since(if_range, stat_result.st_mtime)
+
+    async def __call__(self, scope, receive, send) -> None:
+        stat_result = self.stat_result
+        if stat_result is None:
+            try:
+                stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+            except FileNotFoundError:
+                raise RuntimeError(f"File at path {self.path} does not exist.")
+            if not stat.S_ISREG(stat_result.st_mode):
+                raise RuntimeError(f"File at path {self.path} is not a file.")
+            self.set_stat_headers(stat_result)
+
+        request_headers = Headers(scope=scope)
+        method = scope.get("method", "GET")
+        if method == "HEAD":
+            self.send_header_only = True
+        file_size = stat_result.st_size
+
+        if method in ("GET", "HEAD") and self._is_not_modified(request_headers, stat_result):
+            await self._send_empty(send, 304, drop=("content-length", "content-type", "content-disposition"))
+            return
+
+        ranges = None
+        range_header = request_headers.get("range")
+        if range_header and method in ("GET", "HEAD") and self._range_allowed(request_headers, stat_result):
+            ranges = parse_range_header(range_header, file_size)
+
+        if ranges is not None and not ranges:
+            self.headers["content-range"] = f"bytes */{file_size}"
+            self.headers["content-length"] = "0"
+            await self._send_empty(send, 416, drop=("content-disposition",))
+            return
+
+        if not ranges or ranges == [(0, file_size - 1)]:
+            await self._send_start(send, self.status_code)
+            await self._send_parts(scope, send, [(None, 0, file_size)])
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.headers["content-range"] = f"bytes {start}-{end}/{file_size}"
+            self.headers["content-length"] = str(end - start + 1)
+            await self._send_start(send, 206)
+            await self._send_parts(scope, send, [(None, start, end - start + 1)])
+        else:
+            boundary = uuid.uuid4().hex
+            parts = []
+            content_length = 0
+            for start, end in ranges:
+                header = (
+                    f"--{boundary}\r\n"
+                    f"Content-Type: {self.media_type}\r\n"
+                    f"Content-Range: bytes {start}-{end}/{file_size}\r\n\r\n"
+                ).encode("latin-1")
+                parts.append((header, start, end - start + 1))
+                content_length += len(header) + end - start + 1 + 2
+            closing = f"--{boundary}--\r\n".encode("latin-1")
+            content_length += len(closing)
+            self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+            self.headers["content-length"] = str(content_length)
+            await self._send_start(send, 206)
+            await self._send_parts(scope, send, parts, closing)
+
+        if self.background is not None:
+            await self.background()
+
+    async def _send_start(self, send, status_code: int) -> None:
+        await send({"type": "http.response.start", "status": status_code, "headers": self.raw_headers})
+
+    async def _send_empty(self, send, status_code: int, drop: Tuple[str, ...] = ()) -> None:
+        for name in drop:
+            if name in self.headers:
+                del self.headers[name]
+        await self._send_start(send, status_code)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _send_parts(self, scope, send, parts, closing: bytes = b"") -> None:
+        """(파트 헤더, 시작 위치, 길이) 목록을 순서대로 전송"""
+        if self.send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        zerocopy = ZEROCOPY_EXTENSION in scope.get("extensions", {})
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            for header, offset, count in parts:
+                if header:
+                    await send({"type": "http.response.body", "body": header, "more_body": True})
+                if zerocopy:
+                    await send({
+                        "type": ZEROCOPY_EXTENSION,
+                        "file": file.wrapped.fileno(),
+                        "offset": offset,
+                        "count": count,
+                        "more_body": True,
+                    })
+                else:
+                    await file.seek(offset)
+                    remaining = count
+                    while remaining > 0:
+                        chunk = await file.read(min(CHUNK_SIZE, remaining))
+                        if not chunk:
+                            break
+                        remaining -= len(chunk)
+                        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                if header:
+                    await send({"type": "http.response.body", "body": b"\r\n", "more_body": True})
+        await send({"type": "http.response.body", "body": closing, "more_body": False})
@@ -1,13 +1,201 @@
 import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
 import time
 import json
-from typing import Dict, Any, Callable
+from datetime import datetime, timezone
+from typing import Dict, Any, Callable, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# LogRecord 기본 속성 (이외의 속성은 extra로 넘어온 구조화 필드로 취급)
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 객체로 출력 (extra로 넘긴 필드도 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """"logger=비율,logger=비율" 형식의 샘플링 설정 해석"""
+    rates = {}
+    for item in value.split(","):
+        name, _, rate = item.partition("=")
+        if name.strip() and rate.strip():
+            rates[name.strip()] = min(max(float(rate), 0.0), 1.0)
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """
+    로거별 INFO 이하 로그 샘플링
+
+    로거 이름(또는 상위 로거 이름)에 설정된 비율만큼만 남기며, WARNING 이상은 항상 남깁니다.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._resolved: Dict[str, float] = {}
+        self.sampled_out = 0
+
+    def _rate(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate, candidate = 1.0, name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self._rate(record.name)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    크기 제한 큐에 로그 레코드를 넣는 핸들러
+
+    큐가 가득 차면 기다리지 않고 버린 뒤 건수만 셉니다.
+    메시지 포맷팅은 리스너 스레드에서 하므로 레코드는 복사만 하고 인자를 그대로 넘깁니다
+    (같은 프로세스 안의 큐이므로 직렬화할 필요가 없음).
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # 큐가 가득 차 있어도 리스너가 비우는 중이므로 기다렸다가 종료 신호를 넣음
+        self.queue.put(self._sentinel)
+
+
+class LogPipeline:
+    """
+    큐 기반 비차단 로깅
+
+    루트 로거에는 BoundedQueueHandler만 두고, 실제 출력(stdout)은 백그라운드 리스너 스레드가 합니다.
+    stdout/디스크가 느려져도 요청 스레드와 이벤트 루프는 큐에 넣기만 하므로 지연되지 않으며,
+    큐가 가득 차면 로그를 버리고 dropped로 집계합니다.
+    gunicorn preload처럼 설정 후 fork되는 경우 자식 프로세스에서 큐와 리스너를 새로 만듭니다.
+    """
+
+    def __init__(self):
+        self.handler: Optional[BoundedQueueHandler] = None
+        self.sampler: Optional[SamplingFilter] = None
+        self.listener: Optional[_QueueListener] = None
+        self._output: Optional[logging.Handler] = None
+        self._queue_size = 0
+        self._lock = threading.Lock()
+
+    def configure(self, level: str = "INFO", fmt: str = "json", queue_size: int = 10000,
+                  sample_rates: Optional[Dict[str, float]] = None) -> None:
+        """루트 로거를 큐 핸들러로 교체하고 리스너 시작 (애플리케이션 시작 시 한 번 호출)"""
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JSONFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+        with self._lock:
+            self._stop_listener()
+            root = logging.getLogger()
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+            self._queue_size = queue_size
+            self._output = output
+            self.sampler = SamplingFilter(sample_rates or {})
+            self.handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size))
+            self.handler.addFilter(self.sampler)
+            root.addHandler(self.handler)
+            root.setLevel(getattr(logging, level.upper(), logging.INFO))
+            self._start_listener()
+
+    def _start_listener(self) -> None:
+        self.listener = _QueueListener(self.handler.queue, self._output, respect_handler_level=True)
+        self.listener.start()
+
+    def _stop_listener(self) -> None:
+        if self.listener is not None:
+            self.listener.stop()  # 큐에 남은 레코드를 모두 출력한 뒤 종료
+            self.listener = None
+
+    def _after_fork(self) -> None:
+        # 부모의 리스너 스레드는 자식에 없으므로 새 큐와 리스너로 교체
+        self._lock = threading.Lock()
+        if self.listener is not None:
+            self.handler.queue = queue.Queue(maxsize=self._queue_size)
+            self.handler.dropped = 0
+            self.sampler.sampled_out = 0
+            self._start_listener()
+
+    def stop(self) -> None:
+        """남은 로그를 출력하고 리스너 종료 (프로세스 종료 시 호출, 이후 로그는 바로 출력)"""
+        with self._lock:
+            if self.listener is None:
+                return
+            self._stop_listener()
+            root = logging.getLogger()
+            root.removeHandler(self.handler)
+            root.addHandler(self._output)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "configured": self.handler is not None,
+            "queued": self.handler.queue.qsize() if self.handler else 0,
+            "queue_size": self._queue_size,
+            "dropped": self.handler.dropped if self.handler else 0,
+            "sampled_out": self.sampler.sampled_out if self.sampler else 0,
+        }
+
+
+# 전역 로깅 파이프라인
+log_pipeline = LogPipeline()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=log_pipeline._after_fork)
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """
     요청 및 응답에 대한 로깅을 수행하는 미들웨어
@@ -22,10 +210,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         request_path = request.url.path
         request_method = request.method
         
-        # 요청 로그
-        logger.info(
-            f"Started {request_method} {request_path} for {client_ip} [Request ID: {request_id}]"
-        )
+        # 요청 로그 (메시지 포맷팅은 출력 시점에 수행)
+        fields = {"request_id": request_id, "method": request_method, "path": request_path, "client_ip": client_ip}
+        logger.info("Started %s %s for %s [Request ID: %s]",
+                    request_method, request_path, client_ip, request_id, extra=fields)
         
         # 응답 처리
         try:
@@ -33,10 +221,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             process_time = time.time() - start_time
             
             # 응답 로그
-            logger.info(
-                f"Completed {response.status_code} {request_method} {request_path} "
-                f"in {process_time:.3f}s [Request ID: {request_id}]"
-            )
+            logger.info("Completed %s %s %s in %.3fs [Request ID: %s]",
+                        response.status_code, request_method, request_path, process_time, request_id,
+                        extra={**fields, "status": response.status_code,
+                               "duration_ms": round(process_time * 1000, 3)})
             
             # 응답 헤더에 처리 시간 추가
             response.headers["X-Process-Time"] = f"{process_time:.3f}"
@@ -44,20 +232,20 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             return response
         except Exception as e:
             process_time = time.time() - start_time
-            logger.error(
-                f"Error during {request_method} {request_path}: {str(e)} "
-                f"in {process_time:.3f}s [Request ID: {request_id}]"
-            )
+            logger.error("Error during %s %s: %s in %.3fs [Request ID: %s]",
+                         request_method, request_path, e, process_time, request_id,
+                         extra={**fields, "duration_ms": round(process_time * 1000, 3)})
             raise
 
 def log_request_info(request_data: Dict[str, Any], user_id: int = None) -> None:
     """
     요청 데이터를 로깅하는 유틸리티 함수
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     masked_data = mask_sensitive_data(request_data)
-    logger.info(
-        f"Request data from user {user_id or 'anonymous'}: {json.dumps(masked_data)}"
-    )
+    logger.info("Request data from user %s: %s", user_id or "anonymous", masked_data,
+                extra={"user_id": user_id, "request_data": masked_data})
 
 def mask_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
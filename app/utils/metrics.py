@@ -0,0 +1,188 @@
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Tuple
+from utils.file_response import ZEROCOPY_EXTENSION
+from utils.query_stats import track_queries
+
+# 응답 시간 히스토그램 구간 (초)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 응답 크기 히스토그램 구간 (바이트)
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+# 요청당 DB 문장 수 히스토그램 구간 (N+1 회귀 탐지용)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# 라우트를 찾지 못한 요청(404 등)은 경로별로 나누지 않고 하나로 집계 (레이블 수 제한)
+UNMATCHED_ROUTE = "<unmatched>"
+
+# 그 외 메서드는 OTHER로 집계
+KNOWN_METHODS = frozenset(("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"))
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Histogram:
+    """누적 전 구간별 건수만 보관하는 히스토그램 (출력 시 누적)"""
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막 칸은 +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def render(self, name: str, labels: str, lines: List[str]) -> None:
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.total}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+
+
+class _RouteStats:
+    __slots__ = ("duration", "size", "queries", "statuses")
+
+    def __init__(self):
+        self.duration = _Histogram(DURATION_BUCKETS)
+        self.size = _Histogram(SIZE_BUCKETS)
+        self.queries = _Histogram(QUERY_COUNT_BUCKETS)
+        self.statuses: Dict[int, int] = {}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    HTTP 요청 지표 저장소
+
+    이벤트 루프 안에서만 갱신되므로 잠금 없이 딕셔너리/리스트 연산만 수행합니다.
+    지표는 워커 프로세스별로 집계됩니다.
+    """
+
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], _RouteStats] = {}
+        self.in_progress: Dict[str, int] = {}
+
+    def observe(self, method: str, route: str, status: int, duration: float, size: int, queries: int = 0) -> None:
+        stats = self._routes.get((method, route))
+        if stats is None:
+            stats = self._routes[(method, route)] = _RouteStats()
+        stats.duration.observe(duration)
+        stats.size.observe(size)
+        stats.queries.observe(queries)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력"""
+        routes = sorted(self._routes.items())
+        lines = [
+            "# HELP http_requests_total Total HTTP requests by route and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route), stats in routes:
+            for status, count in sorted(stats.statuses.items()):
+                lines.append(
+                    f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}'
+                )
+
+        lines += [
+            "# HELP http_request_duration_seconds HTTP request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), stats in routes:
+            stats.duration.render(
+                "http_request_duration_seconds", f'method="{method}",route="{_escape(route)}"', lines
+            )
+
+        lines += [
+            "# HELP http_response_size_bytes HTTP response body size by route.",
+            "# TYPE http_response_size_bytes histogram",
+        ]
+        for (method, route), stats in routes:
+            stats.size.render("http_response_size_bytes", f'method="{method}",route="{_escape(route)}"', lines)
+
+        lines += [
+            "# HELP http_request_db_queries Database statements executed per request by route.",
+            "# TYPE http_request_db_queries histogram",
+        ]
+        for (method, route), stats in routes:
+            stats.queries.render("http_request_db_queries", f'method="{method}",route="{_escape(route)}"', lines)
+
+        lines += [
+            "# HELP http_requests_in_progress HTTP requests currently being processed.",
+            "# TYPE http_requests_in_progress gauge",
+        ]
+        for method, count in sorted(self.in_progress.items()):
+            lines.append(f'http_requests_in_progress{{method="{method}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def _route_template(scope) -> str:
+    """라우팅이 끝난 scope에서 경로 템플릿 추출 (/api/posts/{post_id} 형태)"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path_format
+    if "app_root_path" in scope:  # 마운트된 앱 (정적 파일 등)
+        return scope["root_path"] + "/{path}"
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    요청 지표 수집 (순수 ASGI 미들웨어)
+
+    BaseHTTPMiddleware와 달리 요청/응답을 감싸는 태스크나 스트림을 만들지 않고
+    send 메시지만 지켜보며 상태 코드, 응답 크기, 처리 시간, 실행한 DB 문장 수를 기록합니다.
+    경로는 라우팅 후 scope에 남은 라우트 템플릿을 레이블로 사용하므로 경로 파라미터 값이 레이블 수를 늘리지 않습니다.
+    """
+
+    def __init__(self, app: Callable, registry: MetricsRegistry = None):
+        self.app = app
+        self.registry = registry or metrics_registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        method = scope["method"]
+        if method not in KNOWN_METHODS:
+            method = "OTHER"
+        in_progress = registry.in_progress
+        in_progress[method] = in_progress.get(method, 0) + 1
+        start = time.perf_counter()
+        status = 500  # 응답 시작 전에 예외가 나면 500으로 기록
+        size = 0
+
+        async def tracked_send(message):
+            nonlocal status, size
+            message_type = message["type"]
+            if message_type == "http.response.body":
+                size += len(message.get("body", b""))
+            elif message_type == "http.response.start":
+                status = message["status"]
+            elif message_type == ZEROCOPY_EXTENSION:
+                size += message.get("count") or 0
+            await send(message)
+
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, tracked_send)
+            finally:
+                in_progress[method] -= 1
+                registry.observe(
+                    method, _route_template(scope), status, time.perf_counter() - start, size, queries.count
+                )
+
+
+# 전역 지표 저장소
+metrics_registry = MetricsRegistry()
@@ -1,4 +1,6 @@
-from utils.database import execute_query, get_connection
+from utils.database import execute_query, get_connection, rows_to_dicts
+from utils.pagination import CursorParams, keyset_clause
+from utils.transaction import commit, rollback
 from typing import List, Dict, Any, Optional
 
 class OracleUtils:
@@ -12,16 +14,14 @@ class OracleUtils:
             cursor = conn.cursor()
             try:
                 cursor.execute(query, params or {})
-                conn.commit()
+                commit(conn)
                 
                 # 결과 반환이 있는 경우 (REF CURSOR)
                 if cursor.description:
-                    result = cursor.fetchall()
-                    columns = [col[0] for col in cursor.description]
-                    return [dict(zip(columns, row)) for row in result]
+                    return rows_to_dicts(cursor, cursor.fetchall())
                 return None
             except Exception as e:
-                conn.rollback()
+                rollback(conn)
                 raise e
             finally:
                 cursor.close()
@@ -38,7 +38,7 @@ class OracleUtils:
         params = params or {}
         params.update({"offset": offset, "limit": page_size})
         
-        return execute_query(paginated_query, params)
+        return execute_query(paginated_query, params, arraysize=page_size)
     
     @staticmethod
     def use_rownum_pagination(query: str, page: int, page_size: int, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
@@ -59,7 +59,29 @@ class OracleUtils:
         params = params or {}
         params.update({"min_row": min_row, "max_row": max_row})
         
-        return execute_query(paginated_query, params)
+        return execute_query(paginated_query, params, arraysize=page_size)
+    
+    @staticmethod
+    def use_keyset_pagination(query: str, cursor_params: CursorParams, params: Dict[str, Any] = None,
+                              descending: bool = True) -> List[Dict[str, Any]]:
+        """Oracle 키셋(seek) 페이지네이션 - (created_at, id) 기준
+
+        query의 결과에 created_at, id 컬럼이 있어야 합니다.
+        결과는 keyset_paginate()로 변환하여 사용합니다.
+        """
+        condition, order, keyset_params = keyset_clause("q", cursor_params, descending)
+        paginated_query = f"""
+        SELECT *
+        FROM ({query}) q
+        WHERE 1 = 1 {condition}
+        ORDER BY q.created_at {order}, q.id {order}
+        FETCH FIRST :limit ROWS ONLY
+        """
+
+        params = params or {}
+        params.update(keyset_params)
+
+        return execute_query(paginated_query, params, arraysize=cursor_params.fetch_size)
     
     @staticmethod
     def handle_clob(clob_data):
@@ -1,8 +1,11 @@
-from typing import Generic, TypeVar, List, Dict, Any, Optional
+from typing import Generic, TypeVar, List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
 from pydantic.generics import GenericModel
-from fastapi import Query
+from fastapi import Query, HTTPException
+from datetime import datetime
 from math import ceil
+import base64
+import json
 
 T = TypeVar('T')
 
@@ -51,4 +54,137 @@ def paginate(
     return {
         "items": items,
         "metadata": metadata
-    }
\ No newline at end of file
+    }
+
+# ---------------------------------------------------------------------------
+# 커서(keyset) 기반 페이지네이션
+# OFFSET 방식은 건너뛴 행도 읽어야 하므로 뒤 페이지로 갈수록 느려짐.
+# 마지막으로 본 (created_at, id) 이후부터 읽으면 페이지 위치와 무관하게 비용이 일정함.
+# ---------------------------------------------------------------------------
+
+CURSOR_NEXT = "next"
+CURSOR_PREV = "prev"
+
+def encode_cursor(created_at: datetime, item_id: int, direction: str = CURSOR_NEXT) -> str:
+    """(created_at, id) 키를 불투명한 커서 토큰으로 인코딩"""
+    payload = json.dumps(
+        {"c": created_at.isoformat(), "i": item_id, "d": direction},
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(token: str) -> Tuple[datetime, int, str]:
+    """커서 토큰을 (created_at, id, direction)으로 디코딩"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        direction = payload["d"]
+        if direction not in (CURSOR_NEXT, CURSOR_PREV):
+            raise ValueError(direction)
+        return datetime.fromisoformat(payload["c"]), int(payload["i"]), direction
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+class CursorParams:
+    """커서 기반 페이지네이션 파라미터"""
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 또는 prev_cursor"),
+        page_size: int = Query(20, ge=1, le=100, description="페이지 크기")
+    ):
+        self.cursor = cursor
+        self.page_size = page_size
+        self.direction = CURSOR_NEXT
+        self.after: Optional[Tuple[datetime, int]] = None
+        if cursor:
+            created_at, item_id, self.direction = decode_cursor(cursor)
+            self.after = (created_at, item_id)
+
+    @property
+    def fetch_size(self) -> int:
+        """다음 페이지 존재 여부 확인을 위해 한 건 더 조회"""
+        return self.page_size + 1
+
+class CursorPageMetadata(BaseModel):
+    """커서 페이지네이션 메타데이터"""
+    page_size: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    has_next: bool
+    has_prev: bool
+    total_items: Optional[int] = None  # 건수를 아직 알 수 없으면 None
+    approximate: bool = False
+
+class CursorPage(Page[T], Generic[T]):
+    """커서 페이지네이션된 결과를 위한 응답 모델 (Page와 같은 형태, 메타데이터만 커서용)"""
+    metadata: CursorPageMetadata
+
+def keyset_clause(alias: str, cursor_params: CursorParams, descending: bool = True) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    (created_at, id) 키셋 조건절 생성
+
+    Returns:
+        (WHERE 절에 덧붙일 조건, ORDER BY 방향, 바인드 파라미터)
+    """
+    # prev 방향은 반대 순서로 조회한 뒤 keyset_paginate에서 뒤집음
+    forward = cursor_params.direction == CURSOR_NEXT
+    ascending = forward != descending
+    order = "ASC" if ascending else "DESC"
+    params: Dict[str, Any] = {"limit": cursor_params.fetch_size}
+
+    if cursor_params.after is None:
+        return "", order, params
+
+    op = ">" if ascending else "<"
+    condition = (
+        f"AND ({alias}.created_at {op} :cursor_created_at "
+        f"OR ({alias}.created_at = :cursor_created_at AND {alias}.id {op} :cursor_id))"
+    )
+    params["cursor_created_at"], params["cursor_id"] = cursor_params.after
+    return condition, order, params
+
+def _item_key(item: Any) -> Tuple[datetime, int]:
+    if isinstance(item, dict):
+        return item["created_at"], item["id"]
+    return item.created_at, item.id
+
+def keyset_paginate(
+    items: List[Any],
+    cursor_params: CursorParams,
+    total: Optional[Tuple[int, bool]] = None
+) -> Dict[str, Any]:
+    """
+    커서 조회 결과를 페이지네이션된 결과로 변환
+
+    items는 레포지토리가 조회한 순서 그대로(최대 page_size + 1건) 전달합니다.
+    이전 페이지 조회(prev)는 역순으로 조회되므로 여기서 다시 뒤집습니다.
+    total은 count_provider가 반환한 (건수, approximate)입니다.
+    """
+    has_more = len(items) > cursor_params.page_size
+    items = list(items[:cursor_params.page_size])
+
+    if cursor_params.direction == CURSOR_PREV:
+        items.reverse()
+        has_prev = has_more
+        has_next = cursor_params.after is not None
+    else:
+        has_next = has_more
+        has_prev = cursor_params.after is not None
+
+    next_cursor = encode_cursor(*_item_key(items[-1]), CURSOR_NEXT) if items and has_next else None
+    prev_cursor = encode_cursor(*_item_key(items[0]), CURSOR_PREV) if items and has_prev else None
+
+    metadata = CursorPageMetadata(
+        page_size=cursor_params.page_size,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+        has_next=has_next,
+        has_prev=has_prev,
+        total_items=total[0] if total else None,
+        approximate=total[1] if total else False
+    )
+
+    return {
+        "items": items,
+        "metadata": metadata
+    }
@@ -1,7 +1,27 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from fastapi import HTTPException
 from passlib.context import CryptContext
+from config import settings
 
-# 비밀번호 해싱을 위한 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _create_context(rounds: int) -> CryptContext:
+    # min/max를 기본값과 같게 두어 cost가 바뀌면 기존 해시가 needs_update 대상이 되도록 함
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+# 비밀번호 해싱을 위한 설정 (애플리케이션 전체에서 이 컨텍스트 하나만 사용)
+pwd_context = _create_context(settings.BCRYPT_ROUNDS)
 
 def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
@@ -9,4 +29,160 @@ def get_password_hash(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+def _load_backend() -> int:
+    """해싱 프로세스에서 bcrypt 백엔드를 미리 불러옴 (워밍업용)"""
+    pwd_context.handler("bcrypt").get_backend()
+    return os.getpid()
+
+def needs_rehash(hashed_password: str) -> bool:
+    """현재 bcrypt cost와 다른 해시인지 확인 (로그인 시 재해싱 판단용)"""
+    return pwd_context.needs_update(hashed_password)
+
+
+class PasswordHasher:
+    """
+    bcrypt 연산 전용 프로세스 풀
+
+    bcrypt는 CPU를 오래 점유하므로 요청 스레드/이벤트 루프가 아닌 별도 프로세스에서 실행합니다.
+    처리 중 + 대기 중인 작업 수가 workers + max_queue를 넘으면 503으로 즉시 거절하여,
+    로그인 폭주가 다른 엔드포인트까지 지연시키지 않도록 합니다.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.rejected = 0
+        self._latency: Dict[str, Dict[str, float]] = {
+            "hash": {"count": 0, "total": 0.0, "max": 0.0},
+            "verify": {"count": 0, "total": 0.0, "max": 0.0},
+        }
+
+    def start(self) -> None:
+        """프로세스 풀 생성 (lifespan 시작 시 호출)"""
+        with self._lock:
+            if self._executor is None:
+                # 스레드를 가진 부모 프로세스에서 fork하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+
+    async def warm_up(self) -> int:
+        """
+        해싱 프로세스를 미리 생성 (spawn 방식이라 프로세스마다 모듈 import 비용이 큼)
+
+        작업을 workers개 동시에 넣으면 놀고 있는 프로세스가 없으므로 workers개까지 새로 만들어집니다.
+        """
+        if self._executor is None:
+            self.start()
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(
+            *(loop.run_in_executor(self._executor, _load_backend) for _ in range(self.workers))
+        )
+        return len(set(pids))
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료 (lifespan 종료 시 호출)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _record(self, operation: str, elapsed: float) -> None:
+        with self._lock:
+            latency = self._latency[operation]
+            latency["count"] += 1
+            latency["total"] += elapsed
+            if elapsed > latency["max"]:
+                latency["max"] = elapsed
+
+    async def _submit(self, operation: str, func: Callable, *args: Any) -> Any:
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="Password hashing is busy, please retry",
+                    headers={"Retry-After": "1"}
+                )
+            self._in_flight += 1
+        if self._executor is None:
+            self.start()
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._record(operation, time.perf_counter() - start)
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해싱 (프로세스 풀)"""
+        return await self._submit("hash", get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (프로세스 풀)"""
+        return await self._submit("verify", verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 깊이 및 지연 시간 통계"""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - self.workers),
+                "rejected": self.rejected,
+                "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+                "latency": {
+                    operation: {
+                        "count": int(latency["count"]),
+                        "avg_ms": round(latency["total"] * 1000 / latency["count"], 3) if latency["count"] else 0.0,
+                        "max_ms": round(latency["max"] * 1000, 3),
+                    }
+                    for operation, latency in self._latency.items()
+                },
+            }
+
+
+# 전역 비밀번호 해싱 풀
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
+def calibrate_rounds(target_ms: float, min_rounds: int = 10, max_rounds: int = 16, samples: int = 3) -> int:
+    """목표 지연 시간 이내에서 가장 높은 bcrypt cost 찾기"""
+    best = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        context = _create_context(rounds)
+        start = time.perf_counter()
+        for _ in range(samples):
+            context.hash("calibration-password")
+        elapsed_ms = (time.perf_counter() - start) * 1000 / samples
+        print(f"rounds={rounds}: {elapsed_ms:.1f} ms")
+        if elapsed_ms > target_ms:
+            break
+        best = rounds
+    return best
+
+
+if __name__ == "__main__":
+    # 사용 예: python -m utils.password --target-ms 250
+    import argparse
+
+    parser = argparse.ArgumentParser(description="목표 지연 시간에 맞는 bcrypt cost 계산")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="해시 1회 목표 시간 (밀리초)")
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=16)
+    args = parser.parse_args()
+
+    rounds = calibrate_rounds(args.target_ms, args.min_rounds, args.max_rounds)
+    print(f"BCRYPT_ROUNDS={rounds}")
@@ -0,0 +1,256 @@
+import time
+import asyncio
+import logging
+import threading
+import oracledb
+from typing import Dict, Any
+from config import settings
+from utils.query_stats import InstrumentedConnection, InstrumentedAsyncConnection
+
+logger = logging.getLogger(__name__)
+
+# CLOB(게시물/댓글 content)을 LOB 객체 대신 문자열로 바로 가져옴 (동기/비동기 경로 모두, 추가 왕복 없음)
+oracledb.defaults.fetch_lobs = False
+
+# 풀 대기 시간 초과 오류 코드 (thin / thick 모드)
+POOL_TIMEOUT_ERROR_CODES = ("DPY-4005", "ORA-24457")
+
+
+def is_pool_timeout(error: Exception) -> bool:
+    """연결 풀 대기 시간 초과 오류인지 확인"""
+    if not isinstance(error, oracledb.Error) or not error.args:
+        return False
+    full_code = getattr(error.args[0], "full_code", "") or ""
+    return full_code in POOL_TIMEOUT_ERROR_CODES
+
+
+class PoolStats:
+    """연결 획득 통계 (대기 시간, 타임아웃, 오류)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.acquires = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_acquire(self, wait: float) -> None:
+        with self._lock:
+            self.acquires += 1
+            self.total_wait += wait
+            if wait > self.max_wait:
+                self.max_wait = wait
+
+    def record_error(self, error: Exception) -> None:
+        with self._lock:
+            if is_pool_timeout(error):
+                self.timeouts += 1
+            else:
+                self.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "acquires": self.acquires,
+                "timeouts": self.timeouts,
+                "errors": self.errors,
+                "wait_time_total_ms": round(self.total_wait * 1000, 3),
+                "wait_time_avg_ms": round(self.total_wait * 1000 / self.acquires, 3) if self.acquires else 0.0,
+                "wait_time_max_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class PoolManager:
+    """
+    애플리케이션 전역 연결 풀 관리자
+
+    ORM 경로(models.engine)와 직접 쿼리 경로(utils.database)가 같은 oracledb 풀을 공유하며,
+    비동기 경로는 별도의 비동기 풀을 사용합니다. 풀 크기는 Settings에서 읽어옵니다.
+    """
+
+    def __init__(self):
+        self.pool = None
+        self.async_pool = None
+        self.stats = PoolStats()
+        self.async_stats = PoolStats()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _pool_params() -> Dict[str, Any]:
+        return {
+            "user": settings.DB_USER,
+            "password": settings.DB_PASSWORD,
+            "dsn": f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_SERVICE}",
+            "increment": settings.DB_POOL_INCREMENT,
+            "getmode": oracledb.POOL_GETMODE_TIMEDWAIT,
+            "wait_timeout": settings.DB_POOL_TIMEOUT * 1000,  # 밀리초 단위
+            "max_lifetime_session": settings.DB_POOL_RECYCLE,
+            "stmtcachesize": settings.DB_STMT_CACHE_SIZE,
+        }
+
+    def init_pool(self):
+        """동기 연결 풀 생성"""
+        with self._lock:
+            if self.pool is None:
+                self.pool = oracledb.create_pool(
+                    min=settings.DB_POOL_MIN,
+                    max=settings.DB_POOL_MAX,
+                    connectiontype=InstrumentedConnection if settings.DB_QUERY_STATS_ENABLED else None,
+                    **self._pool_params()
+                )
+                logger.info(
+                    "Database pool created (min=%s, max=%s)", settings.DB_POOL_MIN, settings.DB_POOL_MAX
+                )
+        return self.pool
+
+    def init_async_pool(self):
+        """비동기 연결 풀 생성 (thin 모드)"""
+        if self.async_pool is None:
+            self.async_pool = oracledb.create_pool_async(
+                min=settings.DB_ASYNC_POOL_MIN,
+                max=settings.DB_ASYNC_POOL_MAX,
+                connectiontype=InstrumentedAsyncConnection if settings.DB_QUERY_STATS_ENABLED else None,
+                **self._pool_params()
+            )
+            logger.info(
+                "Async database pool created (min=%s, max=%s)",
+                settings.DB_ASYNC_POOL_MIN, settings.DB_ASYNC_POOL_MAX
+            )
+        return self.async_pool
+
+    def split_for_workers(self, workers: int, max_sessions: int = None) -> None:
+        """
+        워커 프로세스 수에 맞춰 프로세스별 풀 크기 조정
+
+        모든 워커의 동기/비동기 풀 최대 크기 합이 max_sessions(Oracle 세션 한도)를 넘으면
+        설정된 동기/비동기 비율을 유지하며 워커당 크기를 줄입니다.
+        풀을 만들기 전(gunicorn 마스터 프로세스에서 fork 전)에 호출해야 합니다.
+        """
+        if max_sessions is None:
+            max_sessions = settings.DB_MAX_SESSIONS
+        per_worker = settings.DB_POOL_MAX + settings.DB_ASYNC_POOL_MAX
+        if max_sessions <= 0 or workers * per_worker <= max_sessions:
+            return
+        budget = max_sessions // workers
+        if budget < 2:
+            raise ValueError(
+                f"DB_MAX_SESSIONS={max_sessions} is too small for {workers} workers (need at least 2 per worker)"
+            )
+        sync_max = min(max(budget * settings.DB_POOL_MAX // per_worker, 1), budget - 1)
+        async_max = budget - sync_max
+        settings.DB_POOL_MAX = sync_max
+        settings.DB_POOL_MIN = min(settings.DB_POOL_MIN, sync_max)
+        settings.DB_ASYNC_POOL_MAX = async_max
+        settings.DB_ASYNC_POOL_MIN = min(settings.DB_ASYNC_POOL_MIN, async_max)
+        logger.warning(
+            "Pool sizes reduced for %s workers within %s sessions (per worker: sync max=%s, async max=%s)",
+            workers, max_sessions, sync_max, async_max
+        )
+
+    def acquire(self):
+        """동기 풀에서 연결 획득 (SQLAlchemy creator로도 사용)"""
+        pool = self.pool or self.init_pool()
+        start = time.perf_counter()
+        try:
+            connection = pool.acquire()
+        except Exception as e:
+            self.stats.record_error(e)
+            raise
+        self.stats.record_acquire(time.perf_counter() - start)
+        return connection
+
+    def release(self, connection) -> None:
+        """동기 풀에 연결 반환"""
+        self.pool.release(connection)
+
+    async def acquire_async(self):
+        """비동기 풀에서 연결 획득"""
+        pool = self.async_pool or self.init_async_pool()
+        start = time.perf_counter()
+        try:
+            connection = await pool.acquire()
+        except Exception as e:
+            self.async_stats.record_error(e)
+            raise
+        self.async_stats.record_acquire(time.perf_counter() - start)
+        return connection
+
+    async def release_async(self, connection) -> None:
+        """비동기 풀에 연결 반환"""
+        await self.async_pool.release(connection)
+
+    def warm_up(self) -> None:
+        """최소 연결 수만큼 연결을 열고 ping하여 첫 요청의 연결 비용을 제거"""
+        pool = self.pool or self.init_pool()
+        connections = []
+        try:
+            for _ in range(pool.min):
+                connection = pool.acquire()
+                connections.append(connection)
+                connection.ping()
+        finally:
+            for connection in connections:
+                pool.release(connection)
+        logger.info("Database pool warmed up (%s connections)", len(connections))
+
+    async def warm_up_async(self) -> None:
+        """비동기 풀 워밍업"""
+        pool = self.async_pool or self.init_async_pool()
+        connections = []
+        try:
+            for _ in range(pool.min):
+                connections.append(await pool.acquire())
+            await asyncio.gather(*(connection.ping() for connection in connections))
+        finally:
+            for connection in connections:
+                await pool.release(connection)
+        logger.info("Async database pool warmed up (%s connections)", len(connections))
+
+    def close(self) -> None:
+        """동기 연결 풀 종료"""
+        if self.pool is not None:
+            try:
+                self.pool.close()
+            except oracledb.Error:
+                # 사용 중인 연결이 남아 있으면 강제 종료
+                self.pool.close(force=True)
+            self.pool = None
+            logger.info("Database pool closed")
+
+    async def close_async(self) -> None:
+        """비동기 연결 풀 종료"""
+        if self.async_pool is not None:
+            try:
+                await self.async_pool.close()
+            except oracledb.Error:
+                await self.async_pool.close(force=True)
+            self.async_pool = None
+            logger.info("Async database pool closed")
+
+    @staticmethod
+    def _pool_snapshot(pool, stats: PoolStats) -> Dict[str, Any]:
+        snapshot = {"initialized": pool is not None}
+        if pool is not None:
+            busy = pool.busy
+            opened = pool.opened
+            snapshot.update({
+                "min": pool.min,
+                "max": pool.max,
+                "opened": opened,
+                "busy": busy,
+                "idle": opened - busy,
+            })
+        snapshot.update(stats.snapshot())
+        return snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 및 획득 통계 조회"""
+        return {
+            "sync": self._pool_snapshot(self.pool, self.stats),
+            "async": self._pool_snapshot(self.async_pool, self.async_stats),
+        }
+
+
+# 전역 풀 관리자
+pool_manager = PoolManager()
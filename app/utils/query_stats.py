@@ -0,0 +1,232 @@
+import heapq
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+import oracledb
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w:.])\d+(?:\.\d+)?\b")
+# IN (:id0, :id1, ...) 처럼 개수만 다른 바인드 목록은 하나로 묶음
+_BIND_LIST = re.compile(r"\(\s*:\w+(?:\s*,\s*:\w+)+\s*\)")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """리터럴과 바인드 목록 길이를 지운 SQL (통계 집계 키)"""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _BIND_LIST.sub("(:...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def bind_metadata(parameters: Any) -> Dict[str, Any]:
+    """로그용 바인드 정보 (값은 남기지 않고 이름과 타입만 기록)"""
+    if isinstance(parameters, list) and parameters and isinstance(parameters[0], (dict, list, tuple)):
+        return {"rows": len(parameters), "binds": bind_metadata(parameters[0])["binds"]}
+    if isinstance(parameters, dict):
+        return {"binds": {name: type(value).__name__ for name, value in parameters.items()}}
+    if isinstance(parameters, (list, tuple)):
+        return {"binds": [type(value).__name__ for value in parameters]}
+    return {"binds": None}
+
+
+class QueryCounter:
+    """요청 또는 코드 블록 안에서 실행된 문장 수/시간"""
+    __slots__ = ("count", "total_time", "statements")
+
+    def __init__(self, keep_statements: bool = False):
+        self.count = 0
+        self.total_time = 0.0
+        self.statements: Optional[List[str]] = [] if keep_statements else None
+
+    def add(self, sql: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        if self.statements is not None:
+            self.statements.append(sql)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """query_budget 블록에서 허용 개수보다 많은 문장이 실행됨"""
+
+
+class QueryStats:
+    """
+    문장별 실행 통계
+
+    정규화된 SQL별 실행 횟수/총 시간/최대 시간과 가장 느린 문장 상위 N개를 보관하고,
+    slow_threshold_ms를 넘는 문장은 바인드 정보(이름/타입)와 함께 경고 로그를 남깁니다.
+    동기 경로는 스레드 풀에서 실행되므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, slow_threshold_ms: float, top_n: int):
+        self.slow_threshold = slow_threshold_ms / 1000
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self._statements: Dict[str, List[float]] = {}  # sql -> [count, total, max]
+        self._slowest: List[tuple] = []  # (duration, seq, entry) 최소 힙
+        self._seq = 0
+        self._watchers: List[QueryCounter] = []
+
+    def record(self, statement: Optional[str], duration: float, parameters: Any = None) -> None:
+        sql = normalize_sql(statement or "")
+        counter = _current_counter.get()
+        if counter is not None:
+            counter.add(sql, duration)
+        with self._lock:
+            stats = self._statements.get(sql)
+            if stats is None:
+                self._statements[sql] = [1, duration, duration]
+            else:
+                stats[0] += 1
+                stats[1] += duration
+                if duration > stats[2]:
+                    stats[2] = duration
+            for watcher in self._watchers:
+                watcher.add(sql, duration)
+            if duration < self.slow_threshold:
+                return
+            self._seq += 1
+            entry = {
+                "sql": sql,
+                "duration_ms": round(duration * 1000, 3),
+                "at": time.time(),
+                **bind_metadata(parameters),
+            }
+            if len(self._slowest) < self.top_n:
+                heapq.heappush(self._slowest, (duration, self._seq, entry))
+            elif self.top_n and duration > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, (duration, self._seq, entry))
+        logger.warning("Slow query (%sms): %s %s", entry["duration_ms"], sql, entry.get("binds"))
+
+    def snapshot(self, limit: int = 20) -> Dict[str, Any]:
+        """총 실행 시간 상위 문장과 가장 느린 문장 목록"""
+        with self._lock:
+            statements = sorted(self._statements.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+            slowest = [entry for _, _, entry in sorted(self._slowest, reverse=True)]
+        return {
+            "slow_threshold_ms": self.slow_threshold * 1000,
+            "statements": [
+                {
+                    "sql": sql,
+                    "count": int(count),
+                    "total_ms": round(total * 1000, 3),
+                    "avg_ms": round(total * 1000 / count, 3),
+                    "max_ms": round(maximum * 1000, 3),
+                }
+                for sql, (count, total, maximum) in statements
+            ],
+            "slowest": slowest,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self._slowest.clear()
+
+    def _watch(self, counter: QueryCounter) -> None:
+        with self._lock:
+            self._watchers.append(counter)
+
+    def _unwatch(self, counter: QueryCounter) -> None:
+        with self._lock:
+            self._watchers.remove(counter)
+
+
+# 전역 쿼리 통계
+query_stats = QueryStats(settings.SLOW_QUERY_THRESHOLD_MS, settings.SLOW_QUERY_TOP_N)
+
+# 현재 요청의 쿼리 카운터 (스레드 풀/gather 태스크에도 컨텍스트가 복사되어 같은 카운터에 집계됨)
+_current_counter: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+@contextmanager
+def track_queries():
+    """현재 컨텍스트(요청)에서 실행되는 문장 수 집계"""
+    counter = QueryCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    """
+    블록 안에서 실행된 문장 수가 max_queries를 넘으면 QueryBudgetExceeded 발생 (테스트용)
+
+    TestClient처럼 요청이 다른 스레드에서 처리되어도 집계되도록 프로세스 전체의 문장을 셉니다.
+
+        with query_budget(3):
+            client.get("/api/posts/")
+    """
+    counter = QueryCounter(keep_statements=True)
+    query_stats._watch(counter)
+    try:
+        yield counter
+    finally:
+        query_stats._unwatch(counter)
+    if counter.count > max_queries:
+        statements = "\n".join(f"  {index + 1}. {sql}" for index, sql in enumerate(counter.statements))
+        raise QueryBudgetExceeded(f"Expected at most {max_queries} queries, got {counter.count}:\n{statements}")
+
+
+# ---------------------------------------------------------------------------
+# oracledb 커서 계측 (연결 풀의 connectiontype으로 지정)
+# ORM 엔진도 같은 풀에서 연결을 받으므로 ORM/직접 쿼리 경로가 모두 집계됨
+# ---------------------------------------------------------------------------
+
+class InstrumentedCursor(oracledb.Cursor):
+    def execute(self, statement, parameters=None, **keyword_parameters):
+        start = time.perf_counter()
+        try:
+            return super().execute(statement, parameters, **keyword_parameters)
+        finally:
+            query_stats.record(statement or self.statement, time.perf_counter() - start,
+                               parameters or keyword_parameters)
+
+    def executemany(self, statement, parameters, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().executemany(statement, parameters, *args, **kwargs)
+        finally:
+            query_stats.record(statement or self.statement, time.perf_counter() - start, parameters)
+
+
+class InstrumentedAsyncCursor(oracledb.AsyncCursor):
+    async def execute(self, statement, parameters=None, **keyword_parameters):
+        start = time.perf_counter()
+        try:
+            return await super().execute(statement, parameters, **keyword_parameters)
+        finally:
+            query_stats.record(statement or self.statement, time.perf_counter() - start,
+                               parameters or keyword_parameters)
+
+    async def executemany(self, statement, parameters, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await super().executemany(statement, parameters, *args, **kwargs)
+        finally:
+            query_stats.record(statement or self.statement, time.perf_counter() - start, parameters)
+
+
+class InstrumentedConnection(oracledb.Connection):
+    def cursor(self, scrollable: bool = False) -> InstrumentedCursor:
+        self._verify_connected()
+        return InstrumentedCursor(self, scrollable)
+
+
+class InstrumentedAsyncConnection(oracledb.AsyncConnection):
+    def cursor(self, scrollable: bool = False) -> InstrumentedAsyncCursor:
+        self._verify_connected()
+        return InstrumentedAsyncCursor(self, scrollable)
@@ -0,0 +1,319 @@
+import asyncio
+import base64
+import heapq
+import json
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from fastapi import HTTPException, Query
+from config import settings
+from utils.database import execute_query_async
+
+logger = logging.getLogger(__name__)
+
+# 영문/숫자 단어, 한글 음절 연속 구간
+_TOKEN_PATTERN = re.compile(r"[0-9a-z]+|[가-힣]+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]+")
+
+# 필드별 가중치 (제목에 나온 단어를 본문/댓글보다 높게 평가)
+TITLE_WEIGHT = 3
+CONTENT_WEIGHT = 1
+COMMENT_WEIGHT = 1
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+BUILD_POSTS_QUERY = """
+SELECT id, title, content FROM posts WHERE deleted_at IS NULL
+"""
+
+BUILD_COMMENTS_QUERY = """
+SELECT c.id, c.post_id, c.content
+FROM comments c
+JOIN posts p ON c.post_id = p.id AND p.deleted_at IS NULL
+WHERE c.deleted_at IS NULL
+"""
+
+
+def tokenize(text: Optional[str], for_query: bool = False) -> List[str]:
+    """
+    검색용 토큰 분리
+
+    영문/숫자는 소문자 단어 단위, 한글은 띄어쓰기와 조사에 영향을 덜 받도록
+    음절 2-gram 단위로 나눕니다 (한 글자 단어는 그대로 사용).
+    문서 쪽은 한 글자 검색어("글")도 찾을 수 있도록 한글 음절 하나하나도 함께 색인하며,
+    검색어 쪽은 두 글자 이상이면 2-gram만 사용합니다.
+    """
+    if not text:
+        return []
+    tokens = []
+    for match in _TOKEN_PATTERN.findall(str(text).lower()):
+        if _HANGUL_PATTERN.fullmatch(match) and len(match) > 1:
+            tokens.extend(match[index:index + 2] for index in range(len(match) - 1))
+            if not for_query:
+                tokens.extend(match)
+        else:
+            tokens.append(match)
+    return tokens
+
+
+def _field(item: Any, name: str) -> Any:
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def _weighted_terms(*fields: Tuple[Optional[str], int]) -> Counter:
+    terms: Counter = Counter()
+    for text, weight in fields:
+        for token in tokenize(text):
+            terms[token] += weight
+    return terms
+
+
+class _Index:
+    """역색인 본체 (잠금은 SearchIndex가 관리)"""
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.doc_len: Dict[int, int] = {}
+        self.total_len = 0
+        self.post_terms: Dict[int, Counter] = {}
+        self.comment_terms: Dict[int, Tuple[int, Counter]] = {}
+        self.post_comments: Dict[int, set] = {}
+
+    def _add_terms(self, post_id: int, terms: Counter, sign: int) -> None:
+        for term, freq in terms.items():
+            posting = self.postings.setdefault(term, {})
+            value = posting.get(post_id, 0) + sign * freq
+            if value > 0:
+                posting[post_id] = value
+            else:
+                posting.pop(post_id, None)
+                if not posting:
+                    del self.postings[term]
+        length = sum(terms.values()) * sign
+        self.doc_len[post_id] = self.doc_len.get(post_id, 0) + length
+        self.total_len += length
+        if self.doc_len[post_id] <= 0 and post_id not in self.post_terms:
+            self.doc_len.pop(post_id, None)
+
+    def index_post(self, post_id: int, title: Optional[str], content: Optional[str]) -> None:
+        old = self.post_terms.pop(post_id, None)
+        if old:
+            self._add_terms(post_id, old, -1)
+        terms = _weighted_terms((title, TITLE_WEIGHT), (content, CONTENT_WEIGHT))
+        self.post_terms[post_id] = terms
+        self.doc_len.setdefault(post_id, 0)
+        self._add_terms(post_id, terms, 1)
+
+    def remove_post(self, post_id: int) -> None:
+        for comment_id in list(self.post_comments.get(post_id, ())):
+            self.remove_comment(comment_id)
+        old = self.post_terms.pop(post_id, None)
+        if old:
+            self._add_terms(post_id, old, -1)
+        self.doc_len.pop(post_id, None)
+        self.post_comments.pop(post_id, None)
+
+    def index_comment(self, comment_id: int, post_id: int, content: Optional[str]) -> None:
+        self.remove_comment(comment_id)
+        if post_id not in self.post_terms:
+            return  # 삭제되었거나 색인되지 않은 게시물의 댓글
+        terms = _weighted_terms((content, COMMENT_WEIGHT))
+        self.comment_terms[comment_id] = (post_id, terms)
+        self.post_comments.setdefault(post_id, set()).add(comment_id)
+        self._add_terms(post_id, terms, 1)
+
+    def remove_comment(self, comment_id: int) -> None:
+        entry = self.comment_terms.pop(comment_id, None)
+        if entry is None:
+            return
+        post_id, terms = entry
+        self.post_comments.get(post_id, set()).discard(comment_id)
+        if post_id in self.post_terms:
+            self._add_terms(post_id, terms, -1)
+
+    def search(self, terms: List[str], limit: int, after: Optional[Tuple[float, int]]) -> List[Tuple[float, int]]:
+        """BM25 점수 상위 (score, post_id) 목록 (점수 내림차순, 같은 점수는 id 내림차순)"""
+        doc_count = len(self.post_terms)
+        if not doc_count or not terms:
+            return []
+        avg_len = max(self.total_len / doc_count, 1.0)
+        scores: Dict[int, float] = {}
+        for term in set(terms):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for post_id, freq in posting.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len.get(post_id, 0) / avg_len)
+                scores[post_id] = scores.get(post_id, 0.0) + idf * freq * (BM25_K1 + 1) / (freq + norm)
+        ranked = ((round(score, 6), post_id) for post_id, score in scores.items())
+        if after is not None:
+            after_score, after_id = after
+            ranked = (key for key in ranked if key < (after_score, after_id))
+        return heapq.nlargest(limit, ranked)
+
+
+class SearchIndex:
+    """
+    게시물 전문 검색용 프로세스 내 역색인
+
+    게시물 제목/본문과 댓글 내용을 게시물 단위 문서로 색인하고 BM25로 순위를 매깁니다.
+    - 시작 시 build()로 DB 전체를 한 번 읽어 색인 (색인 중 발생한 변경은 완료 후 다시 적용)
+    - 레포지토리의 생성/수정/삭제 메서드가 index_*/remove_*를 호출하여 최신 상태 유지
+    - 색인은 워커 프로세스별이므로 다른 워커의 변경은 재시작(재색인) 전까지 반영되지 않습니다.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._index = _Index()
+        self._ready = False
+        self._building = False
+        self._journal: List[Tuple[Callable, tuple]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def _apply(self, method: Callable, *args: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            method(self._index, *args)
+            if self._building:
+                self._journal.append((method, args))
+
+    def index_post(self, post: Any) -> None:
+        """게시물 색인/재색인 (딕셔너리 또는 ORM 객체)"""
+        if post:
+            self._apply(_Index.index_post, _field(post, "id"), _field(post, "title"), _field(post, "content"))
+
+    def remove_post(self, post_id: int) -> None:
+        """게시물과 그 댓글을 색인에서 제거"""
+        self._apply(_Index.remove_post, post_id)
+
+    def index_comment(self, comment: Any) -> None:
+        """댓글 색인/재색인 (딕셔너리 또는 ORM 객체)"""
+        if comment:
+            self._apply(
+                _Index.index_comment, _field(comment, "id"), _field(comment, "post_id"), _field(comment, "content")
+            )
+
+    def remove_comment(self, comment_id: int) -> None:
+        """댓글을 색인에서 제거"""
+        self._apply(_Index.remove_comment, comment_id)
+
+    def search(self, query: str, limit: int, after: Optional[Tuple[float, int]] = None) -> List[Tuple[float, int]]:
+        """검색어에 대한 (score, post_id) 목록"""
+        if not self._ready:
+            raise HTTPException(
+                status_code=503,
+                detail="Search index is not ready yet",
+                headers={"Retry-After": "5"}
+            )
+        terms = tokenize(query, for_query=True)
+        with self._lock:
+            return self._index.search(terms, limit, after)
+
+    async def build(self) -> None:
+        """DB 전체를 읽어 새 색인을 만든 뒤 교체"""
+        with self._lock:
+            self._building = True
+            self._journal = []
+        try:
+            posts, comments = await asyncio.gather(
+                execute_query_async(BUILD_POSTS_QUERY, arraysize=1000),
+                execute_query_async(BUILD_COMMENTS_QUERY, arraysize=1000),
+            )
+            index = _Index()
+            for post in posts:
+                index.index_post(post["id"], post["title"], post["content"])
+            for comment in comments:
+                index.index_comment(comment["id"], comment["post_id"], comment["content"])
+            with self._lock:
+                # 색인 중 들어온 변경을 새 색인에 다시 적용 (모든 연산은 멱등)
+                for method, args in self._journal:
+                    method(index, *args)
+                self._index = index
+                self._ready = True
+            logger.info("Search index built: %s posts, %s comments", len(posts), len(comments))
+        finally:
+            with self._lock:
+                self._building = False
+                self._journal = []
+
+    async def _run_build(self) -> None:
+        try:
+            await self.build()
+        except Exception as e:
+            logger.error("Search index build failed: %s", e)
+
+    async def start(self) -> None:
+        """백그라운드에서 색인 생성 시작 (lifespan 시작 시 호출, 완료 전 검색은 503)"""
+        if self.enabled:
+            self._task = asyncio.create_task(self._run_build())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "ready": self._ready,
+                "building": self._building,
+                "posts": len(self._index.post_terms),
+                "comments": len(self._index.comment_terms),
+                "terms": len(self._index.postings),
+            }
+
+
+# 전역 검색 색인
+search_index = SearchIndex(enabled=settings.SEARCH_INDEX_ENABLED)
+
+
+def encode_search_cursor(score: float, post_id: int) -> str:
+    """(score, id) 키를 불투명한 커서 토큰으로 인코딩"""
+    payload = json.dumps({"s": score, "i": post_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(token: str) -> Tuple[float, int]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(payload["s"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+class SearchParams:
+    """검색 파라미터 (점수 기반 keyset 페이지네이션)"""
+    def __init__(
+        self,
+        q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+        page_size: int = Query(20, ge=1, le=100, description="페이지 크기")
+    ):
+        self.q = q
+        self.cursor = cursor
+        self.page_size = page_size
+        self.after: Optional[Tuple[float, int]] = decode_search_cursor(cursor) if cursor else None
+
+    @property
+    def fetch_size(self) -> int:
+        """다음 페이지 존재 여부 확인을 위해 한 건 더 조회"""
+        return self.page_size + 1
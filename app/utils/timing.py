@@ -0,0 +1,29 @@
+import time
+from typing import Any, Awaitable, Dict
+
+
+class ServerTiming:
+    """
+    구간별 처리 시간 측정 (Server-Timing 응답 헤더용)
+
+    timing = ServerTiming()
+    post = await timing.measure("post", repository.get_post_by_id(post_id))
+    response.headers["Server-Timing"] = timing.header()
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+
+    async def measure(self, name: str, awaitable: Awaitable) -> Any:
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.durations[name] = (time.perf_counter() - start) * 1000
+
+    def header(self) -> str:
+        total = (time.perf_counter() - self.started) * 1000
+        parts = [f"{name};dur={duration:.1f}" for name, duration in self.durations.items()]
+        parts.append(f"total;dur={total:.1f}")
+        return ", ".join(parts)
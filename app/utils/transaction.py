@@ -1,37 +1,469 @@
-from contextlib import contextmanager
-from utils.database import get_connection
+import asyncio
+import logging
+from contextlib import contextmanager, asynccontextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from utils.pool import pool_manager
+
+logger = logging.getLogger(__name__)
+
+
+class UnitOfWork:
+    """
+    요청(또는 transaction_context) 하나에 걸친 작업 단위
+
+    저장소 메서드는 각자 커밋하는 대신 여기에 합류합니다.
+    직접 쿼리 경로는 처음 필요할 때 풀에서 꺼낸 연결 하나(동기/비동기 각각)를 끝까지 함께 쓰고,
+    ORM 세션은 커밋 대신 flush만 한 뒤 마지막에 한 번 커밋됩니다.
+    건수/검색 색인/캐시 갱신처럼 커밋된 뒤에만 반영해야 하는 작업은 on_commit으로 미뤄 두며,
+    롤백되면 버려집니다. 반대로 파일 이동처럼 롤백 시 되돌려야 하는 작업은 on_rollback으로 등록하며,
+    DB 롤백 직전(행 잠금을 잡고 있는 동안)에 역순으로 실행됩니다.
+    """
+
+    def __init__(self):
+        self.connection = None
+        self.async_connection = None
+        self.sessions: List[Session] = []
+        self.rollback_only = False
+        self._callbacks: List[Callable[[], Any]] = []
+        self._rollback_callbacks: List[Callable[[], Any]] = []
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._savepoints = 0
+
+    # -- 연결 / 세션 합류 ---------------------------------------------------
+
+    def get_connection(self):
+        """동기 연결 (첫 호출 시 풀에서 획득)"""
+        if self.connection is None:
+            self.connection = pool_manager.acquire()
+        return self.connection
+
+    async def get_async_connection(self):
+        """비동기 연결 (첫 호출 시 풀에서 획득, 동시 호출 시 하나만 획득)"""
+        if self.async_connection is None:
+            if self._async_lock is None:
+                self._async_lock = asyncio.Lock()
+            async with self._async_lock:
+                if self.async_connection is None:
+                    self.async_connection = await pool_manager.acquire_async()
+        return self.async_connection
+
+    def join(self, db: Session) -> None:
+        if not any(session is db for session in self.sessions):
+            self.sessions.append(db)
+
+    def owns(self, target) -> bool:
+        return target is not None and (
+            target is self.connection
+            or target is self.async_connection
+            or any(session is target for session in self.sessions)
+        )
+
+    def add_callback(self, callback: Callable[[], Any]) -> None:
+        self._callbacks.append(callback)
+
+    def add_rollback_callback(self, callback: Callable[[], Any]) -> None:
+        self._rollback_callbacks.append(callback)
+
+    def mark(self) -> Tuple[int, int, bool]:
+        """세이브포인트 시점의 상태 (rollback_to에 넘김)"""
+        return len(self._callbacks), len(self._rollback_callbacks), self.rollback_only
+
+    def rollback_to(self, mark: Tuple[int, int, bool]) -> None:
+        """세이브포인트 이후 등록된 작업을 버리고 롤백 작업은 실행"""
+        callbacks, rollback_callbacks, self.rollback_only = mark
+        del self._callbacks[callbacks:]
+        self._run_rollback_callbacks(rollback_callbacks)
+
+    def next_savepoint(self) -> str:
+        self._savepoints += 1
+        return f"uow_sp_{self._savepoints}"
+
+    # -- 종료 ---------------------------------------------------------------
+
+    def _run_callbacks(self) -> None:
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("After-commit callback failed")
+
+    def _run_rollback_callbacks(self, start: int = 0) -> None:
+        callbacks = self._rollback_callbacks[start:]
+        del self._rollback_callbacks[start:]
+        for callback in reversed(callbacks):
+            try:
+                callback()
+            except Exception:
+                logger.exception("Rollback callback failed")
+
+    def _commit_sync(self) -> None:
+        for session in self.sessions:
+            session.commit()
+        if self.connection is not None:
+            self.connection.commit()
+
+    def _rollback_sync(self) -> None:
+        self._run_rollback_callbacks()
+        for session in self.sessions:
+            try:
+                session.rollback()
+            except Exception:
+                logger.exception("Session rollback failed")
+        if self.connection is not None:
+            try:
+                self.connection.rollback()
+            except Exception:
+                logger.exception("Connection rollback failed")
+
+    def _release_sync(self) -> None:
+        if self.connection is not None:
+            pool_manager.release(self.connection)
+            self.connection = None
+
+    def commit(self) -> None:
+        """모든 변경을 커밋한 뒤 on_commit 작업 실행 (rollback_only이면 롤백)"""
+        if self.rollback_only:
+            self.rollback()
+            raise RuntimeError("Unit of work was marked rollback-only")
+        if self.async_connection is not None:
+            raise RuntimeError("Unit of work holds an async connection; use commit_async()")
+        try:
+            self._commit_sync()
+        except Exception:
+            self._rollback_sync()
+            self._callbacks = []
+            raise
+        finally:
+            self._release_sync()
+        self._rollback_callbacks = []
+        self._run_callbacks()
+
+    def rollback(self) -> None:
+        self._callbacks = []
+        self._rollback_sync()
+        self._release_sync()
+
+    async def commit_async(self) -> None:
+        """commit의 비동기 버전 (동기 연결/세션 커밋은 스레드 풀에서 실행)"""
+        if self.rollback_only:
+            await self.rollback_async()
+            raise RuntimeError("Unit of work was marked rollback-only")
+        try:
+            if self.sessions or self.connection is not None:
+                await run_in_threadpool(self._commit_sync)
+            if self.async_connection is not None:
+                await self.async_connection.commit()
+        except Exception:
+            await self.rollback_async()
+            raise
+        self._rollback_callbacks = []
+        await self._release_async()
+        if self.sessions or self.connection is not None:
+            await run_in_threadpool(self._release_sync)
+            # 만료된 ORM 객체를 다시 읽을 수 있으므로 이벤트 루프 밖에서 실행
+            await run_in_threadpool(self._run_callbacks)
+        else:
+            self._run_callbacks()
+
+    async def rollback_async(self) -> None:
+        self._callbacks = []
+        if self._rollback_callbacks:
+            await run_in_threadpool(self._run_rollback_callbacks)
+        if self.async_connection is not None:
+            try:
+                await self.async_connection.rollback()
+            except Exception:
+                logger.exception("Connection rollback failed")
+        await self._release_async()
+        if self.sessions or self.connection is not None:
+            await run_in_threadpool(self._rollback_sync)
+            await run_in_threadpool(self._release_sync)
+
+    async def _release_async(self) -> None:
+        if self.async_connection is not None:
+            await pool_manager.release_async(self.async_connection)
+            self.async_connection = None
+
+
+# 현재 실행 흐름의 작업 단위 (요청 태스크와 그 안에서 호출되는 스레드 풀 작업이 공유)
+_current: ContextVar[Optional[UnitOfWork]] = ContextVar("unit_of_work", default=None)
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    return _current.get()
+
+
+def in_transaction() -> bool:
+    """진행 중인 작업 단위가 있는지 (커밋 전 데이터를 캐시에 넣지 않을 때 사용)"""
+    return _current.get() is not None
+
+
+# ---------------------------------------------------------------------------
+# 커밋 시점 작업
+# ---------------------------------------------------------------------------
+
+def on_commit(callback: Callable[[], Any]) -> None:
+    """
+    커밋된 뒤 실행할 작업 등록
+
+    진행 중인 작업 단위가 없으면(각 메서드가 바로 커밋한 경우) 즉시 실행합니다.
+    """
+    uow = _current.get()
+    if uow is None:
+        callback()
+    else:
+        uow.add_callback(callback)
+
+
+def on_rollback(callback: Callable[[], Any]) -> None:
+    """
+    롤백될 때 실행할 정리 작업 등록 (DB 롤백 직전, 세이브포인트 롤백 포함)
+
+    진행 중인 작업 단위가 없으면 이미 커밋된 것이므로 아무것도 하지 않습니다.
+    """
+    uow = _current.get()
+    if uow is not None:
+        uow.add_rollback_callback(callback)
+
+
+def after_commit(func: Callable) -> Callable:
+    """호출을 on_commit으로 미루는 데코레이터 (저장소의 캐시/건수/색인 갱신 훅용)"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        on_commit(lambda: func(*args, **kwargs))
+    return wrapper
+
+
+# ---------------------------------------------------------------------------
+# 저장소용 커밋/롤백 보조 함수
+# ---------------------------------------------------------------------------
+
+def commit(target) -> None:
+    """
+    연결 또는 세션 커밋
+
+    작업 단위에 속한 연결이면 아무것도 하지 않고(마지막에 한 번 커밋),
+    세션이면 작업 단위에 합류시킨 뒤 flush만 합니다.
+    """
+    uow = _current.get()
+    if uow is None:
+        target.commit()
+    elif isinstance(target, Session):
+        uow.join(target)
+        target.flush()
+    elif not uow.owns(target):
+        target.commit()
+
+
+def rollback(target) -> None:
+    """연결 또는 세션 롤백 (작업 단위 안에서는 전체를 rollback-only로 표시)"""
+    uow = _current.get()
+    if uow is None or not uow.owns(target):
+        target.rollback()
+    else:
+        uow.rollback_only = True
+
+
+async def commit_async(connection) -> None:
+    """비동기 연결 커밋 (작업 단위에 속한 연결이면 생략)"""
+    uow = _current.get()
+    if uow is None or not uow.owns(connection):
+        await connection.commit()
+
+
+async def rollback_async(connection) -> None:
+    """비동기 연결 롤백 (작업 단위 안에서는 전체를 rollback-only로 표시)"""
+    uow = _current.get()
+    if uow is None or not uow.owns(connection):
+        await connection.rollback()
+    else:
+        uow.rollback_only = True
+
+
+# ---------------------------------------------------------------------------
+# 트랜잭션 범위
+# ---------------------------------------------------------------------------
+
+def _execute(connection, statement: str) -> None:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
+async def _execute_async(connection, statement: str) -> None:
+    cursor = connection.cursor()
+    try:
+        await cursor.execute(statement)
+    finally:
+        cursor.close()
+
 
 @contextmanager
 def transaction_context(db: Optional[Session] = None):
     """
     트랜잭션 컨텍스트 매니저
-    
-    ORM 또는 직접 쿼리 모두에서 사용 가능한 트랜잭션 관리
-    
+
+    ORM 또는 직접 쿼리 모두에서 사용 가능한 트랜잭션 관리.
+    가장 바깥 범위는 작업 단위를 만들어 끝날 때 한 번 커밋하고(예외 시 롤백),
+    그 안에서 호출된 저장소 메서드는 같은 연결/세션에 합류합니다.
+    이미 작업 단위 안이면 세이브포인트를 잡아, 예외 시 이 범위의 변경만 되돌립니다.
+
     사용 예:
         with transaction_context(db) as tx:
             # 트랜잭션 내에서 작업 수행
             # 예외가 발생하면 자동으로 롤백
     """
+    uow = _current.get()
+    if uow is None:  # 가장 바깥 범위
+        uow = UnitOfWork()
+        token = _current.set(uow)
+        try:
+            if db:  # ORM 세션 사용
+                uow.join(db)
+                yield db
+            else:  # 직접 연결 사용
+                yield uow.get_connection()
+        except BaseException:
+            uow.rollback()
+            raise
+        else:
+            uow.commit()
+        finally:
+            _current.reset(token)
+        return
+
+    # 중첩 범위: 세이브포인트
+    mark = uow.mark()
     if db:  # ORM 세션 사용
+        uow.join(db)
+        nested = db.begin_nested()
         try:
             yield db
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            raise e
+        except BaseException:
+            uow.rollback_to(mark)
+            nested.rollback()
+            raise
+        nested.commit()
     else:  # 직접 연결 사용
-        conn = None
+        conn = uow.get_connection()
+        savepoint = uow.next_savepoint()
+        _execute(conn, f"SAVEPOINT {savepoint}")
         try:
-            conn = get_connection()
             yield conn
-            conn.commit()
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            raise e
+        except BaseException:
+            uow.rollback_to(mark)
+            _execute(conn, f"ROLLBACK TO SAVEPOINT {savepoint}")
+            raise
+
+
+@asynccontextmanager
+async def async_transaction_context():
+    """
+    transaction_context의 비동기 버전 (직접 쿼리 전용)
+
+    사용 예:
+        async with async_transaction_context() as conn:
+            await AsyncPostRepository.create_post(...)
+            await AsyncCommentRepository.create_comment(...)
+    """
+    uow = _current.get()
+    if uow is None:  # 가장 바깥 범위
+        uow = UnitOfWork()
+        token = _current.set(uow)
+        try:
+            yield await uow.get_async_connection()
+        except BaseException:
+            await uow.rollback_async()
+            raise
+        else:
+            await uow.commit_async()
+        finally:
+            _current.reset(token)
+        return
+
+    # 중첩 범위: 세이브포인트
+    mark = uow.mark()
+    conn = await uow.get_async_connection()
+    savepoint = uow.next_savepoint()
+    await _execute_async(conn, f"SAVEPOINT {savepoint}")
+    try:
+        yield conn
+    except BaseException:
+        uow.rollback_to(mark)
+        await _execute_async(conn, f"ROLLBACK TO SAVEPOINT {savepoint}")
+        raise
+
+
+# ---------------------------------------------------------------------------
+# 요청 단위 미들웨어
+# ---------------------------------------------------------------------------
+
+class UnitOfWorkMiddleware:
+    """
+    변경 요청(POST/PUT/PATCH/DELETE)마다 작업 단위를 여는 순수 ASGI 미들웨어
+
+    요청 안에서 호출된 저장소 메서드는 모두 같은 연결/세션에 합류하며,
+    응답 헤더를 보내기 직전에 상태 코드가 400 미만이면 한 번 커밋하고 아니면 롤백합니다.
+    커밋이 실패하면 원래 응답 대신 500을 보냅니다.
+    연결은 처음 쿼리할 때 획득하므로 DB를 쓰지 않는 요청은 비용이 없습니다.
+    """
+
+    METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in self.METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        uow = UnitOfWork()
+        token = _current.set(uow)
+        finished = False
+        failed = False
+
+        async def finishing_send(message):
+            nonlocal finished, failed
+            if message["type"] == "http.response.start" and not finished:
+                finished = True
+                try:
+                    if message["status"] < 400:
+                        await uow.commit_async()
+                    else:
+                        await uow.rollback_async()
+                except Exception:
+                    logger.exception("Unit of work commit failed")
+                    failed = True
+                    await send({
+                        "type": "http.response.start",
+                        "status": 500,
+                        "headers": [(b"content-type", b"application/json")],
+                    })
+                    await send({
+                        "type": "http.response.body",
+                        "body": b'{"detail":"Internal server error"}',
+                    })
+                    return
+            if failed:
+                return  # 실패 응답을 이미 보냈으므로 원래 본문은 버림
+            await send(message)
+
+        try:
+            await self.app(scope, receive, finishing_send)
+        except BaseException:
+            if not finished:
+                finished = True
+                await uow.rollback_async()
+            raise
         finally:
-            if conn:
-                conn.close()
\ No newline at end of file
+            if not finished:
+                await uow.rollback_async()
+            _current.reset(token)
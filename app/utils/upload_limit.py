@@ -0,0 +1,82 @@
+import json
+from typing import Callable
+
+
+class UploadSizeLimitMiddleware:
+    """
+    업로드 요청 본문 크기 제한 (순수 ASGI 미들웨어)
+
+    FastAPI는 라우트 함수가 호출되기 전에 multipart 본문 전체를 읽으므로,
+    라우트 안에서의 검사만으로는 큰 업로드를 일찍 거절할 수 없습니다.
+    Content-Length로 먼저 거절하고, 헤더가 없거나(chunked) 실제 본문이 더 큰 경우에는
+    수신한 바이트 수가 한도를 넘는 즉시 미들웨어가 직접 413을 보낸 뒤,
+    앱에는 연결 종료(http.disconnect)를 전달해 더 이상 본문을 넘기지 않습니다.
+    (receive에서 예외를 던지면 본문 파싱 중에 400으로 바뀌므로 사용하지 않음)
+    """
+
+    # multipart 경계/헤더 등 파일 외 본문에 허용할 여유분
+    MULTIPART_OVERHEAD = 64 * 1024
+
+    def __init__(self, app: Callable, max_upload_size: int, path_prefix: str = "/api/files/upload"):
+        self.app = app
+        self.max_body_size = max_upload_size + self.MULTIPART_OVERHEAD
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    content_length = int(value)
+                except ValueError:
+                    content_length = 0
+                if content_length > self.max_body_size:
+                    await self._send_too_large(send)
+                    return
+                break
+
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def limited_receive():
+            nonlocal received, rejected, response_started
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    rejected = True
+                    if not response_started:
+                        response_started = True
+                        await self._send_too_large(send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def tracked_send(message):
+            nonlocal response_started
+            if rejected:
+                return  # 413을 이미 보냈으므로 앱의 응답은 버림
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        await self.app(scope, limited_receive, tracked_send)
+
+    @staticmethod
+    async def _send_too_large(send):
+        body = json.dumps({"detail": "Uploaded file is too large"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
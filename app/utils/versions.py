@@ -0,0 +1,104 @@
+import hashlib
+from datetime import datetime
+from email.utils import formatdate
+from typing import Any, Dict, Iterable, Tuple
+from fastapi import Request, Response
+from utils.database import execute_query_async
+from utils.file_response import etag_matches, not_modified_since
+
+
+class Validators:
+    """목록 응답의 조건부 요청 검증값 (약한 ETag / Last-Modified)"""
+    __slots__ = ("etag", "last_modified", "headers")
+
+    def __init__(self, etag: str, last_modified: float):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.headers = {
+            "ETag": etag,
+            "Last-Modified": formatdate(last_modified, usegmt=True),
+            "Cache-Control": "no-cache",  # 저장은 허용하되 사용할 때마다 재검증
+        }
+
+    def is_not_modified(self, request: Request) -> bool:
+        """If-None-Match가 있으면 그것만, 없으면 If-Modified-Since로 판단"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return etag_matches(if_none_match, self.etag[2:], weak=True)
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None:
+            return not_modified_since(if_modified_since, self.last_modified)
+        return False
+
+    def not_modified(self) -> Response:
+        """본문 없는 304 응답"""
+        return Response(status_code=304, headers=self.headers)
+
+
+# 리소스별 변경 요약에 사용할 "마지막 변경 시각" 컬럼 (files는 수정 없이 생성/삭제만 있음)
+_CHANGED_AT_COLUMNS = {
+    "posts": "modified_at",
+    "comments": "modified_at",
+    "users": "modified_at",
+    "files": "created_at",
+}
+
+
+def _summary_query(resources: Tuple[str, ...]) -> Tuple[str, Dict[str, Any]]:
+    """
+    리소스별 (행 수, 삭제된 행 수, 마지막 변경 시각, 마지막 삭제 시각)을 한 번에 조회하는 쿼리 생성
+
+    "comments:{post_id}"처럼 콜론 뒤에 게시물 id를 붙이면 해당 게시물의 행만 집계합니다.
+    """
+    selects = []
+    binds: Dict[str, Any] = {}
+    for index, resource in enumerate(resources):
+        table, _, post_id = resource.partition(":")
+        changed_at = _CHANGED_AT_COLUMNS[table]
+        where = ""
+        if post_id:
+            binds[f"post_id{index}"] = int(post_id)
+            where = f" WHERE post_id = :post_id{index}"
+        selects.append(
+            f"SELECT {index} AS seq, COUNT(*) AS row_count, COUNT(deleted_at) AS deleted_count, "
+            f"MAX({changed_at}) AS changed_at, MAX(deleted_at) AS deleted_at FROM {table}{where}"
+        )
+    return "\nUNION ALL\n".join(selects), binds
+
+
+def _timestamp(value) -> float:
+    return value.timestamp() if isinstance(value, datetime) else 0.0
+
+
+class ResourceVersions:
+    """
+    리소스별 변경 요약으로 만드는 목록 검증값
+
+    목록 라우트는 조회 전에 관련 테이블의 행 수, 삭제된 행 수, 마지막 변경/삭제 시각을
+    집계 쿼리 한 번으로 읽어 ETag를 만들고 304 여부를 판단합니다.
+    검증값이 DB 상태에서만 만들어지므로 모든 워커가 같은 ETag를 내고, 다른 워커의 변경도 바로 반영됩니다.
+    조회수만 바뀐 경우에는 변경 시각이 바뀌지 않으므로 304 응답의 조회수는 늦게 보일 수 있습니다.
+    """
+
+    async def validators(self, resources: Iterable[str], variant: str = "") -> Validators:
+        """
+        리소스 변경 요약으로 검증값 생성
+
+        variant에는 같은 리소스의 서로 다른 표현(쿼리 문자열의 커서/페이지 크기 등)을 넣습니다.
+        """
+        query, binds = _summary_query(tuple(resources))
+        rows = await execute_query_async(query, binds)
+        # 컬럼 이름 대소문자와 UNION ALL 결과 순서에 의존하지 않도록 값 튜플을 seq 순으로 정렬
+        summaries = sorted(tuple(row.values()) for row in rows)
+        digest = hashlib.blake2b(digest_size=8)
+        for summary in summaries:
+            digest.update(repr(summary).encode())
+        digest.update(variant.encode())
+        last_modified = max(
+            (_timestamp(value) for summary in summaries for value in summary[3:]), default=0.0
+        )
+        return Validators(f'W/"{digest.hexdigest()}"', last_modified)
+
+
+# 전역 리소스 검증값 생성기
+resource_versions = ResourceVersions()
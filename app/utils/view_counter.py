@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+from sqlalchemy.orm.attributes import set_committed_value
+from config import settings
+from utils.database import execute_many_async
+from utils.cache import post_cache
+
+logger = logging.getLogger(__name__)
+
+FLUSH_QUERY = """
+UPDATE posts
+SET view_count = view_count + :delta
+WHERE id = :post_id AND deleted_at IS NULL
+"""
+
+
+class ViewCountBuffer:
+    """
+    게시물 조회수 write-behind 버퍼
+
+    조회 요청마다 UPDATE를 실행하는 대신 post_id별 증가분을 메모리에 모아 두었다가,
+    주기적으로 또는 대기 건수가 임계값을 넘으면 배열 바인딩 UPDATE 한 번으로 반영합니다.
+    아직 반영되지 않은 증가분은 pending()으로 조회하여 응답에 더해 줍니다.
+    """
+
+    def __init__(self, flush_interval: float, flush_threshold: int):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._pending: Dict[int, int] = {}
+        self._in_flight: Dict[int, int] = {}  # 반영 중인 증가분 (커밋 전까지 조회에 포함)
+        self._pending_total = 0
+        self._lock = threading.Lock()
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def increment(self, post_id: int, count: int = 1) -> None:
+        """조회수 증가분 기록"""
+        with self._lock:
+            self._pending[post_id] = self._pending.get(post_id, 0) + count
+            self._pending_total += count
+            should_flush = self._pending_total >= self.flush_threshold
+        if should_flush and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._flush_event.set)
+
+    def pending(self, post_id: int) -> int:
+        """DB에 아직 반영되지 않은 조회수 증가분"""
+        with self._lock:
+            return self._pending.get(post_id, 0) + self._in_flight.get(post_id, 0)
+
+    def apply(self, posts: list) -> list:
+        """
+        조회 결과(딕셔너리 또는 ORM 객체)의 view_count에 반영 대기 중인 증가분을 더함
+
+        ORM 객체는 변경 이력 없이 값만 바꿔서, 세션 커밋 시 UPDATE로 기록되지 않도록 합니다.
+        """
+        with self._lock:
+            if not self._pending and not self._in_flight:
+                return posts
+            for post in posts:
+                is_dict = isinstance(post, dict)
+                post_id = post["id"] if is_dict else post.id
+                delta = self._pending.get(post_id, 0) + self._in_flight.get(post_id, 0)
+                if not delta:
+                    continue
+                if is_dict:
+                    post["view_count"] = (post.get("view_count") or 0) + delta
+                else:
+                    set_committed_value(post, "view_count", (post.view_count or 0) + delta)
+        return posts
+
+    def _drain(self) -> Dict[int, int]:
+        with self._lock:
+            drained, self._pending = self._pending, {}
+            self._pending_total = 0
+            for post_id, delta in drained.items():
+                self._in_flight[post_id] = self._in_flight.get(post_id, 0) + delta
+        return drained
+
+    def _settle(self, drained: Dict[int, int], committed: bool) -> None:
+        with self._lock:
+            for post_id, delta in drained.items():
+                remaining = self._in_flight.get(post_id, 0) - delta
+                if remaining:
+                    self._in_flight[post_id] = remaining
+                else:
+                    self._in_flight.pop(post_id, None)
+                if committed:
+                    # 캐시된 게시물의 view_count는 반영 전 값이므로 무효화
+                    post_cache.invalidate(post_id)
+                else:
+                    # 반영 실패 시 다음 flush에서 다시 시도
+                    self._pending[post_id] = self._pending.get(post_id, 0) + delta
+                    self._pending_total += delta
+
+    async def flush(self) -> int:
+        """대기 중인 증가분을 한 번의 배열 바인딩 UPDATE로 반영"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            drained = self._drain()
+            if not drained:
+                return 0
+            # post_id 순으로 정렬하여 여러 워커 간 행 잠금 순서를 일정하게 유지
+            rows = [{"post_id": post_id, "delta": delta} for post_id, delta in sorted(drained.items())]
+            try:
+                await execute_many_async(FLUSH_QUERY, rows)
+            except Exception as e:
+                self._settle(drained, committed=False)
+                logger.error("View count flush failed (%s posts): %s", len(rows), e)
+                raise
+            self._settle(drained, committed=True)
+            return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # 실패한 증가분은 버퍼에 남아 있으므로 다음 주기에 재시도
+                pass
+
+    async def start(self) -> None:
+        """주기적 flush 작업 시작 (lifespan 시작 시 호출)"""
+        self._loop = asyncio.get_running_loop()
+        self._flush_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """flush 작업 종료 후 남은 증가분 반영 (lifespan 종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+        await self.flush()
+
+
+# 전역 조회수 버퍼
+view_count_buffer = ViewCountBuffer(
+    flush_interval=settings.VIEW_COUNT_FLUSH_INTERVAL,
+    flush_threshold=settings.VIEW_COUNT_FLUSH_THRESHOLD
+)
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupWarmUp:
+    """
+    시작 시 워밍업 작업 실행 및 준비 상태 관리
+
+    연결 풀 워밍업, ORM 방언 초기화, 해싱 프로세스 생성, 캐시 적재 등 첫 요청이 대신 치르던 비용을
+    lifespan 시작 직후 백그라운드에서 동시에 실행합니다. 서버는 바로 요청을 받되(liveness),
+    모든 단계가 끝나야 ready가 되므로 /health/ready를 readiness probe로 쓰면
+    롤링 배포 중 준비되지 않은 워커로 트래픽이 가지 않습니다.
+    실패한 단계는 retry_interval초 뒤 실패한 단계만 다시 실행합니다.
+    """
+
+    def __init__(self, retry_interval: float = 5.0):
+        self.retry_interval = retry_interval
+        self._steps: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._durations: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+        self._ready_at: Optional[float] = None
+        self.attempts = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._ready_at is not None
+
+    def add_step(self, name: str, step: Callable[[], Awaitable[Any]]) -> None:
+        """워밍업 단계 등록 (start 전에 호출)"""
+        self._steps[name] = step
+
+    async def _timed(self, name: str) -> None:
+        start = time.perf_counter()
+        try:
+            await self._steps[name]()
+        except Exception as e:
+            self._errors[name] = str(e)
+            logger.error("Warm-up step '%s' failed: %s", name, e)
+            return
+        self._errors.pop(name, None)
+        self._durations[name] = time.perf_counter() - start
+
+    async def _run(self) -> None:
+        pending = list(self._steps)
+        while pending:
+            self.attempts += 1
+            await asyncio.gather(*(self._timed(name) for name in pending))
+            pending = [name for name in pending if name in self._errors]
+            if pending:
+                await asyncio.sleep(self.retry_interval)
+        self._ready_at = time.monotonic()
+        logger.info("Warm-up complete in %.3fs", self._ready_at - self._started_at)
+
+    async def start(self) -> None:
+        """워밍업 시작 (lifespan 시작 시 호출)"""
+        self._started_at = time.monotonic()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """진행 중인 워밍업 취소 (lifespan 종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "seconds_to_ready": (
+                round(self._ready_at - self._started_at, 3) if self.ready else None
+            ),
+            "attempts": self.attempts,
+            "steps": {
+                name: {
+                    "done": name in self._durations,
+                    "duration_ms": (
+                        round(self._durations[name] * 1000, 3) if name in self._durations else None
+                    ),
+                    "error": self._errors.get(name),
+                }
+                for name in self._steps
+            },
+        }
+
+
+# 전역 워밍업 관리자
+startup_warm_up = StartupWarmUp()
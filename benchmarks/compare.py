@@ -0,0 +1,57 @@
+"""
+벤치마크 결과 비교
+
+두 결과 JSON(endpoints.py --output)을 시나리오/동시성별로 비교하여
+p95 지연 시간 증가 또는 처리량 감소가 허용 비율을 넘으면 저하로 표시합니다.
+
+사용 예:
+    python benchmarks/compare.py baseline.json current.json --tolerance 0.1
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """(scenario, concurrency)가 같은 결과끼리 비교"""
+    base_rows = {(row["scenario"], row["concurrency"]): row for row in baseline["results"]}
+    rows = []
+    for row in current["results"]:
+        base = base_rows.get((row["scenario"], row["concurrency"]))
+        if base is None:
+            continue
+        p95_change = row["latency_ms"]["p95"] / base["latency_ms"]["p95"] - 1 if base["latency_ms"]["p95"] else 0.0
+        rps_change = row["throughput_rps"] / base["throughput_rps"] - 1 if base["throughput_rps"] else 0.0
+        rows.append({
+            "scenario": row["scenario"],
+            "concurrency": row["concurrency"],
+            "p95_ms": (base["latency_ms"]["p95"], row["latency_ms"]["p95"]),
+            "throughput_rps": (base["throughput_rps"], row["throughput_rps"]),
+            "p95_change": p95_change,
+            "throughput_change": rps_change,
+            "regression": p95_change > tolerance or rps_change < -tolerance,
+        })
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]], tolerance: float) -> None:
+    print(f"\nComparison against baseline (tolerance {tolerance:.0%})")
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else "ok"
+        print(f"{row['scenario']:<16} c={row['concurrency']:<3} "
+              f"p95 {row['p95_ms'][0]:.2f} -> {row['p95_ms'][1]:.2f}ms ({row['p95_change']:+.1%})  "
+              f"throughput {row['throughput_rps'][0]:.1f} -> {row['throughput_rps'][1]:.1f} "
+              f"({row['throughput_change']:+.1%})  {flag}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("baseline", help="기준 결과 JSON")
+    parser.add_argument("current", help="비교할 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="허용 저하 비율 (0.10 = 10%%)")
+    args = parser.parse_args()
+    with open(args.baseline) as baseline_file, open(args.current) as current_file:
+        comparison = compare_results(json.load(baseline_file), json.load(current_file), args.tolerance)
+    print_comparison(comparison, args.tolerance)
+    sys.exit(1 if any(row["regression"] for row in comparison) else 0)
@@ -0,0 +1,257 @@
+"""
+라우터 엔드포인트 부하/지연 벤치마크
+
+결정적 로컬 DB 대체 구현(standin.py)에 시드 데이터를 채운 뒤, 각 엔드포인트를
+정해진 동시성으로 호출하여 처리량과 p50/p95/p99 지연 시간을 측정합니다.
+요청은 httpx의 ASGITransport로 앱을 직접 호출하므로 네트워크/서버 비용은 포함되지 않습니다.
+
+사용 예:
+    python benchmarks/endpoints.py --concurrency 1,8,32 --requests 500 --output results.json
+    python benchmarks/endpoints.py --scenarios posts.list,posts.detail --baseline results.json --tolerance 0.1
+
+--baseline을 주면 결과를 이전 실행과 비교하여 허용 범위를 넘는 저하가 있으면 종료 코드 1로 끝납니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 벤치마크 앱은 CORS를 사용하지 않으며, 토큰 발급을 위해 서명 키가 필요함
+os.environ.setdefault("CORS_ORIGINS", "[]")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from auth.jwt_handler import create_access_token  # noqa: E402
+from config import settings  # noqa: E402
+from router import comment, file, post, user  # noqa: E402
+from utils.error_handlers import setup_error_handlers  # noqa: E402
+from utils.json_response import default_response_class  # noqa: E402
+from utils.metrics import MetricsMiddleware  # noqa: E402
+from utils.pagination import encode_cursor  # noqa: E402
+from utils.password import password_hasher  # noqa: E402
+from utils.upload_limit import UploadSizeLimitMiddleware  # noqa: E402
+from compare import compare_results, print_comparison  # noqa: E402
+from standin import BENCH_PASSWORD, StandInDatabase  # noqa: E402
+
+BENCH_USER_ID = 1
+
+
+def build_app(database: StandInDatabase) -> FastAPI:
+    """main.py와 같은 구성의 앱 (DB 연결 풀/백그라운드 작업 제외)"""
+    app = FastAPI(default_response_class=default_response_class())
+    setup_error_handlers(app)
+    app.add_middleware(UploadSizeLimitMiddleware, max_upload_size=settings.MAX_UPLOAD_SIZE)
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+    for module in (user, post, comment, file):
+        app.include_router(module.router)
+    database.install(app)
+    return app
+
+
+RequestFactory = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+def build_scenarios(database: StandInDatabase) -> Dict[str, RequestFactory]:
+    """시나리오 이름 -> 요청 함수 (요청 대상은 워커별 시드 난수로 결정)"""
+    post_ids = sorted(database.posts.rows)
+    commented_post_ids = sorted(database.comments_by_post)
+    own_post_ids = database.posts_owned_by(BENCH_USER_ID)
+    headers = {"Authorization": f"Bearer {create_access_token({'id': BENCH_USER_ID, 'username': 'user1'})}"}
+    keys = database.posts.keys
+
+    async def posts_list(client, rng):
+        # 첫 페이지와 임의 위치 페이지를 섞어서 조회
+        params = {"page_size": 20}
+        if rng.random() < 0.5:
+            params["cursor"] = encode_cursor(*rng.choice(keys))
+        return await client.get("/api/posts/", params=params)
+
+    async def posts_detail(client, rng):
+        return await client.get(f"/api/posts/{rng.choice(post_ids)}")
+
+    async def posts_create(client, rng):
+        body = {"title": f"bench {rng.randint(0, 10 ** 6)}", "content": "benchmark content " * 20}
+        return await client.post("/api/posts/", json=body, headers=headers)
+
+    async def comments_list(client, rng):
+        return await client.get(f"/api/comments/post/{rng.choice(commented_post_ids)}", params={"page_size": 20})
+
+    async def users_login(client, rng):
+        body = {"username": f"user{rng.randint(1, database.sizes['users'])}", "password": BENCH_PASSWORD}
+        return await client.post("/api/users/login", json=body)
+
+    async def files_upload(client, rng):
+        content = rng.randbytes(database.file_size)
+        files = {"file": ("bench.bin", content, "application/octet-stream")}
+        return await client.post(f"/api/files/upload/{rng.choice(own_post_ids)}", files=files, headers=headers)
+
+    async def files_download(client, rng):
+        return await client.get(f"/api/files/{rng.choice(database.file_ids)}")
+
+    return {
+        "posts.list": posts_list,
+        "posts.detail": posts_detail,
+        "posts.create": posts_create,
+        "comments.list": comments_list,
+        "users.login": users_login,
+        "files.upload": files_upload,
+        "files.download": files_download,
+    }
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """최근접 순위 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client: httpx.AsyncClient, request: RequestFactory, concurrency: int,
+                       requests: int, warmup: int, seed: int) -> Dict[str, Any]:
+    """requests건을 concurrency개 워커로 나눠 실행하고 지연 시간 분포를 계산"""
+    warmup_rng = random.Random(seed - 1)
+    for _ in range(warmup):
+        await request(client, warmup_rng)
+
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker(worker_id: int) -> None:
+        nonlocal remaining, errors
+        rng = random.Random(seed * 1000 + worker_id)
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await request(client, rng)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(worker_id) for worker_id in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 3),
+            "p95": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+            "mean": round(sum(latencies) / len(latencies) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3),
+        },
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+
+async def main(args: argparse.Namespace) -> int:
+    upload_dir = tempfile.mkdtemp(prefix="bench_uploads_")
+    settings.UPLOAD_DIR = upload_dir
+    database = StandInDatabase(
+        users=args.users, posts=args.posts, comments=args.comments, files=args.files,
+        file_size=args.file_size, seed=args.seed, latency_ms=args.db_latency_ms, upload_dir=upload_dir,
+    ).populate()
+    app = build_app(database)
+    scenarios = build_scenarios(database)
+    selected = args.scenarios.split(",") if args.scenarios else list(scenarios)
+    unknown = [name for name in selected if name not in scenarios]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)} (available: {', '.join(scenarios)})")
+        return 2
+    concurrency_levels = [int(level) for level in args.concurrency.split(",")]
+
+    password_hasher.start()
+    results = []
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name in selected:
+                for concurrency in concurrency_levels:
+                    requests = args.login_requests if name == "users.login" else args.requests
+                    result = await run_scenario(client, scenarios[name], concurrency, requests,
+                                                args.warmup, args.seed)
+                    results.append({"scenario": name, "concurrency": concurrency, **result})
+                    latency = result["latency_ms"]
+                    print(f"{name:<16} c={concurrency:<3} {result['throughput_rps']:>9.1f} req/s  "
+                          f"p50={latency['p50']:.2f}ms p95={latency['p95']:.2f}ms p99={latency['p99']:.2f}ms  "
+                          f"errors={result['errors']}")
+    finally:
+        password_hasher.shutdown()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": {
+                "users": args.users, "posts": args.posts, "comments": args.comments, "files": args.files,
+                "file_size": args.file_size, "seed": args.seed, "db_latency_ms": args.db_latency_ms,
+                "requests": args.requests, "login_requests": args.login_requests, "warmup": args.warmup,
+                "fast_json": settings.FAST_JSON, "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            },
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2, ensure_ascii=False)
+        print(f"Saved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        rows = compare_results(baseline, report, args.tolerance)
+        print_comparison(rows, args.tolerance)
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="라우터 엔드포인트 부하/지연 벤치마크")
+    parser.add_argument("--scenarios", default="", help="쉼표로 구분한 시나리오 (기본값: 전체)")
+    parser.add_argument("--concurrency", default="1,8,32", help="쉼표로 구분한 동시성 수준")
+    parser.add_argument("--requests", type=int, default=500, help="시나리오/동시성별 측정 요청 수")
+    parser.add_argument("--login-requests", type=int, default=50, help="로그인 측정 요청 수 (bcrypt 비용이 큼)")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--comments", type=int, default=5000)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--file-size", type=int, default=64 * 1024, help="시드/업로드 파일 크기 (바이트)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="레포지토리 호출당 모의 왕복 지연")
+    parser.add_argument("--output", default="", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default="", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="허용 저하 비율 (0.10 = 10%%)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,70 @@
+"""
+애플리케이션 import 시간 프로파일
+
+새 인터프리터에서 `python -X importtime -c "import main"`을 실행하여
+누적 import 시간이 큰 모듈과 최상위 패키지별 자체 import 시간을 출력합니다.
+콜드 스타트(워커 기동) 시간에서 어떤 의존성이 큰 비중을 차지하는지 확인할 때 사용합니다.
+
+사용 예:
+    python benchmarks/import_profile.py
+    python benchmarks/import_profile.py --module router.post --top 30
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+from typing import List, Tuple
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def profile(module: str) -> List[Tuple[str, int, int, int]]:
+    """(모듈, 자체 시간 us, 누적 시간 us, 깊이) 목록"""
+    env = dict(os.environ)
+    env.setdefault("CORS_ORIGINS", "[]")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr.splitlines()[-1] if result.stderr else "import failed", file=sys.stderr)
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            depth = (len(match.group(3)) - 1) // 2
+            rows.append((match.group(4), int(match.group(1)), int(match.group(2)), depth))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="애플리케이션 import 시간 프로파일")
+    parser.add_argument("--module", default="main", help="import할 모듈 (기본값: main)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 모듈/패키지 수")
+    args = parser.parse_args(argv)
+
+    rows = profile(args.module)
+    if not rows:
+        return 1
+    total = sum(self_us for _, self_us, _, _ in rows)
+    print(f"Total import time: {total / 1000:.1f}ms ({len(rows)} modules)")
+
+    print(f"\nTop {args.top} modules by cumulative time:")
+    for name, _, cumulative, depth in sorted(rows, key=lambda row: row[2], reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:>8.1f}ms  {'  ' * min(depth, 4)}{name}")
+
+    packages = Counter()
+    for name, self_us, _, _ in rows:
+        packages[name.split(".")[0]] += self_us
+    print(f"\nTop {args.top} top-level packages by self time:")
+    for package, self_us in packages.most_common(args.top):
+        print(f"  {self_us / 1000:>8.1f}ms  {package}  ({self_us / total:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+목록 응답 직렬화 CPU 비교 벤치마크
+
+기존 경로(response_model 검증 + 표준 JSONResponse)와 빠른 경로(재검증 생략 + orjson)로
+같은 게시물 목록 페이지를 응답할 때의 요청당 CPU 시간을 측정합니다.
+DB 없이 ASGI 앱을 직접 호출하므로 직렬화 비용만 비교됩니다.
+
+사용 예:
+    python benchmarks/json_serialization.py --items 100 --requests 2000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from fastapi import FastAPI  # noqa: E402
+from router.post import PostResponse  # noqa: E402
+from utils.json_response import FastJSONResponse  # noqa: E402
+from utils.pagination import CursorPage, CursorPageMetadata  # noqa: E402
+
+
+def make_page(items: int) -> dict:
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    posts = [
+        {
+            "id": index,
+            "user_id": index % 50,
+            "title": f"Post title {index}",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8,
+            "view_count": index * 7,
+            "created_at": base - timedelta(minutes=index),
+            "modified_at": base - timedelta(minutes=index, seconds=-30),
+            "author_name": f"user{index % 50}",
+            "comment_count": index % 13,
+            "file_count": index % 3,
+        }
+        for index in range(items)
+    ]
+    metadata = CursorPageMetadata(page_size=items, next_cursor="eyJjIjoiMjAyNCJ9", prev_cursor=None,
+                                  has_next=True, has_prev=False)
+    return {"items": posts, "metadata": metadata}
+
+
+def build_app(page: dict) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/baseline", response_model=CursorPage[PostResponse])
+    async def baseline():
+        return page
+
+    @app.get("/fast", response_model=CursorPage[PostResponse])
+    async def fast():
+        return FastJSONResponse(page)
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [], "server": ("bench", 80), "client": ("bench", 1),
+    }
+    size = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return size
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> dict:
+    for _ in range(min(200, requests)):  # 워밍업
+        await call(app, path)
+    start_cpu = time.process_time()
+    start_wall = time.perf_counter()
+    size = 0
+    for _ in range(requests):
+        size = await call(app, path)
+    cpu = time.process_time() - start_cpu
+    wall = time.perf_counter() - start_wall
+    return {
+        "cpu_us_per_request": round(cpu * 1e6 / requests, 1),
+        "wall_us_per_request": round(wall * 1e6 / requests, 1),
+        "response_bytes": size,
+    }
+
+
+async def main(items: int, requests: int) -> None:
+    app = build_app(make_page(items))
+    baseline = await measure(app, "/baseline", requests)
+    fast = await measure(app, "/fast", requests)
+    print(f"items={items} requests={requests}")
+    print(f"baseline (response_model + json): {baseline}")
+    print(f"fast (trusted + orjson):          {fast}")
+    print(f"cpu speedup: {baseline['cpu_us_per_request'] / fast['cpu_us_per_request']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 CPU 비교")
+    parser.add_argument("--items", type=int, default=100, help="페이지당 게시물 수")
+    parser.add_argument("--requests", type=int, default=2000, help="측정 요청 수")
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.requests))
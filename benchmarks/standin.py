@@ -0,0 +1,293 @@
+"""
+벤치마크용 결정적 로컬 DB 대체 구현
+
+Oracle 없이 라우터/서비스/직렬화/미들웨어 경로를 측정할 수 있도록
+비동기 레포지토리(사용자/게시물/댓글)를 시드 고정 메모리 저장소로 바꾸고,
+파일 경로(ORM 세션 사용)는 임시 디렉터리의 SQLite 세션으로 get_db를 대체합니다.
+
+같은 시드와 데이터 규모로 만들면 항상 같은 데이터가 생성됩니다.
+--db-latency-ms를 주면 레포지토리 호출마다 고정 왕복 지연을 더합니다 (SQLite 파일 경로는 제외).
+"""
+import asyncio
+import hashlib
+import os
+import random
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, File as FileModel, FileBlob, get_db
+from repository.comment import AsyncCommentRepository
+from repository.post import AsyncPostRepository
+from repository.user import AsyncUserRepository
+from utils.cache import post_cache, user_cache
+from utils.pagination import CURSOR_NEXT, CursorParams
+from utils.password import get_password_hash
+
+BENCH_PASSWORD = "benchmark-password"
+BASE_TIME = datetime(2024, 1, 1, 0, 0, 0)
+
+_WORDS = (
+    "fastapi oracle python async cursor index cache pool query latency "
+    "게시판 댓글 검색 파일 업로드 성능 측정 데이터베이스 서버 응답"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+class _KeysetTable:
+    """(created_at, id) 오름차순 키 목록으로 키셋 조회를 흉내내는 테이블"""
+
+    def __init__(self):
+        self.rows: Dict[int, Dict[str, Any]] = {}
+        self.keys: List[Tuple[datetime, int]] = []
+
+    def add(self, row: Dict[str, Any]) -> None:
+        self.rows[row["id"]] = row
+        key = (row["created_at"], row["id"])
+        if not self.keys or key > self.keys[-1]:
+            self.keys.append(key)
+        else:
+            self.keys.insert(bisect_left(self.keys, key), key)
+
+    def page(self, cursor_params: CursorParams, descending: bool) -> List[Dict[str, Any]]:
+        forward = cursor_params.direction == CURSOR_NEXT
+        ascending = forward != descending
+        limit = cursor_params.fetch_size
+        after = cursor_params.after
+        if ascending:
+            start = bisect_right(self.keys, after) if after else 0
+            keys = self.keys[start:start + limit]
+        else:
+            end = bisect_left(self.keys, after) if after else len(self.keys)
+            keys = self.keys[max(end - limit, 0):end][::-1]
+        return [dict(self.rows[item_id]) for _, item_id in keys]
+
+
+class StandInDatabase:
+    """시드 고정 데이터를 가진 메모리 저장소 (비동기 레포지토리 대체)"""
+
+    def __init__(self, users: int = 100, posts: int = 1000, comments: int = 5000, files: int = 100,
+                 file_size: int = 64 * 1024, seed: int = 42, latency_ms: float = 0.0,
+                 upload_dir: str = "./bench_uploads"):
+        self.sizes = {"users": users, "posts": posts, "comments": comments, "files": files}
+        self.file_size = file_size
+        self.seed = seed
+        self.latency = latency_ms / 1000
+        self.upload_dir = upload_dir
+        self.users: Dict[int, Dict[str, Any]] = {}
+        self.usernames: Dict[str, int] = {}
+        self.posts = _KeysetTable()
+        self.comments: Dict[int, Dict[str, Any]] = {}
+        self.comments_by_post: Dict[int, _KeysetTable] = {}
+        self.file_ids: List[int] = []
+        self.file_counts: Dict[int, int] = {}
+        self._clock = 0
+        self._engine = None
+        self._session_factory = None
+
+    # ------------------------------------------------------------------
+    # 데이터 생성
+    # ------------------------------------------------------------------
+
+    def _now(self) -> datetime:
+        """생성 순서대로 증가하는 결정적 시각"""
+        self._clock += 1
+        return BASE_TIME + timedelta(seconds=self._clock)
+
+    def populate(self) -> "StandInDatabase":
+        rng = random.Random(self.seed)
+        password_hash = get_password_hash(BENCH_PASSWORD)  # bcrypt 비용이 크므로 모든 사용자가 같은 해시 사용
+        for user_id in range(1, self.sizes["users"] + 1):
+            self._add_user({
+                "id": user_id,
+                "username": f"user{user_id}",
+                "email": f"user{user_id}@example.com",
+                "role": "admin" if user_id == 1 else "user",
+                "password": password_hash,
+            })
+        for post_id in range(1, self.sizes["posts"] + 1):
+            user_id = rng.randint(1, self.sizes["users"])
+            self._add_post({
+                "id": post_id,
+                "user_id": 1 if post_id == 1 else user_id,  # 업로드 벤치마크용으로 1번 사용자 게시물 보장
+                "title": _text(rng, 4),
+                "content": _text(rng, 40),
+                "view_count": rng.randint(0, 1000),
+            })
+        for comment_id in range(1, self.sizes["comments"] + 1):
+            self._add_comment({
+                "id": comment_id,
+                "post_id": rng.randint(1, self.sizes["posts"]),
+                "user_id": rng.randint(1, self.sizes["users"]),
+                "content": _text(rng, 12),
+            })
+        self._populate_files(rng)
+        return self
+
+    def _add_user(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        user.setdefault("created_at", self._now())
+        user.setdefault("modified_at", user["created_at"])
+        self.users[user["id"]] = user
+        self.usernames[user["username"]] = user["id"]
+        return user
+
+    def _add_post(self, post: Dict[str, Any]) -> Dict[str, Any]:
+        post.setdefault("created_at", self._now())
+        post.setdefault("modified_at", post["created_at"])
+        post.setdefault("view_count", 0)
+        post["author_name"] = self.users[post["user_id"]]["username"]
+        self.posts.add(post)
+        return post
+
+    def _add_comment(self, comment: Dict[str, Any]) -> Dict[str, Any]:
+        comment.setdefault("created_at", self._now())
+        comment.setdefault("modified_at", comment["created_at"])
+        comment["author_name"] = self.users[comment["user_id"]]["username"]
+        self.comments[comment["id"]] = comment
+        self.comments_by_post.setdefault(comment["post_id"], _KeysetTable()).add(comment)
+        return comment
+
+    def _populate_files(self, rng: random.Random) -> None:
+        """첨부 파일은 ORM 경로를 그대로 타도록 SQLite에 기록하고 실제 파일도 만듦"""
+        # 업로드는 스레드 풀에서 동시에 실행되므로 연결을 공유하지 않도록 파일 기반 SQLite 사용
+        os.makedirs(self.upload_dir, exist_ok=True)
+        self._engine = create_engine(
+            f"sqlite:///{os.path.join(self.upload_dir, 'standin.db')}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+        Base.metadata.create_all(self._engine, tables=[FileBlob.__table__, FileModel.__table__])
+        self._session_factory = sessionmaker(autocommit=False, autoflush=False, bind=self._engine)
+
+        session = self._session_factory()
+        try:
+            for index in range(self.sizes["files"]):
+                content = rng.randbytes(self.file_size)
+                content_hash = hashlib.sha256(content).hexdigest()
+                path = os.path.join(self.upload_dir, content_hash[:2], content_hash[2:4], content_hash)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as fp:
+                    fp.write(content)
+                session.add(FileBlob(content_hash=content_hash, file_path=path,
+                                     file_size=len(content), ref_count=1))
+                post_id = rng.randint(1, self.sizes["posts"])
+                self.file_counts[post_id] = self.file_counts.get(post_id, 0) + 1
+                db_file = FileModel(post_id=post_id, file_name=f"file{index}.bin",
+                                    file_path=path, file_size=len(content), content_hash=content_hash)
+                session.add(db_file)
+                session.flush()
+                self.file_ids.append(db_file.id)
+            session.commit()
+        finally:
+            session.close()
+
+    def posts_owned_by(self, user_id: int) -> List[int]:
+        return [post_id for post_id, post in self.posts.rows.items() if post["user_id"] == user_id]
+
+    # ------------------------------------------------------------------
+    # 레포지토리 대체
+    # ------------------------------------------------------------------
+
+    async def _roundtrip(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def get_db(self):
+        """models.get_db 대체 (SQLite 세션)"""
+        db = self._session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def install(self, app) -> None:
+        """앱의 get_db 의존성과 비동기 레포지토리 메서드를 메모리 구현으로 교체"""
+        app.dependency_overrides[get_db] = self.get_db
+        replacements = {
+            AsyncUserRepository: {
+                "get_all_users": self.get_all_users,
+                "get_user_by_id": self.get_user_by_id,
+                "get_user_by_username": self.get_user_by_username,
+                "update_user": self.update_user,
+            },
+            AsyncPostRepository: {
+                "get_posts_by_cursor": self.get_posts_by_cursor,
+                "get_post_by_id": self.get_post_by_id,
+                "get_post_counts": self.get_post_counts,
+                "create_post": self.create_post,
+            },
+            AsyncCommentRepository: {
+                "get_comments_by_cursor": self.get_comments_by_cursor,
+            },
+        }
+        for repository, methods in replacements.items():
+            for name, method in methods.items():
+                setattr(repository, name, staticmethod(method))
+
+    async def get_all_users(self):
+        await self._roundtrip()
+        return [{key: value for key, value in user.items() if key != "password"} for user in self.users.values()]
+
+    async def get_user_by_id(self, user_id: int):
+        cached = user_cache.get(user_id)
+        if cached is not None:
+            return cached
+        await self._roundtrip()
+        user = self.users.get(user_id)
+        if user is None:
+            return None
+        user = {key: value for key, value in user.items() if key != "password"}
+        user_cache.set(user_id, user)
+        return user
+
+    async def get_user_by_username(self, username: str):
+        await self._roundtrip()
+        user_id = self.usernames.get(username)
+        return dict(self.users[user_id]) if user_id else None
+
+    async def update_user(self, user_id: int, user_data: dict):
+        await self._roundtrip()
+        self.users[user_id].update(user_data)
+        user_cache.invalidate(user_id)
+        return await self.get_user_by_id(user_id)
+
+    async def get_posts_by_cursor(self, cursor_params: CursorParams):
+        await self._roundtrip()
+        return self.posts.page(cursor_params, descending=True)
+
+    async def get_post_by_id(self, post_id: int):
+        cached = post_cache.get(post_id)
+        if cached is not None:
+            return cached
+        await self._roundtrip()
+        post = self.posts.rows.get(post_id)
+        if post is None:
+            return None
+        post = dict(post)
+        post_cache.set(post_id, post)
+        return post
+
+    async def get_post_counts(self, post_ids: list):
+        await self._roundtrip()
+        return {
+            post_id: {
+                "comment_count": len(self.comments_by_post[post_id].keys) if post_id in self.comments_by_post else 0,
+                "file_count": self.file_counts.get(post_id, 0),
+            }
+            for post_id in post_ids
+        }
+
+    async def create_post(self, post_data: dict):
+        await self._roundtrip()
+        post = self._add_post({**post_data, "id": max(self.posts.rows) + 1})
+        return {key: value for key, value in post.items() if key != "author_name"}
+
+    async def get_comments_by_cursor(self, post_id: int, cursor_params: CursorParams):
+        await self._roundtrip()
+        table = self.comments_by_post.get(post_id)
+        return table.page(cursor_params, descending=False) if table else []
@@ -0,0 +1,8 @@
+import os
+import sys
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+sys.path.insert(0, APP_DIR)
+
+# app/.env의 CORS_ORIGINS(쉼표 구분)는 pydantic이 JSON으로 파싱하지 못하므로 테스트에서는 미리 지정
+os.environ.setdefault("CORS_ORIGINS", "[]")
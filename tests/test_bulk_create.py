@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, User
+from repository.comment import CommentRepository
+from repository.post import PostRepository
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()  # expire_on_commit 기본값(True) 그대로
+    session.add(User(id=1, username="writer", password="x", email="writer@example.com", role="user"))
+    session.commit()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    yield session, statements
+    session.close()
+
+
+def _selects(statements):
+    return [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+
+
+def test_create_posts_bulk_reads_ids_without_refresh_selects(session):
+    db, statements = session
+    posts = [{"user_id": 1, "title": f"title {index}", "content": "body"} for index in range(5)]
+
+    ids = PostRepository.create_posts_bulk(posts, db)
+
+    assert len(set(ids)) == 5
+    assert _selects(statements) == []
+
+
+def test_create_comments_bulk_reads_ids_without_refresh_selects(session):
+    db, statements = session
+    post_id = PostRepository.create_posts_bulk([{"user_id": 1, "title": "title", "content": "body"}], db)[0]
+    statements.clear()
+    comments = [{"post_id": post_id, "user_id": 1, "content": f"comment {index}"} for index in range(5)]
+
+    ids = CommentRepository.create_comments_bulk(comments, db)
+
+    assert len(set(ids)) == 5
+    assert _selects(statements) == []
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from service.comment import AsyncCommentService
+from utils import counts
+from utils.counts import CountProvider
+from utils.pagination import CursorParams
+
+
+def _provider(tracked_posts=100):
+    return CountProvider(reconcile_interval=60, tracked_posts=tracked_posts)
+
+
+def test_no_counts_before_first_reconcile():
+    provider = _provider()
+    provider.record("posts", 1)
+    assert provider.table_count("posts") is None
+    assert provider.post_count("comments", 1) is None
+
+
+def test_reconcile_loads_only_post_total(monkeypatch):
+    queries = []
+
+    async def fake_execute_query_async(query, params=None, **kwargs):
+        queries.append(query)
+        return [{"total": 7}]
+
+    monkeypatch.setattr(counts, "execute_query_async", fake_execute_query_async)
+    provider = _provider()
+    asyncio.run(provider.reconcile())
+
+    assert queries == [counts.POST_COUNT_QUERY]
+    assert provider.table_count("posts") == (7, False)
+    provider.record("posts", 2)
+    provider.record("posts", -1)
+    assert provider.table_count("posts") == (8, False)
+
+
+def test_changes_during_reconcile_are_replayed(monkeypatch):
+    provider = _provider()
+
+    async def fake_execute_query_async(query, params=None, **kwargs):
+        # 집계 쿼리가 진행되는 동안 다른 요청이 게시물을 만들고 지움
+        provider.record("posts", 3)
+        provider.record("posts", -1)
+        return [{"total": 10}]
+
+    monkeypatch.setattr(counts, "execute_query_async", fake_execute_query_async)
+    asyncio.run(provider.reconcile())
+
+    assert provider.table_count("posts") == (12, True)
+
+    async def quiet_execute_query_async(query, params=None, **kwargs):
+        return [{"total": 12}]
+
+    monkeypatch.setattr(counts, "execute_query_async", quiet_execute_query_async)
+    asyncio.run(provider.reconcile())
+    assert provider.table_count("posts") == (12, False)
+
+
+def test_failed_reconcile_keeps_previous_total(monkeypatch):
+    provider = _provider()
+
+    async def ok(query, params=None, **kwargs):
+        return [{"total": 5}]
+
+    async def fail(query, params=None, **kwargs):
+        provider.record("posts", 1)
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(counts, "execute_query_async", ok)
+    asyncio.run(provider.reconcile())
+    monkeypatch.setattr(counts, "execute_query_async", fail)
+    with pytest.raises(RuntimeError):
+        asyncio.run(provider.reconcile())
+
+    assert provider.table_count("posts") == (6, False)
+    assert provider.stats()["reconcile_errors"] == 1
+    assert provider._journal == []
+
+
+def test_per_post_counts_come_from_fetched_pages():
+    provider = _provider()
+    provider.remember_posts([1, 2], {1: {"comment_count": 3, "file_count": 1}})
+
+    assert provider.post_count("comments", 1) == (3, False)
+    assert provider.post_count("files", 1) == (1, False)
+    assert provider.post_count("comments", 2) == (0, False)  # 조회 결과에 없으면 0건
+    assert provider.post_count("comments", 3) is None
+
+
+def test_changes_invalidate_per_post_counts():
+    provider = _provider()
+    provider.remember_posts([1, 2, 3], {1: {"comment_count": 3, "file_count": 1}})
+
+    provider.record("comments", 1, 1)
+    provider.record("files", -1, 2)
+    provider.forget_post(3)
+
+    assert provider.post_count("comments", 1) is None
+    assert provider.post_count("files", 2) is None
+    assert provider.post_count("comments", 3) is None
+
+
+def test_per_post_tracking_is_bounded():
+    provider = _provider(tracked_posts=2)
+    provider.remember_posts([1, 2], {})
+    provider.post_count("comments", 1)  # 1을 최근 사용으로
+    provider.remember_posts([3], {})
+
+    assert provider.post_count("comments", 2) is None
+    assert provider.post_count("comments", 1) == (0, False)
+    assert provider.stats()["tracked_posts"] == 2
+
+
+def test_comment_page_fetches_count_once_for_untracked_post(monkeypatch):
+    provider = _provider()
+    monkeypatch.setattr("service.comment.count_provider", provider)
+    count_queries = []
+
+    class FakeCommentRepository:
+        @staticmethod
+        async def get_comments_by_cursor(post_id, cursor_params):
+            return [{"id": 1, "post_id": post_id, "created_at": None}]
+
+    class FakePostRepository:
+        @staticmethod
+        async def get_post_counts(post_ids):
+            count_queries.append(post_ids)
+            return {post_id: {"comment_count": 4, "file_count": 0} for post_id in post_ids}
+
+    service = AsyncCommentService()
+    service.comment_repository = FakeCommentRepository
+    service.post_repository = FakePostRepository
+    params = CursorParams(cursor=None, page_size=20)
+
+    first = asyncio.run(service.get_comments_page(9, params))
+    second = asyncio.run(service.get_comments_page(9, params))
+
+    assert first["metadata"].total_items == 4
+    assert second["metadata"].total_items == 4
+    assert count_queries == [[9]]
@@ -0,0 +1,198 @@
+import os
+import re
+from email.utils import formatdate
+
+import pytest
+from starlette.testclient import TestClient
+
+from utils.file_response import MAX_RANGES, RangedFileResponse, parse_range_header
+
+CONTENT = bytes(range(256)) * 4  # 1024 바이트
+SIZE = len(CONTENT)
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(CONTENT)
+    return str(path)
+
+
+def _client(path, content_hash=None):
+    async def app(scope, receive, send):
+        response = RangedFileResponse(path, content_hash=content_hash, media_type="application/octet-stream")
+        await response(scope, receive, send)
+    return TestClient(app)
+
+
+# ---------------------------------------------------------------------------
+# parse_range_header
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", [(0, 9)]),
+    ("bytes=1000-", [(1000, SIZE - 1)]),
+    ("bytes=-24", [(SIZE - 24, SIZE - 1)]),  # 마지막 24바이트
+    ("bytes=-5000", [(0, SIZE - 1)]),  # 파일보다 긴 suffix는 전체
+    ("bytes=1000-5000", [(1000, SIZE - 1)]),  # 끝은 파일 크기로 제한
+    ("bytes=0-9, 5-19", [(0, 19)]),  # 겹치는 범위 병합
+    ("bytes=0-9,10-19", [(0, 19)]),  # 이어지는 범위 병합
+    ("bytes=20-29, 0-9", [(0, 9), (20, 29)]),  # 정렬
+    ("bytes=0-0, -1", [(0, 0), (SIZE - 1, SIZE - 1)]),
+    (" Bytes = 0-9 ", [(0, 9)]),
+    ("bytes=-0", []),  # 만족할 수 있는 범위 없음 (416)
+    ("bytes=2000-", []),
+    ("bytes=2000-3000, -0", []),
+    ("bytes=-0, 0-9", [(0, 9)]),
+])
+def test_parse_range_header(header, expected):
+    assert parse_range_header(header, SIZE) == expected
+
+
+@pytest.mark.parametrize("header", [
+    "items=0-9",  # 알 수 없는 단위
+    "bytes=",
+    "bytes=abc",
+    "bytes=9-0",  # 역순 범위
+    "bytes=0-9, 20-10",
+    "bytes=a-9",
+    "bytes=0-b",
+    "bytes=-",
+    "bytes=" + ",".join(f"{index * 10}-{index * 10 + 1}" for index in range(MAX_RANGES + 1)),  # 범위가 너무 많음
+])
+def test_parse_range_header_ignores_invalid_headers(header):
+    assert parse_range_header(header, SIZE) is None
+
+
+def test_parse_range_header_allows_max_ranges():
+    header = "bytes=" + ",".join(f"{index * 10}-{index * 10 + 1}" for index in range(MAX_RANGES))
+    assert len(parse_range_header(header, SIZE)) == MAX_RANGES
+
+
+# ---------------------------------------------------------------------------
+# RangedFileResponse
+# ---------------------------------------------------------------------------
+
+def test_full_response_has_validators(file_path):
+    response = _client(file_path, content_hash="abc").get("/")
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(SIZE)
+
+
+@pytest.mark.parametrize("range_header, start, end", [
+    ("bytes=10-19", 10, 19),
+    ("bytes=-16", SIZE - 16, SIZE - 1),
+    ("bytes=1000-", 1000, SIZE - 1),
+    ("bytes=0-9, 5-30", 0, 30),  # 병합되어 단일 범위
+])
+def test_single_range(file_path, range_header, start, end):
+    response = _client(file_path).get("/", headers={"Range": range_header})
+
+    assert response.status_code == 206
+    assert response.content == CONTENT[start:end + 1]
+    assert response.headers["content-range"] == f"bytes {start}-{end}/{SIZE}"
+    assert response.headers["content-length"] == str(end - start + 1)
+
+
+@pytest.mark.parametrize("range_header", ["bytes=-0", "bytes=5000-"])
+def test_unsatisfiable_range_is_416(file_path, range_header):
+    response = _client(file_path).get("/", headers={"Range": range_header})
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{SIZE}"
+    assert response.content == b""
+
+
+@pytest.mark.parametrize("range_header", [
+    "bytes=20-10",
+    "bytes=" + ",".join(f"{index * 10}-{index * 10 + 1}" for index in range(MAX_RANGES + 1)),
+    "bytes=0-",  # 전체 범위
+])
+def test_ignored_range_sends_whole_file(file_path, range_header):
+    response = _client(file_path).get("/", headers={"Range": range_header})
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+def test_multiple_ranges_are_multipart(file_path):
+    response = _client(file_path).get("/", headers={"Range": "bytes=0-9, 100-109, -5"})
+
+    assert response.status_code == 206
+    content_type = response.headers["content-type"]
+    boundary = re.fullmatch(r"multipart/byteranges; boundary=(\w+)", content_type).group(1)
+    # 미리 계산한 Content-Length가 실제 본문 길이와 같아야 함
+    assert int(response.headers["content-length"]) == len(response.content)
+    parts = response.content.split(f"--{boundary}".encode())
+    assert parts[0] == b"" and parts[-1] == b"--\r\n"
+    expected = [(0, 9), (100, 109), (SIZE - 5, SIZE - 1)]
+    for part, (start, end) in zip(parts[1:-1], expected):
+        head, _, body = part.partition(b"\r\n\r\n")
+        assert f"Content-Range: bytes {start}-{end}/{SIZE}".encode() in head
+        assert body == CONTENT[start:end + 1] + b"\r\n"
+
+
+def test_head_range_sends_headers_only(file_path):
+    response = _client(file_path).head("/", headers={"Range": "bytes=0-9"})
+
+    assert response.status_code == 206
+    assert response.headers["content-length"] == "10"
+    assert response.content == b""
+
+
+# ---------------------------------------------------------------------------
+# 조건부 요청
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("if_range, status", [
+    ('"abc"', 206),  # 강한 ETag 일치
+    ('"other"', 200),
+    ('W/"abc"', 200),  # If-Range는 강한 비교만 허용하므로 약한 ETag는 불일치
+])
+def test_if_range_with_etag(file_path, if_range, status):
+    response = _client(file_path, content_hash="abc").get("/", headers={"Range": "bytes=0-9", "If-Range": if_range})
+
+    assert response.status_code == status
+    assert response.content == (CONTENT[:10] if status == 206 else CONTENT)
+
+
+def test_if_range_with_date(file_path):
+    mtime = os.stat(file_path).st_mtime
+    client = _client(file_path)
+
+    current = client.get("/", headers={"Range": "bytes=0-9", "If-Range": formatdate(mtime, usegmt=True)})
+    stale = client.get("/", headers={"Range": "bytes=0-9", "If-Range": formatdate(mtime - 3600, usegmt=True)})
+
+    assert current.status_code == 206
+    assert stale.status_code == 200
+
+
+@pytest.mark.parametrize("if_none_match", ['"abc"', 'W/"abc"', '"x", "abc"', "*"])
+def test_if_none_match_returns_304(file_path, if_none_match):
+    response = _client(file_path, content_hash="abc").get("/", headers={"If-None-Match": if_none_match})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert "content-length" not in response.headers
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since(file_path):
+    future = formatdate(os.stat(file_path).st_mtime + 3600, usegmt=True)
+    response = _client(file_path, content_hash="abc").get(
+        "/", headers={"If-None-Match": '"other"', "If-Modified-Since": future}
+    )
+
+    assert response.status_code == 200
+
+
+def test_if_modified_since(file_path):
+    mtime = os.stat(file_path).st_mtime
+    client = _client(file_path)
+
+    assert client.get("/", headers={"If-Modified-Since": formatdate(mtime, usegmt=True)}).status_code == 304
+    assert client.get("/", headers={"If-Modified-Since": formatdate(mtime - 3600, usegmt=True)}).status_code == 200
+    assert client.get("/", headers={"If-Modified-Since": "not a date"}).status_code == 200
@@ -0,0 +1,227 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.testclient import TestClient
+
+from models import Base, Post, User
+from router import post as post_router
+from service.post import PostService
+from utils.pagination import (
+    CURSOR_NEXT, CURSOR_PREV, CursorParams, decode_cursor, encode_cursor, keyset_clause, keyset_paginate
+)
+from utils.versions import Validators
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _params(cursor=None, page_size=3):
+    return CursorParams(cursor=cursor, page_size=page_size)
+
+
+# ---------------------------------------------------------------------------
+# 커서 토큰
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("direction", [CURSOR_NEXT, CURSOR_PREV])
+def test_cursor_round_trip(direction):
+    created_at = datetime(2026, 1, 1, 12, 0, 0, 123456)
+    token = encode_cursor(created_at, 42, direction)
+
+    assert "=" not in token
+    assert decode_cursor(token) == (created_at, 42, direction)
+
+
+def _token(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("token", [
+    "not-a-cursor",
+    "",
+    _token({"c": "2026-01-01T00:00:00", "i": 1}),  # 방향 없음
+    _token({"c": "2026-01-01T00:00:00", "i": 1, "d": "sideways"}),
+    _token({"c": "yesterday", "i": 1, "d": "next"}),
+    _token({"c": "2026-01-01T00:00:00", "i": "x", "d": "next"}),
+    _token(["2026-01-01T00:00:00", 1, "next"]),
+])
+def test_invalid_cursor_is_400(token):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(token)
+    assert error.value.status_code == 400
+
+
+# ---------------------------------------------------------------------------
+# keyset_clause
+# ---------------------------------------------------------------------------
+
+def test_keyset_clause_first_page():
+    assert keyset_clause("p", _params(), descending=True) == ("", "DESC", {"limit": 4})
+
+
+@pytest.mark.parametrize("direction, descending, op, order", [
+    (CURSOR_NEXT, True, "<", "DESC"),
+    (CURSOR_PREV, True, ">", "ASC"),
+    (CURSOR_NEXT, False, ">", "ASC"),
+    (CURSOR_PREV, False, "<", "DESC"),
+])
+def test_keyset_clause_breaks_ties_on_id(direction, descending, op, order):
+    condition, clause_order, params = keyset_clause("c", _params(encode_cursor(NOW, 7, direction)), descending)
+
+    assert clause_order == order
+    assert condition == (
+        f"AND (c.created_at {op} :cursor_created_at "
+        f"OR (c.created_at = :cursor_created_at AND c.id {op} :cursor_id))"
+    )
+    assert params == {"limit": 4, "cursor_created_at": NOW, "cursor_id": 7}
+
+
+# ---------------------------------------------------------------------------
+# keyset_paginate (ORM 경로로 실제 페이지 이동)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(id=1, username="writer", password="x", email="writer@example.com", role="user"))
+    # 여러 게시물이 같은 created_at을 가지도록 생성 (id로 순서가 정해져야 함)
+    for post_id in range(1, 11):
+        created_at = NOW + timedelta(minutes=(post_id - 1) // 4)
+        session.add(Post(id=post_id, user_id=1, title=f"t{post_id}", content="c", view_count=0, created_at=created_at))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _ids(page):
+    return [post.id for post in page["items"]]
+
+
+def test_pages_cover_equal_timestamps_without_gaps_or_duplicates(db):
+    service = PostService(db)
+    pages = []
+    cursor = None
+    while True:
+        page = service.get_posts_page(_params(cursor))
+        pages.append(_ids(page))
+        cursor = page["metadata"].next_cursor
+        if cursor is None:
+            break
+
+    assert pages == [[10, 9, 8], [7, 6, 5], [4, 3, 2], [1]]
+    assert page["metadata"].has_prev and not page["metadata"].has_next
+
+
+def test_prev_cursor_returns_previous_page_in_order(db):
+    service = PostService(db)
+    first = service.get_posts_page(_params())
+    second = service.get_posts_page(_params(first["metadata"].next_cursor))
+    third = service.get_posts_page(_params(second["metadata"].next_cursor))
+
+    back = service.get_posts_page(_params(third["metadata"].prev_cursor))
+    assert _ids(back) == _ids(second)
+    assert back["metadata"].has_next and back["metadata"].has_prev
+
+    back_to_first = service.get_posts_page(_params(back["metadata"].prev_cursor))
+    assert _ids(back_to_first) == [10, 9, 8]
+    assert back_to_first["metadata"].has_next
+    assert not back_to_first["metadata"].has_prev
+
+
+def test_keyset_paginate_metadata():
+    items = [{"id": index, "created_at": NOW} for index in range(4)]
+
+    page = keyset_paginate(items, _params(), total=(10, True))
+
+    assert [item["id"] for item in page["items"]] == [0, 1, 2]
+    metadata = page["metadata"]
+    assert metadata.has_next and not metadata.has_prev
+    assert decode_cursor(metadata.next_cursor) == (NOW, 2, CURSOR_NEXT)
+    assert metadata.prev_cursor is None
+    assert (metadata.total_items, metadata.approximate) == (10, True)
+
+
+def test_keyset_paginate_empty_page():
+    page = keyset_paginate([], _params(encode_cursor(NOW, 1)))
+
+    assert page["items"] == []
+    assert page["metadata"].next_cursor is None and page["metadata"].prev_cursor is None
+    assert page["metadata"].total_items is None
+
+
+# ---------------------------------------------------------------------------
+# GET /api/posts (커서 / deprecated limit·offset)
+# ---------------------------------------------------------------------------
+
+class FakePostService:
+    calls = []
+
+    async def get_all_posts(self, limit=100, offset=0):
+        self.calls.append(("offset", limit, offset))
+        return [{
+            "id": 1, "user_id": 1, "title": "t", "content": "c", "view_count": 0,
+            "created_at": NOW, "modified_at": None, "author_name": "writer",
+        }]
+
+    async def get_posts_page(self, cursor_params):
+        self.calls.append(("cursor", cursor_params.cursor, cursor_params.page_size))
+        return keyset_paginate([], cursor_params)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def validators(resources, variant=""):
+        return Validators('W/"test"', NOW.timestamp())
+
+    FakePostService.calls = []
+    monkeypatch.setattr(post_router, "AsyncPostService", FakePostService)
+    monkeypatch.setattr(post_router.resource_versions, "validators", validators)
+    app = FastAPI()
+    app.include_router(post_router.router)
+    return TestClient(app)
+
+
+def test_cursor_listing_has_no_deprecation_header(client):
+    response = client.get("/api/posts/", params={"page_size": 5})
+
+    assert response.status_code == 200
+    assert "deprecation" not in response.headers
+    assert response.json()["metadata"]["page_size"] == 5
+    assert FakePostService.calls == [("cursor", None, 5)]
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({"limit": 10}, ("offset", 10, 0)),
+    ({"offset": 20}, ("offset", 100, 20)),
+    ({"limit": 5, "offset": 5}, ("offset", 5, 5)),
+])
+def test_limit_offset_fallback_is_deprecated(client, params, expected):
+    response = client.get("/api/posts/", params=params)
+
+    assert response.status_code == 200
+    assert response.headers["deprecation"] == "true"
+    assert isinstance(response.json(), list)
+    assert FakePostService.calls == [expected]
+
+
+def test_cursor_wins_over_limit_offset(client):
+    cursor = encode_cursor(NOW, 3)
+    response = client.get("/api/posts/", params={"cursor": cursor, "limit": 10})
+
+    assert response.status_code == 200
+    assert "deprecation" not in response.headers
+    assert FakePostService.calls == [("cursor", cursor, 20)]
+
+
+def test_invalid_cursor_query_is_400(client):
+    response = client.get("/api/posts/", params={"cursor": "garbage"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
+    assert FakePostService.calls == []
@@ -0,0 +1,295 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from starlette.concurrency import run_in_threadpool
+
+from service.post import AsyncPostService
+from utils import database
+from utils.cache import post_cache
+from utils.pagination import CursorParams
+from utils.query_stats import (
+    QueryBudgetExceeded, QueryStats, normalize_sql, query_budget, query_stats, track_queries
+)
+
+
+# ---------------------------------------------------------------------------
+# normalize_sql
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("statement, expected", [
+    ("SELECT *  FROM posts\n  WHERE id = 42", "SELECT * FROM posts WHERE id = ?"),
+    ("SELECT * FROM users WHERE name = 'O''Brien'", "SELECT * FROM users WHERE name = ?"),
+    ("SELECT 3.14 FROM dual", "SELECT ? FROM dual"),
+    ("SELECT id FROM posts WHERE id IN (:id0, :id1, :id2)", "SELECT id FROM posts WHERE id IN (:...)"),
+    ("SELECT id FROM posts WHERE id IN (:id0,:id1)", "SELECT id FROM posts WHERE id IN (:...)"),
+    # 바인드 이름/식별자 안의 숫자는 그대로 둠
+    ("SELECT c1 FROM t2 WHERE a = :p1 AND b = :p2", "SELECT c1 FROM t2 WHERE a = :p1 AND b = :p2"),
+    ("SAVEPOINT uow_sp_3", "SAVEPOINT uow_sp_3"),
+])
+def test_normalize_sql(statement, expected):
+    assert normalize_sql(statement) == expected
+
+
+def test_in_lists_of_different_lengths_share_one_key():
+    assert normalize_sql("WHERE id IN (:id0, :id1)") == normalize_sql("WHERE id IN (:id0, :id1, :id2, :id3)")
+
+
+# ---------------------------------------------------------------------------
+# QueryStats
+# ---------------------------------------------------------------------------
+
+def test_snapshot_orders_statements_by_total_time():
+    stats = QueryStats(slow_threshold_ms=1000, top_n=5)
+    stats.record("SELECT * FROM posts WHERE id = 1", 0.002)
+    stats.record("SELECT * FROM posts WHERE id = 2", 0.004)
+    stats.record("SELECT * FROM users", 0.003)
+
+    statements = stats.snapshot()["statements"]
+
+    assert statements[0] == {
+        "sql": "SELECT * FROM posts WHERE id = ?", "count": 2,
+        "total_ms": 6.0, "avg_ms": 3.0, "max_ms": 4.0,
+    }
+    assert [statement["sql"] for statement in statements] == ["SELECT * FROM posts WHERE id = ?", "SELECT * FROM users"]
+
+
+def test_keeps_only_top_n_slowest():
+    stats = QueryStats(slow_threshold_ms=10, top_n=2)
+    for index, duration in enumerate([0.05, 0.2, 0.001, 0.1, 0.03]):
+        stats.record(f"SELECT {index} FROM q{index}", duration)
+
+    slowest = stats.snapshot()["slowest"]
+
+    assert [entry["duration_ms"] for entry in slowest] == [200.0, 100.0]
+    assert [entry["sql"] for entry in slowest] == ["SELECT ? FROM q1", "SELECT ? FROM q3"]
+
+
+def test_slow_query_is_logged_with_bind_types_only(caplog):
+    stats = QueryStats(slow_threshold_ms=100, top_n=5)
+    with caplog.at_level(logging.WARNING, logger="utils.query_stats"):
+        stats.record("SELECT * FROM users WHERE email = :email", 0.05, {"email": "secret@example.com"})
+        stats.record("SELECT * FROM users WHERE email = :email", 0.25, {"email": "secret@example.com"})
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert message == "Slow query (250.0ms): SELECT * FROM users WHERE email = :email {'email': 'str'}"
+    assert "secret" not in message
+    assert stats.snapshot()["slowest"][0]["binds"] == {"email": "str"}
+
+
+def test_array_dml_binds_are_summarized():
+    stats = QueryStats(slow_threshold_ms=0, top_n=5)
+    stats.record("INSERT INTO posts VALUES (:title)", 0.01, [{"title": "a"}, {"title": "b"}])
+
+    entry = stats.snapshot()["slowest"][0]
+    assert entry["rows"] == 2
+    assert entry["binds"] == {"title": "str"}
+
+
+def test_reset_clears_statistics():
+    stats = QueryStats(slow_threshold_ms=0, top_n=5)
+    stats.record("SELECT 1 FROM dual", 0.01)
+    stats.reset()
+    assert stats.snapshot()["statements"] == []
+    assert stats.snapshot()["slowest"] == []
+
+
+# ---------------------------------------------------------------------------
+# track_queries / query_budget
+# ---------------------------------------------------------------------------
+
+def test_track_queries_counts_gathered_tasks_and_threadpool_work():
+    stats = QueryStats(slow_threshold_ms=1000, top_n=5)
+
+    async def query(sql):
+        stats.record(sql, 0.001)
+
+    async def scenario():
+        with track_queries() as counter:
+            await asyncio.gather(query("SELECT 1 FROM a"), query("SELECT 1 FROM b"))
+            await run_in_threadpool(stats.record, "SELECT 1 FROM c", 0.001)
+        stats.record("SELECT 1 FROM outside", 0.001)
+        return counter
+
+    counter = asyncio.run(scenario())
+    assert counter.count == 3
+    assert counter.total_time == pytest.approx(0.003)
+
+
+def test_track_queries_are_isolated_per_context():
+    stats = QueryStats(slow_threshold_ms=1000, top_n=5)
+
+    async def request(queries):
+        with track_queries() as counter:
+            for _ in range(queries):
+                stats.record("SELECT 1 FROM dual", 0.0)
+                await asyncio.sleep(0)
+        return counter.count
+
+    async def scenario():
+        return await asyncio.gather(request(1), request(3))
+
+    assert asyncio.run(scenario()) == [1, 3]
+
+
+def test_query_budget_counts_statements_from_other_threads():
+    with query_budget(2) as counter:
+        worker = threading.Thread(target=query_stats.record, args=("SELECT 1 FROM dual", 0.0))
+        worker.start()
+        worker.join()
+        query_stats.record("SELECT 2 FROM dual", 0.0)
+    assert counter.count == 2
+
+
+def test_query_budget_reports_statements_when_exceeded():
+    with pytest.raises(QueryBudgetExceeded) as error:
+        with query_budget(1):
+            query_stats.record("SELECT * FROM posts WHERE id = 1", 0.0)
+            query_stats.record("SELECT * FROM posts WHERE id = 2", 0.0)
+
+    assert "Expected at most 1 queries, got 2" in str(error.value)
+    assert "2. SELECT * FROM posts WHERE id = ?" in str(error.value)
+
+
+# ---------------------------------------------------------------------------
+# 서비스 경로의 쿼리 수 (계측된 커서를 흉내 내는 스텁 연결 사용)
+# ---------------------------------------------------------------------------
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _post(post_id):
+    return {
+        "id": post_id, "user_id": 1, "title": f"title {post_id}", "content": "body", "view_count": 0,
+        "created_at": NOW - timedelta(minutes=post_id), "modified_at": None, "author_name": "writer",
+    }
+
+
+def _comment(comment_id):
+    return {
+        "id": comment_id, "post_id": 1, "user_id": comment_id, "content": "comment",
+        "created_at": NOW + timedelta(minutes=comment_id), "modified_at": None, "author_name": f"user{comment_id}",
+    }
+
+
+class StubAsyncCursor:
+    """InstrumentedAsyncCursor처럼 실행한 문장을 query_stats에 기록하고 SQL에 맞는 행을 돌려줌"""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.description = None
+        self.rowcount = 0
+        self._rows = []
+
+    def _route(self, sql):
+        if "comment_count" in sql:
+            return self.tables["counts"]
+        for table in ("comments", "files", "posts"):
+            if f"FROM {table}" in sql:
+                return self.tables[table]
+        return []
+
+    async def execute(self, statement, parameters=None):
+        query_stats.record(statement, 0.0, parameters)
+        self._rows = self._route(statement)
+        self.description = [(name,) for name in self._rows[0]] if self._rows else []
+
+    async def executemany(self, statement, parameters, batcherrors=False):
+        query_stats.record(statement, 0.0, parameters)
+        self.rowcount = len(parameters)
+
+    async def fetchall(self):
+        return [tuple(row.values()) for row in self._rows]
+
+    def var(self, db_type, arraysize):
+        return StubIdVar()
+
+    def setinputsizes(self, **kwargs):
+        pass
+
+    def getbatcherrors(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class StubIdVar:
+    def getvalue(self, index):
+        return [index + 1]
+
+
+class StubAsyncConnection:
+    def __init__(self, tables):
+        self.tables = tables
+
+    def cursor(self):
+        return StubAsyncCursor(self.tables)
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+@pytest.fixture
+def stub_db(monkeypatch):
+    tables = {"posts": [], "comments": [], "files": [], "counts": []}
+    acquired = []
+
+    async def acquire_async():
+        acquired.append(StubAsyncConnection(tables))
+        return acquired[-1]
+
+    async def release_async(connection):
+        pass
+
+    monkeypatch.setattr(database.pool_manager, "acquire_async", acquire_async)
+    monkeypatch.setattr(database.pool_manager, "release_async", release_async)
+    post_cache.clear()
+    yield tables, acquired
+    post_cache.clear()
+
+
+def test_post_detail_query_count_does_not_grow_with_comments(stub_db):
+    tables, acquired = stub_db
+    tables["posts"] = [_post(1)]
+    tables["comments"] = [_comment(index) for index in range(1, 11)]
+
+    with query_budget(4):  # 게시물, 댓글(작성자 JOIN), 파일, 건수
+        detail = asyncio.run(AsyncPostService().get_post_detail(1, CursorParams(cursor=None, page_size=20)))
+
+    assert len(detail["comments"]["items"]) == 10
+    assert len(acquired) == 2  # 게시물 조회 + 나머지 3개 쿼리가 공유한 연결
+
+
+def test_missing_post_detail_stops_after_one_query(stub_db):
+    with query_budget(1):
+        with pytest.raises(Exception) as error:
+            asyncio.run(AsyncPostService().get_post_detail(404, CursorParams(cursor=None, page_size=20)))
+    assert getattr(error.value, "status_code", None) == 404
+
+
+def test_post_page_counts_are_fetched_in_one_query(stub_db):
+    tables, _ = stub_db
+    tables["posts"] = [_post(index) for index in range(1, 21)]
+
+    with query_budget(2):  # 목록 + 댓글/파일 수 집계
+        page = asyncio.run(AsyncPostService().get_posts_page(CursorParams(cursor=None, page_size=20)))
+
+    assert len(page["items"]) == 20
+
+
+def test_bulk_create_is_one_array_insert(stub_db):
+    posts = [{"title": f"title {index}", "content": "body"} for index in range(50)]
+
+    with query_budget(1):
+        ids = asyncio.run(AsyncPostService().create_posts_bulk(posts, user_id=1))
+
+    assert ids == list(range(1, 51))
@@ -0,0 +1,52 @@
+import asyncio
+
+import oracledb
+
+from utils import search
+from utils.search import SearchIndex
+
+
+def test_clob_content_is_fetched_as_text():
+    # 색인 생성 쿼리가 content를 AsyncLOB가 아닌 문자열로 받아야 본문 단어가 색인됨
+    assert oracledb.defaults.fetch_lobs is False
+
+
+def test_build_indexes_post_body(monkeypatch):
+    async def fake_execute_query_async(query, params=None, **kwargs):
+        if query is search.BUILD_POSTS_QUERY:
+            return [{"id": 1, "title": "Release notes", "content": "The deployment uses blue green switching"}]
+        return [{"id": 10, "post_id": 1, "content": "Nice writeup"}]
+
+    monkeypatch.setattr(search, "execute_query_async", fake_execute_query_async)
+    index = SearchIndex()
+    asyncio.run(index.build())
+
+    assert [post_id for _, post_id in index.search("deployment", limit=10)] == [1]
+    assert [post_id for _, post_id in index.search("writeup", limit=10)] == [1]
+    assert index.search("missing", limit=10) == []
+
+
+def _ready_index(posts):
+    index = SearchIndex()
+    for post in posts:
+        index.index_post(post)
+    index._ready = True
+    return index
+
+
+def test_tokenize_indexes_hangul_syllables_but_queries_bigrams():
+    assert search.tokenize("게시글") == ["게시", "시글", "게", "시", "글"]
+    assert search.tokenize("게시글", for_query=True) == ["게시", "시글"]
+    assert search.tokenize("글", for_query=True) == ["글"]
+
+
+def test_single_syllable_hangul_query_matches_longer_words():
+    index = _ready_index([
+        {"id": 1, "title": "첫 게시글", "content": "안녕하세요"},
+        {"id": 2, "title": "공지", "content": "점검 안내"},
+        {"id": 3, "title": "글", "content": "한 글자 제목"},
+    ])
+
+    assert sorted(post_id for _, post_id in index.search("글", limit=10)) == [1, 3]
+    assert [post_id for _, post_id in index.search("게시글", limit=10)] == [1]
+    assert [post_id for _, post_id in index.search("점검", limit=10)] == [2]
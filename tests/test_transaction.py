@@ -0,0 +1,354 @@
+import asyncio
+
+import pytest
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+
+from utils import transaction
+from utils.transaction import (
+    UnitOfWorkMiddleware, async_transaction_context, commit, commit_async, current_unit_of_work,
+    on_commit, on_rollback, rollback, transaction_context
+)
+
+
+class FakeCursor:
+    def __init__(self, log):
+        self.log = log
+
+    def execute(self, statement, params=None):
+        self.log.append(statement)
+
+    def close(self):
+        pass
+
+
+class FakeAsyncCursor(FakeCursor):
+    async def execute(self, statement, params=None):
+        self.log.append(statement)
+
+
+class FakeConnection:
+    cursor_class = FakeCursor
+
+    def __init__(self, log, fail_commit=False):
+        self.log = log
+        self.fail_commit = fail_commit
+
+    def cursor(self):
+        return self.cursor_class(self.log)
+
+    def commit(self):
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+        self.log.append("commit")
+
+    def rollback(self):
+        self.log.append("rollback")
+
+
+class FakeAsyncConnection(FakeConnection):
+    cursor_class = FakeAsyncCursor
+
+    async def commit(self):
+        FakeConnection.commit(self)
+
+    async def rollback(self):
+        FakeConnection.rollback(self)
+
+
+class FakeNested:
+    def __init__(self, log):
+        self.log = log
+
+    def commit(self):
+        self.log.append("release nested")
+
+    def rollback(self):
+        self.log.append("rollback nested")
+
+
+class FakeSession(Session):
+    """커밋/롤백/flush/세이브포인트 호출만 기록하는 세션"""
+
+    def __init__(self, log):
+        super().__init__()
+        self.log = log
+
+    def flush(self, objects=None):
+        self.log.append("session flush")
+
+    def commit(self):
+        self.log.append("session commit")
+
+    def rollback(self):
+        self.log.append("session rollback")
+
+    def begin_nested(self):
+        self.log.append("begin nested")
+        return FakeNested(self.log)
+
+
+@pytest.fixture
+def log():
+    return []
+
+
+@pytest.fixture
+def pool(monkeypatch, log):
+    """풀 대신 호출을 기록하는 가짜 연결을 돌려줌"""
+    state = {"fail_commit": False, "acquired": [], "released": []}
+
+    def acquire():
+        connection = FakeConnection(log, state["fail_commit"])
+        state["acquired"].append(connection)
+        return connection
+
+    async def acquire_async():
+        connection = FakeAsyncConnection(log, state["fail_commit"])
+        state["acquired"].append(connection)
+        return connection
+
+    async def release_async(connection):
+        state["released"].append(connection)
+
+    monkeypatch.setattr(transaction.pool_manager, "acquire", acquire)
+    monkeypatch.setattr(transaction.pool_manager, "release", state["released"].append)
+    monkeypatch.setattr(transaction.pool_manager, "acquire_async", acquire_async)
+    monkeypatch.setattr(transaction.pool_manager, "release_async", release_async)
+    return state
+
+
+# ---------------------------------------------------------------------------
+# 연결 / 세션 합류
+# ---------------------------------------------------------------------------
+
+def test_repositories_share_one_connection_and_commit_once(pool, log):
+    with transaction_context() as conn:
+        assert current_unit_of_work().get_connection() is conn
+        commit(conn)  # 저장소의 커밋은 작업 단위가 끝날 때로 미뤄짐
+        commit(conn)
+        assert log == []
+
+    assert log == ["commit"]
+    assert pool["acquired"] == [conn]
+    assert pool["released"] == [conn]
+    assert current_unit_of_work() is None
+
+
+def test_connection_outside_unit_of_work_commits_immediately(log):
+    conn = FakeConnection(log)
+    commit(conn)
+    rollback(conn)
+    assert log == ["commit", "rollback"]
+
+
+def test_session_joins_and_only_flushes_until_the_end(pool, log):
+    db = FakeSession(log)
+    with transaction_context(db):
+        commit(db)
+        assert log == ["session flush"]
+
+    assert log == ["session flush", "session commit"]
+    assert pool["acquired"] == []
+
+
+def test_repository_rollback_marks_unit_rollback_only(pool, log):
+    with pytest.raises(RuntimeError, match="rollback-only"):
+        with transaction_context() as conn:
+            rollback(conn)
+            assert log == []
+
+    assert log == ["rollback"]
+    assert pool["released"] == pool["acquired"]
+
+
+def test_exception_rolls_back_and_drops_commit_callbacks(pool, log):
+    with pytest.raises(ValueError):
+        with transaction_context():
+            on_commit(lambda: log.append("after commit"))
+            raise ValueError
+
+    assert log == ["rollback"]
+
+
+# ---------------------------------------------------------------------------
+# 세이브포인트
+# ---------------------------------------------------------------------------
+
+def test_nested_connection_scope_rolls_back_to_savepoint(pool, log):
+    with transaction_context():
+        on_commit(lambda: log.append("outer after commit"))
+        with pytest.raises(ValueError):
+            with transaction_context():
+                on_commit(lambda: log.append("inner after commit"))
+                on_rollback(lambda: log.append("inner undo"))
+                raise ValueError
+        with transaction_context():
+            on_commit(lambda: log.append("second inner after commit"))
+
+    assert log == [
+        "SAVEPOINT uow_sp_1",
+        "inner undo",  # DB 롤백 직전에 실행
+        "ROLLBACK TO SAVEPOINT uow_sp_1",
+        "SAVEPOINT uow_sp_2",
+        "commit",
+        "outer after commit",
+        "second inner after commit",
+    ]
+    assert len(pool["acquired"]) == 1
+
+
+def test_nested_session_scope_uses_begin_nested(pool, log):
+    db = FakeSession(log)
+    with transaction_context(db):
+        with pytest.raises(ValueError):
+            with transaction_context(db):
+                on_rollback(lambda: log.append("inner undo"))
+                raise ValueError
+        with transaction_context(db):
+            pass
+
+    assert log == [
+        "begin nested", "inner undo", "rollback nested",
+        "begin nested", "release nested",
+        "session commit",
+    ]
+
+
+def test_nested_savepoint_restores_rollback_only(pool, log):
+    with transaction_context():
+        with pytest.raises(ValueError):
+            with transaction_context() as conn:
+                rollback(conn)
+                raise ValueError
+        assert current_unit_of_work().rollback_only is False
+
+    assert log[-1] == "commit"
+
+
+def test_async_nested_scope_rolls_back_to_savepoint(pool, log):
+    async def scenario():
+        async with async_transaction_context() as conn:
+            await commit_async(conn)
+            with pytest.raises(ValueError):
+                async with async_transaction_context() as inner:
+                    assert inner is conn
+                    on_commit(lambda: log.append("inner after commit"))
+                    on_rollback(lambda: log.append("inner undo"))
+                    raise ValueError
+            on_commit(lambda: log.append("outer after commit"))
+        return conn
+
+    conn = asyncio.run(scenario())
+
+    assert log == [
+        "SAVEPOINT uow_sp_1",
+        "inner undo",
+        "ROLLBACK TO SAVEPOINT uow_sp_1",
+        "commit",
+        "outer after commit",
+    ]
+    assert pool["released"] == [conn]
+
+
+# ---------------------------------------------------------------------------
+# on_commit / on_rollback 순서
+# ---------------------------------------------------------------------------
+
+def test_on_commit_runs_in_order_after_commit(pool, log):
+    with transaction_context():
+        on_commit(lambda: log.append("first"))
+        on_rollback(lambda: log.append("undo"))
+        on_commit(lambda: log.append("second"))
+
+    assert log == ["commit", "first", "second"]
+
+
+def test_on_rollback_runs_in_reverse_before_rollback(pool, log):
+    with pytest.raises(ValueError):
+        with transaction_context():
+            on_rollback(lambda: log.append("undo first"))
+            on_rollback(lambda: log.append("undo second"))
+            raise ValueError
+
+    assert log == ["undo second", "undo first", "rollback"]
+
+
+def test_failed_commit_rolls_back_and_skips_commit_callbacks(pool, log):
+    pool["fail_commit"] = True
+    with pytest.raises(RuntimeError, match="commit failed"):
+        with transaction_context():
+            on_commit(lambda: log.append("after commit"))
+            on_rollback(lambda: log.append("undo"))
+
+    assert log == ["undo", "rollback"]
+
+
+def test_callbacks_without_unit_of_work():
+    log = []
+    on_commit(lambda: log.append("now"))
+    on_rollback(lambda: log.append("never"))
+    assert log == ["now"]
+
+
+# ---------------------------------------------------------------------------
+# 요청 단위 미들웨어
+# ---------------------------------------------------------------------------
+
+def _app(status, log, raise_error=False):
+    async def app(scope, receive, send):
+        uow = current_unit_of_work()
+        log.append(f"uow={'yes' if uow else 'no'}")
+        if uow is not None:
+            await uow.get_async_connection()
+            on_commit(lambda: log.append("after commit"))
+        if raise_error:
+            raise RuntimeError("boom")
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        log.append("response started")
+        await send({"type": "http.response.body", "body": b"ok"})
+    return UnitOfWorkMiddleware(app)
+
+
+@pytest.mark.parametrize("status", [200, 201, 302])
+def test_middleware_commits_below_400(pool, log, status):
+    response = TestClient(_app(status, log)).post("/", follow_redirects=False)
+
+    assert response.status_code == status
+    assert log == ["uow=yes", "commit", "after commit", "response started"]
+    assert pool["released"] == pool["acquired"]
+
+
+@pytest.mark.parametrize("status", [400, 404, 500])
+def test_middleware_rolls_back_from_400(pool, log, status):
+    response = TestClient(_app(status, log)).delete("/")
+
+    assert response.status_code == status
+    assert log == ["uow=yes", "rollback", "response started"]
+    assert pool["released"] == pool["acquired"]
+
+
+def test_middleware_returns_500_when_commit_fails(pool, log):
+    pool["fail_commit"] = True
+    response = TestClient(_app(201, log)).put("/")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal server error"}
+    assert "after commit" not in log
+    assert pool["released"] == pool["acquired"]
+
+
+def test_middleware_rolls_back_when_app_raises(pool, log):
+    client = TestClient(_app(200, log, raise_error=True))
+    with pytest.raises(RuntimeError, match="boom"):
+        client.post("/")
+
+    assert log == ["uow=yes", "rollback"]
+    assert pool["released"] == pool["acquired"]
+
+
+def test_middleware_skips_read_requests(pool, log):
+    response = TestClient(_app(200, log)).get("/")
+
+    assert response.status_code == 200
+    assert log == ["uow=no", "response started"]
@@ -0,0 +1,71 @@
+from fastapi import FastAPI, File, UploadFile
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from utils.upload_limit import UploadSizeLimitMiddleware
+
+MAX_UPLOAD_SIZE = 1024
+BOUNDARY = "upload-limit-test"
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+
+    @app.post("/api/files/upload/{post_id}")
+    async def upload(post_id: int, file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    app.add_middleware(UploadSizeLimitMiddleware, max_upload_size=MAX_UPLOAD_SIZE)
+    return TestClient(app)
+
+
+def multipart_chunks(size: int, chunk_size: int = 16 * 1024):
+    """Content-Length 없이 (chunked) 전송할 multipart 본문"""
+    yield (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="big.bin"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    for offset in range(0, size, chunk_size):
+        yield b"x" * min(chunk_size, size - offset)
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def post_chunked(client: TestClient, size: int):
+    return client.post(
+        "/api/files/upload/1",
+        content=multipart_chunks(size),
+        headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+    )
+
+
+def test_rejects_large_content_length():
+    response = make_client().post("/api/files/upload/1", files={"file": ("big.bin", b"x" * 200 * 1024)})
+    assert response.status_code == 413
+
+
+def test_rejects_large_chunked_upload():
+    response = post_chunked(make_client(), 512 * 1024)
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Uploaded file is too large"}
+
+
+def test_accepts_small_chunked_upload():
+    response = post_chunked(make_client(), 100)
+    assert response.status_code == 200
+    assert response.json() == {"size": 100}
+
+
+def test_rejection_carries_cors_headers_when_cors_wraps_it():
+    # main.py와 같은 순서: 크기 제한을 먼저 등록해 CORS가 바깥에서 감쌈
+    client = make_client()
+    client.app.add_middleware(
+        CORSMiddleware, allow_origins=["https://app.example.com"], allow_methods=["*"], allow_headers=["*"]
+    )
+    response = client.post(
+        "/api/files/upload/1",
+        files={"file": ("big.bin", b"x" * 200 * 1024)},
+        headers={"Origin": "https://app.example.com"},
+    )
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "https://app.example.com"
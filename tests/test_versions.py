@@ -0,0 +1,67 @@
+import asyncio
+from datetime import datetime
+
+from starlette.requests import Request
+
+from utils import versions
+from utils.versions import ResourceVersions
+
+
+def _request(headers):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/posts/",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+    }
+    return Request(scope)
+
+
+def _fake_summary(monkeypatch, rows):
+    queries = []
+
+    async def fake_execute_query_async(query, params=None, **kwargs):
+        queries.append((query, params))
+        return [dict(row) for row in rows]
+
+    monkeypatch.setattr(versions, "execute_query_async", fake_execute_query_async)
+    return queries
+
+
+def test_etag_comes_from_database_summary_only(monkeypatch):
+    # 다른 워커(다른 인스턴스)라도 DB 상태가 같으면 같은 ETag
+    changed_at = datetime(2026, 1, 1, 12, 0, 0)
+    _fake_summary(monkeypatch, [
+        {"seq": 1, "row_count": 3, "deleted_count": 0, "changed_at": changed_at, "deleted_at": None},
+        {"seq": 0, "row_count": 10, "deleted_count": 1, "changed_at": changed_at, "deleted_at": changed_at},
+    ])
+    first = asyncio.run(ResourceVersions().validators(("posts", "users"), "page_size=20"))
+    second = asyncio.run(ResourceVersions().validators(("posts", "users"), "page_size=20"))
+
+    assert first.etag == second.etag
+    assert first.etag.startswith('W/"')
+    assert first.last_modified == changed_at.timestamp()
+    assert first.is_not_modified(_request({"If-None-Match": first.etag}))
+
+
+def test_etag_changes_with_rows_and_variant(monkeypatch):
+    rows = [{"seq": 0, "row_count": 10, "deleted_count": 0, "changed_at": None, "deleted_at": None}]
+    _fake_summary(monkeypatch, rows)
+    before = asyncio.run(ResourceVersions().validators(("posts",), ""))
+    other_page = asyncio.run(ResourceVersions().validators(("posts",), "cursor=abc"))
+    rows[0]["deleted_count"] = 1
+    after_delete = asyncio.run(ResourceVersions().validators(("posts",), ""))
+
+    assert before.etag != other_page.etag
+    assert before.etag != after_delete.etag
+    assert not after_delete.is_not_modified(_request({"If-None-Match": before.etag}))
+
+
+def test_per_post_resource_binds_post_id(monkeypatch):
+    queries = _fake_summary(monkeypatch, [])
+    asyncio.run(ResourceVersions().validators(("comments:7", "users"), ""))
+
+    query, binds = queries[0]
+    assert "FROM comments WHERE post_id = :post_id0" in query
+    assert "FROM users" in query
+    assert binds == {"post_id0": 7}
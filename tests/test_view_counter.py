@@ -0,0 +1,41 @@
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import set_committed_value
+
+from models import Post
+from utils.view_counter import ViewCountBuffer
+
+
+def _loaded_post(post_id, view_count):
+    # DB에서 읽어 온 것처럼 변경 이력 없이 값을 채운 ORM 객체
+    post = Post()
+    set_committed_value(post, "id", post_id)
+    set_committed_value(post, "view_count", view_count)
+    return post
+
+
+def test_apply_adds_pending_views_to_dicts():
+    buffer = ViewCountBuffer(flush_interval=60, flush_threshold=1000)
+    buffer.increment(1, 2)
+    posts = [{"id": 1, "view_count": 5}, {"id": 2, "view_count": None}]
+
+    assert buffer.apply(posts) == [{"id": 1, "view_count": 7}, {"id": 2, "view_count": None}]
+
+
+def test_apply_sets_orm_attribute_without_dirtying_it():
+    buffer = ViewCountBuffer(flush_interval=60, flush_threshold=1000)
+    buffer.increment(1, 3)
+    post = _loaded_post(1, 4)
+
+    buffer.apply([post])
+
+    assert post.view_count == 7
+    # 세션 커밋 시 UPDATE로 기록되면 flush 때 증가분이 한 번 더 더해짐
+    assert not inspect(post).attrs.view_count.history.has_changes()
+
+
+def test_apply_leaves_orm_objects_alone_without_pending_views():
+    buffer = ViewCountBuffer(flush_interval=60, flush_threshold=1000)
+    post = _loaded_post(1, 4)
+
+    assert buffer.apply([post]) == [post]
+    assert post.view_count == 4